@@ -4,6 +4,8 @@
 # Comments explain every line
 # ======================================
 
+from text_utils import count_word, dedupe  # Fast helpers for tasks 5 and 6
+
 # --------------------------------------
 # Task 1: Print multiplication table (1 to 10)
 # --------------------------------------
@@ -51,10 +53,7 @@ print("Largest number =", largest)
 print("\nTask 5: Count word frequency")
 sentence = "I love python because python is easy"
 word = "python"
-count = 0
-for w in sentence.split():  # Split sentence into words
-    if w.lower() == word.lower():  # Case insensitive
-        count += 1
+count = count_word(sentence, word)  # Lower-cases the sentence once, then counts
 print("Sentence:", sentence)
 print(f"'{word}' appears {count} times")
 
@@ -63,10 +62,7 @@ print(f"'{word}' appears {count} times")
 # --------------------------------------
 print("\nTask 6: Remove duplicates")
 dup_list = [1, 2, 2, 3, 4, 4, 5]
-unique_list = []
-for item in dup_list:
-    if item not in unique_list:
-        unique_list.append(item)  # Add only if not already in list
+unique_list = dedupe(dup_list)  # Keeps the first of each value, in order (uses a set, not a list)
 print("Original:", dup_list)
 print("Without duplicates:", unique_list)
 
@@ -1,3 +1,18 @@
+import os
+import sys
+
+# Make the shared rate_limiter module (repo root) importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from rate_limiter import LOCKOUT_FILE, LockoutTracker, make_key
+
+CLIENT = "console"  # every attempt from this program comes from the terminal
+
+# Failed attempts are remembered per username in lockouts.db, so
+# restarting the program does not give the user 3 fresh tries
+lockouts = LockoutTracker(max_failures=3, filename=LOCKOUT_FILE)
+
+
 # -------------------------------
 # Custom Exception for invalid login
 # -------------------------------
@@ -10,7 +25,7 @@ def login_system():
     CORRECT_USERNAME = "admin"
     CORRECT_PASSWORD = "12345"
     
-    attempts = 3  # User can try 3 times
+    attempts = 3  # User can try 3 times per session, whatever usernames they try
 
     while attempts > 0:
         try:
@@ -22,6 +37,12 @@ def login_system():
             if username == "" or password == "":
                 raise ValueError("Username or Password cannot be empty!")
 
+            # Refuse immediately if this username is locked out
+            key = make_key(username, CLIENT)
+            if lockouts.is_locked(key):
+                print("❌ Too many failed attempts. Access denied.")
+                break
+
             # Check if username is correct
             if username != CORRECT_USERNAME:
                 raise LoginError("Invalid Username!")
@@ -37,11 +58,12 @@ def login_system():
         except LoginError as le:
             # Handles wrong username or password
             print("Login Error:", le)
-            attempts -= 1
+            attempts = min(attempts - 1, lockouts.record_failure(key))
             print(f"Attempts left: {attempts}")
 
         else:
             # Runs only if NO ERROR
+            lockouts.reset(key)
             print("✅ Login Successful! Welcome!")
             break
 
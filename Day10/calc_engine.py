@@ -0,0 +1,327 @@
+# ----------------------------------------------
+# Expression Engine for the Scientific Calculator
+# ----------------------------------------------
+# Evaluates whole expressions such as
+#     "power(x, 2) + sin(angle) * 3 / 2"
+# using the calculator functions from day10_calculator.py.
+# - An expression is parsed once (Python's ast module), checked against a
+#   whitelist of operators/functions, constant-folded, and compiled to a
+#   plain Python function of its variables
+# - Compiled expressions are kept in an LRU cache keyed by their text
+# - evaluate_many() runs one compiled expression over many variable
+#   bindings, without re-parsing anything
+# - Calculator error strings (e.g. "Error! Cannot divide by zero.") are
+#   raised as ValueError instead of being mixed into the results, and so
+#   are division by zero, overflow and complex (non-real) results, both
+#   while folding constants and while evaluating
+
+import ast
+import math
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+import day10_calculator as calc
+
+CACHE_SIZE = 256  # compiled expressions kept by compile_expression()
+
+
+def _error(e: Exception) -> ValueError:
+    # The calculator-style ValueError for an arithmetic failure
+    if isinstance(e, ZeroDivisionError):
+        return ValueError("Error! Cannot divide by zero.")
+    if isinstance(e, OverflowError):
+        return ValueError("Error! Result is too large.")
+    if isinstance(e, TypeError):  # e.g. a complex number passed to sqrt()
+        return ValueError("Error! Result is not a real number.")
+    return ValueError(f"Error! {e}")
+
+
+def _real(result):
+    if isinstance(result, complex):
+        raise ValueError("Error! Result is not a real number.")
+    return result
+
+
+def _all_real(results: List) -> List:
+    if any(type(result) is complex for result in results):
+        raise ValueError("Error! Result is not a real number.")
+    return results
+
+
+def _checked(function: Callable) -> Callable:
+    # Turn the calculator's "Error! ..." return values into exceptions
+    def wrapper(*args):
+        result = function(*args)
+        if isinstance(result, str):
+            raise ValueError(result)
+        return result
+    wrapper.__name__ = function.__name__
+    return wrapper
+
+
+def divide(a, b):
+    # Same check and message as calc.divide, raised instead of returned
+    if b == 0:
+        raise ValueError("Error! Cannot divide by zero.")
+    return a / b
+
+
+def power(a, b):
+    # Integer powers past float range are computed as floats, so 10 ** 10000
+    # is an overflow error instead of a 10,000-digit number (or a long wait)
+    if (isinstance(a, int) and isinstance(b, int) and b > 0 and abs(a) > 1
+            and b * math.log2(abs(a)) > 1024):
+        a = float(a)
+    return a ** b
+
+
+# Names an expression may call (both the calculator names and short forms)
+FUNCTIONS: Dict[str, Callable] = {
+    "add": calc.add,
+    "subtract": calc.subtract,
+    "multiply": calc.multiply,
+    "divide": divide,
+    "power": power,
+    "square_root": _checked(calc.square_root),
+    "sqrt": _checked(calc.square_root),
+    "percentage": _checked(calc.percentage),
+    "sine": calc.sine,
+    "sin": calc.sine,
+    "cosine": calc.cosine,
+    "cos": calc.cosine,
+    "tangent": _checked(calc.tangent),
+    "tan": _checked(calc.tangent),
+}
+ONE_ARGUMENT = {"square_root", "sqrt", "sine", "sin", "cosine", "cos", "tangent", "tan"}
+CONSTANTS: Dict[str, float] = {"pi": math.pi, "e": math.e}
+
+_OPERATORS = {
+    ast.Add: calc.add,
+    ast.Sub: calc.subtract,
+    ast.Mult: calc.multiply,
+    ast.Div: FUNCTIONS["divide"],
+    ast.Pow: power,
+}
+_UNARY = (ast.UAdd, ast.USub)
+_NATIVE_CALLS = {"add": ast.Add, "subtract": ast.Sub, "multiply": ast.Mult, "power": ast.Pow}
+
+
+class ExpressionError(ValueError):
+    """Raised for expressions the engine does not accept."""
+
+
+# ----------------------------------------------
+# Parsing + validation
+# ----------------------------------------------
+def _validate(node: ast.AST) -> None:
+    if isinstance(node, ast.Expression):
+        _validate(node.body)
+    elif isinstance(node, ast.BinOp):
+        if type(node.op) not in _OPERATORS:
+            raise ExpressionError(f"Operator not allowed: {type(node.op).__name__}")
+        _validate(node.left)
+        _validate(node.right)
+    elif isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, _UNARY):
+            raise ExpressionError(f"Operator not allowed: {type(node.op).__name__}")
+        _validate(node.operand)
+    elif isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ExpressionError(f"Only numbers are allowed, not {node.value!r}")
+    elif isinstance(node, ast.Name):
+        if node.id.startswith("_"):
+            raise ExpressionError(f"Variable names cannot start with '_': {node.id}")
+        if node.id in FUNCTIONS:
+            raise ExpressionError(f"{node.id} is a function; call it like {node.id}(...)")
+    elif isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            raise ExpressionError(f"Unknown function: {ast.unparse(node.func)}")
+        if node.keywords:
+            raise ExpressionError("Keyword arguments are not allowed")
+        expected = 1 if node.func.id in ONE_ARGUMENT else 2
+        if len(node.args) != expected:
+            raise ExpressionError(f"{node.func.id}() takes {expected} argument(s)")
+        for arg in node.args:
+            _validate(arg)
+    else:
+        raise ExpressionError(f"Not allowed in an expression: {ast.unparse(node)}")
+
+
+class _Simplify(ast.NodeTransformer):
+    """
+    Replaces constants by their values, folds every sub-expression whose
+    inputs are all known numbers (integer powers are folded with the
+    size-checked power()), and routes "/" through the calculator's
+    zero-checked divide(). +, -, * and ** stay native Python operators
+    (they behave exactly like add/subtract/multiply/power and are faster).
+    """
+    @staticmethod
+    def _number(node: ast.AST) -> bool:
+        return isinstance(node, ast.Constant)
+
+    def _fold(self, node: ast.AST, function: Callable, args: List[ast.AST]) -> ast.AST:
+        if all(self._number(arg) for arg in args):
+            try:
+                value = _real(function(*(a.value for a in args)))
+                return ast.copy_location(ast.Constant(value), node)
+            except (ValueError, ArithmeticError, TypeError):
+                pass  # leave it in: the error is reported when evaluated
+        return ast.copy_location(
+            ast.Call(ast.Name(f"_f_{function.__name__}", ast.Load()), args, []), node)
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id in CONSTANTS:
+            return ast.copy_location(ast.Constant(CONSTANTS[node.id]), node)
+        return node
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if self._number(node.operand):
+            value = node.operand.value
+            return ast.copy_location(ast.Constant(-value if isinstance(node.op, ast.USub) else value), node)
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        args = [node.left, node.right]
+        folded = self._fold(node, _OPERATORS[type(node.op)], args)
+        if isinstance(folded, ast.Constant) or isinstance(node.op, ast.Div):
+            return folded
+        if all(self._number(arg) for arg in args):
+            return folded  # folding failed (e.g. 10 ** 10000): keep the checked call
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        folded = self._fold(node, FUNCTIONS[node.func.id], node.args)
+        operator = _NATIVE_CALLS.get(node.func.id)
+        if (operator is None or isinstance(folded, ast.Constant) or len(node.args) != 2
+                or all(self._number(arg) for arg in node.args)):
+            return folded
+        # add(a, b) -> a + b and so on: same result, no function call
+        return ast.copy_location(ast.BinOp(node.args[0], operator(), node.args[1]), node)
+
+
+class CompiledExpression:
+    """
+    An expression compiled to a Python function of its variables
+    (in alphabetical order).
+    """
+    def __init__(self, text: str):
+        self.text = text
+        try:
+            tree = ast.parse(text.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ExpressionError(f"Invalid expression: {e.msg}") from None
+        _validate(tree)
+
+        self.variables: Tuple[str, ...] = tuple(sorted(
+            {node.id for node in ast.walk(tree)
+             if isinstance(node, ast.Name) and node.id not in CONSTANTS
+             and node.id not in FUNCTIONS}))
+        body = _Simplify().visit(tree).body
+        self.folded = ast.unparse(body)
+
+        # lambda <variables>: <simplified body>, compiled once
+        arguments = ast.arguments(posonlyargs=[], args=[ast.arg(name) for name in self.variables],
+                                  kwonlyargs=[], kw_defaults=[], defaults=[])
+        module = ast.fix_missing_locations(ast.Expression(ast.Lambda(arguments, body)))
+        namespace = {"__builtins__": {}}
+        namespace.update({f"_f_{f.__name__}": f for f in list(FUNCTIONS.values()) + list(_OPERATORS.values())})
+        self.function = eval(compile(module, "<expression>", "eval"), namespace)
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.text!r})"
+
+    def evaluate(self, **bindings: float) -> float:
+        try:
+            return _real(self.function(*(bindings[name] for name in self.variables)))
+        except KeyError as e:
+            raise ExpressionError(f"No value given for variable {e.args[0]}") from None
+        except (ArithmeticError, TypeError) as e:
+            raise _error(e) from None
+
+    def evaluate_many(self, bindings: Iterable[Dict[str, float]]) -> List[float]:
+        """
+        Evaluate for every dict of variable values.
+        """
+        names = self.variables
+        function = self.function
+        try:
+            results = [function(*[binding[name] for name in names]) for binding in bindings]
+        except KeyError as e:
+            raise ExpressionError(f"No value given for variable {e.args[0]}") from None
+        except (ArithmeticError, TypeError) as e:
+            raise _error(e) from None
+        return _all_real(results)
+
+    def evaluate_columns(self, **columns: Sequence[float]) -> List[float]:
+        """
+        Evaluate over parallel sequences, one per variable:
+        evaluate_columns(x=[1, 2, 3], y=[4, 5, 6]).
+        """
+        try:
+            values = [columns[name] for name in self.variables]
+        except KeyError as e:
+            raise ExpressionError(f"No values given for variable {e.args[0]}") from None
+        if len({len(column) for column in values}) > 1:  # map() would stop at the shortest
+            raise ExpressionError("All columns must have the same length")
+        try:
+            results = list(map(self.function, *values))
+        except (ArithmeticError, TypeError) as e:
+            raise _error(e) from None
+        return _all_real(results)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(text: str) -> CompiledExpression:
+    """
+    Parse and compile text, reusing the result for repeated expressions.
+    """
+    return CompiledExpression(text)
+
+
+def evaluate(text: str, **bindings: float) -> float:
+    return compile_expression(text).evaluate(**bindings)
+
+
+# ----------------------------------------------
+# Benchmark: evaluations per second
+# ----------------------------------------------
+def benchmark(count: int = 1_000_000) -> None:
+    import random
+    import time
+
+    xs = [random.uniform(-10, 10) for _ in range(count)]
+    ys = [random.uniform(0, 360) for _ in range(count)]
+    text = "power(x, 2) + sin(y) * 3 / 2 + power(2, 10)"
+
+    def report(label: str, elapsed: float) -> None:
+        print(f"{label:<34} {count / elapsed:>12,.0f} evaluations/s")
+
+    start = time.perf_counter()
+    for x, y in zip(xs, ys):
+        calc.add(calc.add(calc.power(x, 2),
+                          calc.divide(calc.multiply(calc.sine(y), 3), 2)),
+                 calc.power(2, 10))
+    report("calling calculator functions", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for x, y in zip(xs[:count // 10], ys):
+        eval(text, {"power": calc.power, "sin": calc.sine}, {"x": x, "y": y})
+    report("eval() of the text each time", (time.perf_counter() - start) * 10)
+
+    expression = compile_expression(text)
+    bindings = [{"x": x, "y": y} for x, y in zip(xs, ys)]
+    start = time.perf_counter()
+    expression.evaluate_many(bindings)
+    report("compiled, evaluate_many(dicts)", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    expression.evaluate_columns(x=xs, y=ys)
+    report("compiled, evaluate_columns", time.perf_counter() - start)
+    print("Folded form:", expression.folded)
+
+
+if __name__ == "__main__":
+    benchmark()
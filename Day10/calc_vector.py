@@ -0,0 +1,231 @@
+# ----------------------------------------------
+# Array Mode for the Scientific Calculator
+# ----------------------------------------------
+# Same operations as day10_calculator.py, but each one takes whole
+# sequences (lists, tuples, NumPy arrays) or plain numbers and returns
+#     Result(values, errors)
+# - values: the answers (NaN where the operation is undefined)
+# - errors: True where the calculator would have returned an
+#   "Error! ..." string, e.g. dividing by zero, and wherever the answer is
+#   NaN (a NaN input, or sin/cos/tan of ±inf)
+# Scalars are broadcast against sequences: divide(data, 2). Plain numbers
+# in give a plain float and bool out.
+# With NumPy installed every call is one vectorized pass over the data;
+# without it, a plain-Python loop gives the same values and errors as lists.
+
+import math
+from typing import Any, NamedTuple, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+Numbers = Union[float, Sequence[float], Any]  # Any: numpy.ndarray
+
+
+class Result(NamedTuple):
+    values: Any   # list of floats, or numpy.ndarray
+    errors: Any   # list of bools, or numpy bool array
+
+
+NAN = float("nan")
+
+
+# ----------------------------------------------
+# Pure-Python helpers
+# ----------------------------------------------
+def _is_scalar(x) -> bool:
+    return isinstance(x, (int, float))
+
+
+def _columns(*args) -> Tuple[Sequence[float], ...]:
+    # Broadcast scalars to the length of the sequences
+    lengths = {len(a) for a in args if not _is_scalar(a)}
+    if len(lengths) > 1:
+        raise ValueError("All sequences must have the same length")
+    n = lengths.pop() if lengths else 1
+    return tuple([a] * n if _is_scalar(a) else a for a in args)
+
+
+def _python(function, *args) -> Result:
+    # function returns NAN for undefined inputs; NaN is the only value
+    # that is not equal to itself, which is how errors are found
+    values = list(map(function, *_columns(*args)))
+    errors = [value != value for value in values]
+    if all(_is_scalar(a) for a in args):
+        return Result(values[0], errors[0])
+    return Result(values, errors)
+
+
+def _py_divide(a, b):
+    return a / b if b != 0 else NAN
+
+
+def _py_power(a, b):
+    try:
+        value = a ** b
+        return NAN if isinstance(value, complex) else float(value)
+    except (ZeroDivisionError, OverflowError):
+        return NAN
+
+
+def _py_square_root(a):
+    return math.sqrt(a) if a >= 0 else NAN
+
+
+def _py_percentage(a, b):
+    return (a / b) * 100 if b != 0 else NAN
+
+
+def _py_sine(deg):
+    return math.sin(math.radians(deg)) if math.isfinite(deg) else NAN
+
+
+def _py_cosine(deg):
+    return math.cos(math.radians(deg)) if math.isfinite(deg) else NAN
+
+
+def _py_tangent(deg):
+    return math.tan(math.radians(deg)) if math.isfinite(deg) and deg % 180 != 90 else NAN
+
+
+# ----------------------------------------------
+# NumPy versions
+# ----------------------------------------------
+def _arrays(*args):
+    return np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in args))
+
+
+def _masked(values, errors) -> Result:
+    # Same rule as the pure-Python loop: every NaN answer is an error
+    errors = errors | np.isnan(values)
+    values = np.where(errors, np.nan, values)
+    return Result(values, errors)
+
+
+def _np_divide(a, b) -> Result:
+    a, b = _arrays(a, b)
+    errors = b == 0
+    with np.errstate(all="ignore"):
+        return _masked(a / b, errors)
+
+
+def _np_power(a, b) -> Result:
+    a, b = _arrays(a, b)
+    with np.errstate(all="ignore"):
+        values = np.power(a, b)
+    errors = ((a < 0) & (b != np.floor(b))) | ((a == 0) & (b < 0)) \
+        | (np.isinf(values) & np.isfinite(a) & np.isfinite(b))
+    return _masked(values, errors)
+
+
+def _np_square_root(a) -> Result:
+    (a,) = _arrays(a)
+    errors = a < 0
+    with np.errstate(invalid="ignore"):
+        return _masked(np.sqrt(a), errors)
+
+
+def _np_percentage(a, b) -> Result:
+    a, b = _arrays(a, b)
+    errors = b == 0
+    with np.errstate(all="ignore"):
+        return _masked(a / b * 100, errors)
+
+
+def _np_sine(deg) -> Result:
+    (deg,) = _arrays(deg)
+    with np.errstate(invalid="ignore"):
+        return _masked(np.sin(np.radians(deg)), np.zeros(deg.shape, dtype=bool))
+
+
+def _np_cosine(deg) -> Result:
+    (deg,) = _arrays(deg)
+    with np.errstate(invalid="ignore"):
+        return _masked(np.cos(np.radians(deg)), np.zeros(deg.shape, dtype=bool))
+
+
+def _np_tangent(deg) -> Result:
+    (deg,) = _arrays(deg)
+    with np.errstate(invalid="ignore"):
+        errors = np.mod(deg, 180) == 90
+        return _masked(np.tan(np.radians(deg)), errors)
+
+
+# ----------------------------------------------
+# Public functions
+# ----------------------------------------------
+def _run(np_function, py_function, *args) -> Result:
+    if np is None:
+        return _python(py_function, *args)
+    result = np_function(*args)
+    if all(_is_scalar(a) for a in args):
+        # Plain numbers in, plain numbers out (not 0-d arrays)
+        return Result(float(result.values), bool(result.errors))
+    return result
+
+
+def divide(a: Numbers, b: Numbers) -> Result:
+    return _run(_np_divide, _py_divide, a, b)
+
+
+def power(a: Numbers, b: Numbers) -> Result:
+    # Undefined: 0 to a negative power, negative base to a fractional power, overflow
+    return _run(_np_power, _py_power, a, b)
+
+
+def square_root(a: Numbers) -> Result:
+    return _run(_np_square_root, _py_square_root, a)
+
+
+def percentage(a: Numbers, b: Numbers) -> Result:
+    return _run(_np_percentage, _py_percentage, a, b)
+
+
+def sine(deg: Numbers) -> Result:
+    return _run(_np_sine, _py_sine, deg)
+
+
+def cosine(deg: Numbers) -> Result:
+    return _run(_np_cosine, _py_cosine, deg)
+
+
+def tangent(deg: Numbers) -> Result:
+    return _run(_np_tangent, _py_tangent, deg)
+
+
+# ----------------------------------------------
+# Benchmark: element-by-element vs array mode
+# ----------------------------------------------
+def benchmark(count: int = 1_000_000) -> None:
+    import random
+    import time
+
+    import day10_calculator as calc
+
+    a = [random.uniform(-100, 100) for _ in range(count)]
+    b = [random.choice([0.0, random.uniform(-10, 10)]) for _ in range(count)]
+    inputs = (np.array(a), np.array(b)) if np is not None else (a, b)
+    print(f"{count:,} values, array mode uses {'NumPy' if np is not None else 'pure Python'}")
+
+    for name, scalar, vector, args in [
+        ("divide", calc.divide, divide, 2),
+        ("square_root", calc.square_root, square_root, 1),
+        ("tangent", calc.tangent, tangent, 1),
+    ]:
+        start = time.perf_counter()
+        if args == 2:
+            [scalar(x, y) for x, y in zip(a, b)]
+        else:
+            [scalar(x) for x in a]
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vector(*inputs[:args])
+        array_mode = time.perf_counter() - start
+        print(f"{name:<12} loop {count / loop:>13,.0f}/s   array {count / array_mode:>13,.0f}/s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,250 @@
+# ----------------------------------------------
+# Streaming Temperature Conversion for whole files
+# ----------------------------------------------
+# Usage:
+#   python convert_stream.py readings.bin out.bin celsius_to_kelvin
+#   python convert_stream.py sensor.csv out.csv fahrenheit_to_celsius --column 1 --header
+#   python convert_stream.py readings.bin out.bin celsius:rankine
+#   python convert_stream.py --benchmark 200
+# - Applies a conversion to every reading in a file: one of the six
+#   day10_converter.py names, or any "from:to" pair of units known to
+#   unit_registry.py (compiled to a single a * x + b)
+# - Input is either binary (raw float64 values in native byte order, as
+#   written by numpy.ndarray.tofile) or CSV text (one value per line, or
+#   several columns with --column picking the one to convert)
+# - The file is read and written in chunks of --chunk-mb, so memory use
+#   stays the same however big the file is
+# - Each chunk is converted in one vectorized call when NumPy is
+#   installed, otherwise with a plain loop
+
+import argparse
+import os
+import sys
+import time
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from unit_registry import TEMPERATURE, Affine
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+CHUNK_MB = 8  # default chunk size
+FORMATS = ("binary", "csv")
+
+# The six day10_converter.py conversions, as (from, to) units
+CONVERSIONS: Dict[str, Tuple[str, str]] = {
+    "celsius_to_fahrenheit": ("celsius", "fahrenheit"),
+    "fahrenheit_to_celsius": ("fahrenheit", "celsius"),
+    "celsius_to_kelvin": ("celsius", "kelvin"),
+    "kelvin_to_celsius": ("kelvin", "celsius"),
+    "fahrenheit_to_kelvin": ("fahrenheit", "kelvin"),
+    "kelvin_to_fahrenheit": ("kelvin", "fahrenheit"),
+}
+
+
+class Stats(NamedTuple):
+    values: int       # readings converted
+    bytes_read: int
+    seconds: float
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes_read / 1024 / 1024 / self.seconds if self.seconds else 0.0
+
+
+def resolve_conversion(conversion: str) -> Affine:
+    """
+    "celsius_to_kelvin" style names, or "from:to" units such as "C:rankine".
+    """
+    if conversion in CONVERSIONS:
+        return TEMPERATURE.transform(*CONVERSIONS[conversion])
+    source, colon, target = conversion.partition(":")
+    if not colon:
+        raise ValueError(f"Unknown conversion {conversion!r}; use one of "
+                         f"{', '.join(CONVERSIONS)} or from:to units ({', '.join(TEMPERATURE.units())})")
+    return TEMPERATURE.transform(source.strip(), target.strip())
+
+
+def _convert_values(transform: Affine, values: List[float]) -> List[float]:
+    if np is not None:
+        return transform.many(np.array(values, dtype=np.float64)).tolist()
+    return transform.many(values)
+
+
+def guess_format(file_name: str) -> str:
+    return "csv" if file_name.lower().endswith((".csv", ".txt")) else "binary"
+
+
+# ----------------------------------------------
+# Binary float64 files
+# ----------------------------------------------
+def _convert_binary(source, target, transform: Affine, chunk_size: int) -> int:
+    chunk_size = max(8, chunk_size - chunk_size % 8)  # whole values only
+    count = 0
+    while True:
+        data = source.read(chunk_size)
+        if not data:
+            return count
+        if len(data) % 8:
+            raise ValueError("Binary file size is not a multiple of 8 bytes (float64)")
+        if np is not None:
+            values = transform.many(np.frombuffer(data, dtype=np.float64))
+            target.write(values.tobytes())
+            count += len(values)
+        else:
+            values = array("d")
+            values.frombytes(data)
+            target.write(array("d", transform.many(values)).tobytes())
+            count += len(values)
+
+
+# ----------------------------------------------
+# CSV text files
+# ----------------------------------------------
+def _convert_csv(source, target, transform: Affine, chunk_size: int,
+                 column: int, header: bool) -> int:
+    count = 0
+    line_number = 0
+    if header:
+        target.write(source.readline())
+        line_number += 1
+    while True:
+        lines = source.readlines(chunk_size)  # whole lines, about chunk_size bytes
+        if not lines:
+            return count
+        text = "".join(lines)
+
+        # Fast path: a single column, exactly one number on every line
+        # (as many fields as lines, and no blank line to make up for a
+        # line holding two)
+        if column == 0 and "," not in text:
+            fields = text.split()
+            if len(fields) == len(lines) and not any(map(str.isspace, lines)):
+                try:
+                    values = [float(field) for field in fields]
+                except ValueError:
+                    pass  # fall through to the line-by-line path for the message
+                else:
+                    converted = _convert_values(transform, values)
+                    target.write("\n".join(map(repr, converted)) + "\n")
+                    count += len(converted)
+                    line_number += len(lines)
+                    continue
+
+        rows = []
+        values = []
+        for line in lines:
+            line_number += 1
+            parts = line.rstrip("\r\n").split(",")
+            if parts == [""]:
+                rows.append(None)  # keep blank lines
+                continue
+            try:
+                values.append(float(parts[column]))
+            except (ValueError, IndexError):
+                raise ValueError(f"Line {line_number}: no number in column {column}: {line.strip()!r}") from None
+            rows.append(parts)
+        converted = iter(_convert_values(transform, values))
+        out = []
+        for parts in rows:
+            if parts is None:
+                out.append("\n")
+            else:
+                parts[column] = repr(next(converted))
+                out.append(",".join(parts) + "\n")
+        target.write("".join(out))
+        count += len(values)
+
+
+def convert_file(source_name: str, target_name: str, conversion: str,
+                 file_format: Optional[str] = None, chunk_size: int = CHUNK_MB * 1024 * 1024,
+                 column: int = 0, header: bool = False) -> Stats:
+    """
+    Convert every reading in source_name and write them to target_name.
+    conversion is a day10_converter.py name or "from:to" units.
+    file_format is "binary" or "csv" (guessed from the extension if None).
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+    transform = resolve_conversion(conversion)
+    file_format = file_format or guess_format(source_name)
+    if file_format not in FORMATS:
+        raise ValueError(f"file_format must be one of {FORMATS}, not {file_format!r}")
+    if os.path.exists(target_name) and os.path.samefile(source_name, target_name):
+        raise ValueError("Output file must be different from the input file")
+
+    start = time.perf_counter()
+    if file_format == "binary":
+        with open(source_name, "rb") as source, open(target_name, "wb") as target:
+            count = _convert_binary(source, target, transform, chunk_size)
+    else:
+        with open(source_name, "r", encoding="utf-8") as source, \
+                open(target_name, "w", encoding="utf-8") as target:
+            count = _convert_csv(source, target, transform, chunk_size, column, header)
+    return Stats(count, os.path.getsize(source_name), time.perf_counter() - start)
+
+
+# ----------------------------------------------
+# Benchmark: MB/s for both formats
+# ----------------------------------------------
+def benchmark(size_mb: int = 100) -> None:
+    import random
+
+    count = size_mb * 1024 * 1024 // 8
+    print(f"{count:,} readings, {'NumPy' if np is not None else 'pure Python'} conversion")
+    block = array("d", (random.uniform(-50, 50) for _ in range(100_000)))
+    with open("bench_readings.bin", "wb") as f:
+        for i in range(0, count, len(block)):
+            f.write(block[:count - i].tobytes())
+    with open("bench_readings.csv", "w") as f:
+        lines = "".join(f"{value:.2f}\n" for value in block)
+        for _ in range(0, count // 10, len(block)):  # a tenth as many text readings
+            f.write(lines)
+
+    for source, target in (("bench_readings.bin", "bench_out.bin"),
+                           ("bench_readings.csv", "bench_out.csv")):
+        stats = convert_file(source, target, "celsius_to_fahrenheit")
+        print(f"{guess_format(source):<7} {stats.values:>13,} values  "
+              f"{stats.mb_per_s:>8.1f} MB/s  ({stats.seconds:.2f} s)")
+        os.remove(source)
+        os.remove(target)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Convert every temperature in a file.")
+    parser.add_argument("source", nargs="?", help="input file (.csv/.txt or raw float64)")
+    parser.add_argument("target", nargs="?", help="output file (same format as the input)")
+    parser.add_argument("conversion", nargs="?",
+                        help=f"{' / '.join(CONVERSIONS)}, or from:to units, e.g. celsius:rankine")
+    parser.add_argument("--format", choices=FORMATS, help="input format (default: from the extension)")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_MB, help="size of one chunk")
+    parser.add_argument("--column", type=int, default=0, help="CSV column to convert (0-based)")
+    parser.add_argument("--header", action="store_true", help="copy the first CSV line unchanged")
+    parser.add_argument("--benchmark", type=int, metavar="MB", help="time a generated file of MB")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if not (args.source and args.target and args.conversion):
+        parser.error("give an input file, an output file and a conversion")
+    if args.chunk_mb <= 0:
+        parser.error("--chunk-mb must be at least 1")
+
+    try:
+        stats = convert_file(args.source, args.target, args.conversion, args.format,
+                             args.chunk_mb * 1024 * 1024, args.column, args.header)
+    except FileNotFoundError as e:
+        print("⚠️ File not found:", e.filename)
+        sys.exit(1)
+    except ValueError as e:
+        print("⚠️", e)
+        sys.exit(1)
+    print(f"✅ Converted {stats.values:,} readings in {stats.seconds:.2f} s ({stats.mb_per_s:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,11 +12,14 @@
 # 8. Sine (degrees)
 # 9. Cosine (degrees)
 # 10. Tangent (degrees)
-# 11. Exit
+# 11. Evaluate an expression (e.g. power(2, 3) + sin(30))
+# 12. Exit
 # ----------------------------------------------
 
 import math  # Import math module for scientific operations
 
+import trig_table  # Precomputed sine table (0.1° steps) for table=True
+
 # 1️⃣ ADDITION
 def add(a, b):
     return a + b  # Return the sum of a and b
@@ -52,97 +55,123 @@ def percentage(a, b):
     return (a / b) * 100  # Return a as percentage of b
 
 # 8️⃣ SINE FUNCTION (degrees)
-def sine(deg):
+# table=True reads from trig_table instead (exact at whole/tenth degrees,
+# interpolated within 3.8e-7 elsewhere)
+def sine(deg, table=False):
+    if table:
+        return trig_table.sine(deg)
     rad = math.radians(deg)  # Convert degrees to radians
     return math.sin(rad)  # Return sine
 
 # 9️⃣ COSINE FUNCTION (degrees)
-def cosine(deg):
+def cosine(deg, table=False):
+    if table:
+        return trig_table.cosine(deg)
     rad = math.radians(deg)  # Convert degrees to radians
     return math.cos(rad)  # Return cosine
 
 # 🔟 TANGENT FUNCTION (degrees)
-def tangent(deg):
+def tangent(deg, table=False):
     if deg % 180 == 90:  # Tan undefined at 90, 270, etc.
         return "Error! Tangent undefined at this angle."
+    if table:
+        return trig_table.sine(deg) / trig_table.cosine(deg)
     rad = math.radians(deg)  # Convert degrees to radians
     return math.tan(rad)  # Return tangent
 
 # ----------------------------------------------
 # MAIN PROGRAM LOOP
 # ----------------------------------------------
-while True:  # Infinite loop for menu until user exits
-    print("\n===== SCIENTIFIC CALCULATOR =====")
-    print("1. Add")
-    print("2. Subtract")
-    print("3. Multiply")
-    print("4. Divide")
-    print("5. Power (a^b)")
-    print("6. Square Root")
-    print("7. Percentage (a% of b)")
-    print("8. Sine (degrees)")
-    print("9. Cosine (degrees)")
-    print("10. Tangent (degrees)")
-    print("11. Exit")
-
-    choice = input("Select an operation (1-11): ")  # Get user choice
-
-    # ------------------------------------------
-    # EXIT CONDITION
-    if choice == '11':
-        print("Exiting calculator. Goodbye!")
-        break  # Stop the loop and exit program
-
-    # ------------------------------------------
-    # ADDITION, SUBTRACTION, MULTIPLICATION, DIVISION, POWER, PERCENTAGE
-    if choice in ['1','2','3','4','5','7','7']:
-        try:
-            num1 = float(input("Enter first number: "))  # First number
-            num2 = float(input("Enter second number: "))  # Second number
-        except ValueError:  # Handle invalid input
-            print("Error! Please enter a valid number.")
-            continue  # Go back to menu
-
-        if choice == '1':
-            print("Result:", add(num1, num2))
-        elif choice == '2':
-            print("Result:", subtract(num1, num2))
-        elif choice == '3':
-            print("Result:", multiply(num1, num2))
-        elif choice == '4':
-            print("Result:", divide(num1, num2))
-        elif choice == '5':
-            print("Result:", power(num1, num2))
-        elif choice == '7':
-            print(f"{num1} is {percentage(num1, num2)}% of {num2}")
-
-    # ------------------------------------------
-    # SQUARE ROOT
-    elif choice == '6':
-        try:
-            num = float(input("Enter number: "))
-        except ValueError:
-            print("Error! Please enter a valid number.")
-            continue
-        print("Result:", square_root(num))
-
-    # ------------------------------------------
-    # SINE, COSINE, TANGENT
-    elif choice in ['8','9','10']:
-        try:
-            angle = float(input("Enter angle in degrees: "))
-        except ValueError:
-            print("Error! Please enter a valid number.")
-            continue
-
-        if choice == '8':
-            print("sin(", angle, ") =", sine(angle))
-        elif choice == '9':
-            print("cos(", angle, ") =", cosine(angle))
-        elif choice == '10':
-            print("tan(", angle, ") =", tangent(angle))
-
-    # ------------------------------------------
-    # INVALID CHOICE
-    else:
-        print("Invalid choice! Please select a number between 1 and 11.")
+def main():
+    while True:  # Infinite loop for menu until user exits
+        print("\n===== SCIENTIFIC CALCULATOR =====")
+        print("1. Add")
+        print("2. Subtract")
+        print("3. Multiply")
+        print("4. Divide")
+        print("5. Power (a^b)")
+        print("6. Square Root")
+        print("7. Percentage (a% of b)")
+        print("8. Sine (degrees)")
+        print("9. Cosine (degrees)")
+        print("10. Tangent (degrees)")
+        print("11. Evaluate expression")
+        print("12. Exit")
+
+        choice = input("Select an operation (1-12): ")  # Get user choice
+
+        # ------------------------------------------
+        # EXIT CONDITION
+        if choice == '12':
+            print("Exiting calculator. Goodbye!")
+            break  # Stop the loop and exit program
+
+        # ------------------------------------------
+        # ADDITION, SUBTRACTION, MULTIPLICATION, DIVISION, POWER, PERCENTAGE
+        if choice in ['1','2','3','4','5','7','7']:
+            try:
+                num1 = float(input("Enter first number: "))  # First number
+                num2 = float(input("Enter second number: "))  # Second number
+            except ValueError:  # Handle invalid input
+                print("Error! Please enter a valid number.")
+                continue  # Go back to menu
+
+            if choice == '1':
+                print("Result:", add(num1, num2))
+            elif choice == '2':
+                print("Result:", subtract(num1, num2))
+            elif choice == '3':
+                print("Result:", multiply(num1, num2))
+            elif choice == '4':
+                print("Result:", divide(num1, num2))
+            elif choice == '5':
+                print("Result:", power(num1, num2))
+            elif choice == '7':
+                print(f"{num1} is {percentage(num1, num2)}% of {num2}")
+
+        # ------------------------------------------
+        # SQUARE ROOT
+        elif choice == '6':
+            try:
+                num = float(input("Enter number: "))
+            except ValueError:
+                print("Error! Please enter a valid number.")
+                continue
+            print("Result:", square_root(num))
+
+        # ------------------------------------------
+        # SINE, COSINE, TANGENT
+        elif choice in ['8','9','10']:
+            try:
+                angle = float(input("Enter angle in degrees: "))
+            except ValueError:
+                print("Error! Please enter a valid number.")
+                continue
+
+            if choice == '8':
+                print("sin(", angle, ") =", sine(angle))
+            elif choice == '9':
+                print("cos(", angle, ") =", cosine(angle))
+            elif choice == '10':
+                print("tan(", angle, ") =", tangent(angle))
+
+        # ------------------------------------------
+        # EXPRESSION (parsed once, then cached by the expression engine)
+        elif choice == '11':
+            from calc_engine import evaluate  # imported here to avoid a circular import
+            text = input("Enter expression (numbers, + - * / **, functions like sqrt(16)): ")
+            try:
+                print("Result:", evaluate(text))
+            except ValueError as e:  # invalid expression or calculator error
+                print(e)
+
+        # ------------------------------------------
+        # INVALID CHOICE
+        else:
+            print("Invalid choice! Please select a number between 1 and 12.")
+
+
+# Run the menu only when this file is executed directly, so the
+# functions above can be imported by other modules
+if __name__ == "__main__":
+    main()
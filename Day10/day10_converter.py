@@ -9,6 +9,8 @@
 # - Input validation (try/except)
 # - Clear output with units
 # - Infinite loop until user exits
+# For whole files of readings, see convert_stream.py; for other units
+# (e.g. Rankine), see unit_registry.py
 
 # -----------------------------
 # 1️⃣ Define Conversion Functions
@@ -42,61 +44,66 @@ def kelvin_to_fahrenheit(k):
 # --------------------------------------
 # 2️⃣ MAIN PROGRAM (Menu + Loop + Logic)
 # --------------------------------------
-while True:
-    # Show menu to the user
-    print("\n=== Temperature Converter ===")
-    print("1. Celsius to Fahrenheit")
-    print("2. Fahrenheit to Celsius")
-    print("3. Celsius to Kelvin")
-    print("4. Kelvin to Celsius")
-    print("5. Fahrenheit to Kelvin")
-    print("6. Kelvin to Fahrenheit")
-    print("7. Exit")
-
-    # Ask user to choose an option
-    choice = input("Select an option (1-7): ")
-
-    # If user chooses 7, exit the loop (end program)
-    if choice == '7':
-        print("Exiting... Goodbye!")
-        break
-
-    # If user enters a valid option (1-6)
-    if choice in ['1', '2', '3', '4', '5', '6']:
-        # Use try/except to validate the temperature input
-        try:
-            # Ask user to input a temperature value
-            temp = float(input("Enter the temperature value: "))
-        except ValueError:
-            # If user enters something invalid (e.g. 'abc')
-            print("Invalid input! Please enter a numeric value.")
-            continue  # Go back to menu
-
-        # Perform the correct conversion based on choice
-        if choice == '1':
-            result = celsius_to_fahrenheit(temp)
-            print(f"{temp}°C = {result}°F")
-
-        elif choice == '2':
-            result = fahrenheit_to_celsius(temp)
-            print(f"{temp}°F = {result}°C")
-
-        elif choice == '3':
-            result = celsius_to_kelvin(temp)
-            print(f"{temp}°C = {result}K")
-
-        elif choice == '4':
-            result = kelvin_to_celsius(temp)
-            print(f"{temp}K = {result}°C")
-
-        elif choice == '5':
-            result = fahrenheit_to_kelvin(temp)
-            print(f"{temp}°F = {result}K")
-
-        elif choice == '6':
-            result = kelvin_to_fahrenheit(temp)
-            print(f"{temp}K = {result}°F")
-
-    else:
-        # If user enters something outside 1-7
-        print("Invalid option! Please choose between 1 and 7.")
+def main():
+    while True:
+        # Show menu to the user
+        print("\n=== Temperature Converter ===")
+        print("1. Celsius to Fahrenheit")
+        print("2. Fahrenheit to Celsius")
+        print("3. Celsius to Kelvin")
+        print("4. Kelvin to Celsius")
+        print("5. Fahrenheit to Kelvin")
+        print("6. Kelvin to Fahrenheit")
+        print("7. Exit")
+
+        # Ask user to choose an option
+        choice = input("Select an option (1-7): ")
+
+        # If user chooses 7, exit the loop (end program)
+        if choice == '7':
+            print("Exiting... Goodbye!")
+            break
+
+        # If user enters a valid option (1-6)
+        if choice in ['1', '2', '3', '4', '5', '6']:
+            # Use try/except to validate the temperature input
+            try:
+                # Ask user to input a temperature value
+                temp = float(input("Enter the temperature value: "))
+            except ValueError:
+                # If user enters something invalid (e.g. 'abc')
+                print("Invalid input! Please enter a numeric value.")
+                continue  # Go back to menu
+
+            # Perform the correct conversion based on choice
+            if choice == '1':
+                result = celsius_to_fahrenheit(temp)
+                print(f"{temp}°C = {result}°F")
+
+            elif choice == '2':
+                result = fahrenheit_to_celsius(temp)
+                print(f"{temp}°F = {result}°C")
+
+            elif choice == '3':
+                result = celsius_to_kelvin(temp)
+                print(f"{temp}°C = {result}K")
+
+            elif choice == '4':
+                result = kelvin_to_celsius(temp)
+                print(f"{temp}K = {result}°C")
+
+            elif choice == '5':
+                result = fahrenheit_to_kelvin(temp)
+                print(f"{temp}°F = {result}K")
+
+            elif choice == '6':
+                result = kelvin_to_fahrenheit(temp)
+                print(f"{temp}K = {result}°F")
+
+        else:
+            # If user enters something outside 1-7
+            print("Invalid option! Please choose between 1 and 7.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# ----------------------------------------------
+# Text and Sequence Utilities (from the Day 11 exercises)
+# ----------------------------------------------
+# - dedupe(): remove duplicates but keep the first-seen order, using a
+#   hash set instead of "if item not in list" (O(n) instead of O(n²))
+# - count_words() / word_frequencies(): word counts for a string or a file
+#   of any size; the text is case-folded once per block (not once per
+#   word) and files are read in blocks, so memory stays bounded by the
+#   number of distinct words
+# - count_word(): how often one word appears, matched exactly like the
+#   Day 11 Task 5 loop (whitespace-separated, lower-cased, punctuation
+#   kept: "python," is not "python")
+# - top_k(): the k most frequent words, picked with a heap
+
+import heapq
+import string
+from collections import Counter
+from operator import itemgetter
+from typing import Callable, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+BLOCK_CHARS = 1024 * 1024  # characters read from a file at a time
+# ASCII punctuation becomes a space (apostrophes stay, so "don't" is one word);
+# str.translate + split is several times faster than a regex findall
+_PUNCTUATION = str.maketrans({c: " " for c in string.punctuation if c != "'"})
+
+
+# ----------------------------------------------
+# Duplicates
+# ----------------------------------------------
+def iter_dedupe(items: Iterable[T], key: Optional[Callable[[T], Hashable]] = None) -> Iterator[T]:
+    """
+    Yield each item the first time it (or its key) is seen.
+    """
+    seen = set()
+    add = seen.add
+    if key is None:
+        for item in items:
+            if item not in seen:
+                add(item)
+                yield item
+    else:
+        for item in items:
+            k = key(item)
+            if k not in seen:
+                add(k)
+                yield item
+
+
+def dedupe(items: Iterable[T], key: Optional[Callable[[T], Hashable]] = None) -> List[T]:
+    """
+    Items without duplicates, in first-seen order.
+    """
+    if key is None:
+        return list(dict.fromkeys(items))  # dicts keep insertion order
+    return list(iter_dedupe(items, key))
+
+
+# ----------------------------------------------
+# Word counting
+# ----------------------------------------------
+def words(text: str) -> List[str]:
+    """Lower-case (case-folded) words of text, punctuation removed."""
+    return text.casefold().translate(_PUNCTUATION).split()
+
+
+def count_words(text: str) -> Counter:
+    return Counter(words(text))
+
+
+def count_word(text: str, word: str) -> int:
+    """
+    Case-insensitive count of one word, e.g. count_word(sentence, "python").
+    Same answer as the Day 11 loop (split, then w.lower() == word.lower()),
+    but the text is lower-cased once instead of once per word.
+    """
+    return text.lower().split().count(word.lower())
+
+
+def _blocks(file_name: str, block_chars: int) -> Iterator[str]:
+    # Blocks of text that end on whitespace, so no word is split in two
+    with open(file_name, "r", encoding="utf-8", errors="replace") as f:
+        tail = ""
+        while True:
+            block = f.read(block_chars)
+            if not block:
+                if tail:
+                    yield tail
+                return
+            block = tail + block
+            cut = max(block.rfind(" "), block.rfind("\n"), block.rfind("\t"))
+            if cut == -1:
+                tail = block  # one very long word: keep reading
+                continue
+            tail = block[cut + 1:]
+            yield block[:cut + 1]
+
+
+def word_frequencies(file_name: str, block_chars: int = BLOCK_CHARS) -> Counter:
+    """
+    Counter of every word in file_name, read block by block.
+    """
+    counts: Counter = Counter()
+    for block in _blocks(file_name, block_chars):
+        counts.update(words(block))
+    return counts
+
+
+def top_k(counts: Counter, k: int = 10) -> List[Tuple[str, int]]:
+    """
+    The k most frequent (word, count) pairs, most frequent first.
+    """
+    return heapq.nlargest(k, counts.items(), key=itemgetter(1))
+
+
+# ----------------------------------------------
+# Benchmark: Day 11 loops vs these helpers
+# ----------------------------------------------
+def benchmark(count: int = 10_000_000) -> None:
+    import random
+    import time
+
+    def report(label: str, items: int, elapsed: float) -> None:
+        print(f"{label:<40} {items / elapsed:>14,.0f} items/s")
+
+    print(f"{count:,} items")
+    values = [random.randint(0, 9_999) for _ in range(count)]
+
+    # The list-based loop is O(n * unique), so time it on a sample only
+    sample = values[:100_000]
+    start = time.perf_counter()
+    unique_list = []
+    for item in sample:
+        if item not in unique_list:
+            unique_list.append(item)
+    report("dedupe: 'not in list' loop (100k sample)", len(sample), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    unique = dedupe(values)
+    report("dedupe: dict.fromkeys", count, time.perf_counter() - start)
+    assert unique[:len(unique_list)] == unique_list
+
+    vocabulary = ["Python", "python", "is", "easy", "I", "love", "because", "Data"]
+    sentence = " ".join(random.choices(vocabulary, k=count))
+
+    start = time.perf_counter()
+    loop_count = 0
+    for w in sentence.split():
+        if w.lower() == "python":
+            loop_count += 1
+    report("count word: split + lower() per word", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    assert count_word(sentence, "python") == loop_count
+    report("count word: count_word()", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    counts = count_words(sentence)
+    report("all word counts: count_words()", count, time.perf_counter() - start)
+    print("Top 3:", top_k(counts, 3))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,134 @@
+# ----------------------------------------------
+# Trig Lookup Tables (degrees)
+# ----------------------------------------------
+# Table-based sine/cosine/tangent for day10_calculator.py (table=True).
+# - One table of sin() for 0°..360° in steps of 0.1° (3601 values),
+#   computed once at import
+# - Angles are reduced to one period first (deg % 360), so any angle works
+# - Integral and tenth-of-a-degree angles are read straight from the
+#   table: the result equals math.sin(math.radians(deg)), except that
+#   values which should be exactly 0, ±0.5 or ±1 (0°, 30°, 90°, 180°...)
+#   are stored exactly instead of as 1.2e-16 or 0.49999999999999994, and
+#   the table is exactly symmetric, so tan(45°) == 1
+# - Other angles use linear interpolation between the two nearest
+#   entries. Error bound for sine/cosine:
+#       h² / 8 * max|sin''| = (0.1° in radians)² / 8 ≈ 3.8e-7
+# - tangent = sine / cosine, undefined where cosine is exactly 0
+#   (deg % 180 == 90); its error grows near those angles
+# - Speed: in CPython the table is NOT faster than
+#   math.sin(math.radians(x)). One call is slower (a Python function vs
+#   two C calls); sine_many() over whole-degree ints is about even and
+#   depends on the machine; other floats are several times slower.
+#   Use it for the exact special values, not for speed (see benchmark())
+
+import math
+from typing import Iterable, List
+
+STEPS_PER_DEGREE = 10
+SIZE = 360 * STEPS_PER_DEGREE
+ERROR_BOUND = (math.radians(1 / STEPS_PER_DEGREE) ** 2) / 8
+
+
+def _build_sine_table() -> List[float]:
+    # Compute 0°..90° and mirror it (sin(180 - x) = sin(x), sin(x + 180) =
+    # -sin(x)), so e.g. sin(135°) == sin(45°) exactly and tan(45°) == 1
+    quarter = SIZE // 4
+    first = []
+    for i in range(quarter + 1):
+        value = math.sin(math.radians(i / STEPS_PER_DEGREE))
+        # Snap values that are exact in theory (0, 1/2, 1)
+        for exact in (0.0, 0.5, 1.0):
+            if abs(value - exact) < 1e-15:
+                value = exact
+        first.append(value)
+    half = first + first[-2::-1]                   # 0°..180°
+    return half + [0.0 - value for value in half[1:]]  # 180°..360° (no -0.0)
+
+
+SINE_TABLE = _build_sine_table()
+# Difference to the next entry, so interpolating is one multiply-add
+SLOPES = [b - a for a, b in zip(SINE_TABLE, SINE_TABLE[1:])] + [0.0]
+
+
+def _lookup(deg: float) -> float:
+    # sin(deg) from the table, interpolating between steps
+    if type(deg) is int:
+        return SINE_TABLE[(deg % 360) * STEPS_PER_DEGREE]
+    position = (deg % 360) * STEPS_PER_DEGREE
+    i = int(position + 0.5)
+    fraction = position - i
+    if -1e-9 < fraction < 1e-9:  # on a table step (e.g. 12.3°)
+        return SINE_TABLE[i]
+    if fraction < 0:
+        i -= 1
+        fraction += 1
+    return SINE_TABLE[i] + fraction * SLOPES[i]
+
+
+def sine(deg: float) -> float:
+    return _lookup(deg)
+
+
+def cosine(deg: float) -> float:
+    # cos(x) = sin(x + 90°)
+    return _lookup(deg + 90)
+
+
+def tangent(deg: float) -> float:
+    """
+    tan(deg). Raises ValueError where the tangent is undefined.
+    """
+    cos = _lookup(deg + 90)
+    if cos == 0:
+        raise ValueError("Error! Tangent undefined at this angle.")
+    return _lookup(deg) / cos
+
+
+def sine_many(degrees: Iterable[float]) -> List[float]:
+    """
+    sine() for many angles; whole-degree ints skip the float path.
+    """
+    table = SINE_TABLE
+    return [table[(d % 360) * STEPS_PER_DEGREE] if type(d) is int else _lookup(d)
+            for d in degrees]
+
+
+def cosine_many(degrees: Iterable[float]) -> List[float]:
+    return sine_many(d + 90 for d in degrees)
+
+
+# ----------------------------------------------
+# Benchmark: table vs math.sin(math.radians(...))
+# ----------------------------------------------
+def benchmark(count: int = 1_000_000) -> None:
+    import random
+    import time
+
+    whole = [random.randint(-720, 720) for _ in range(count)]
+    tenths = [random.randint(-7200, 7200) / 10 for _ in range(count)]
+    other = [random.uniform(-720, 720) for _ in range(count)]
+
+    for label, angles in (("integer degrees", whole), ("tenth degrees", tenths),
+                          ("arbitrary degrees", other)):
+        start = time.perf_counter()
+        exact = [math.sin(math.radians(d)) for d in angles]
+        math_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast = sine_many(angles)
+        table_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for d in angles:
+            sine(d)
+        call_time = time.perf_counter() - start
+
+        worst = max(abs(a - b) for a, b in zip(exact, fast))
+        print(f"{label:<18} math {count / math_time:>12,.0f}/s   "
+              f"sine_many {count / table_time:>12,.0f}/s   "
+              f"sine() {count / call_time:>12,.0f}/s   max error {worst:.1e}")
+    print(f"Documented interpolation bound: {ERROR_BOUND:.1e}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,158 @@
+# ----------------------------------------------
+# Unit Registry with compiled affine conversions
+# ----------------------------------------------
+# Every unit is described once, by how it maps to the base unit:
+#     base = scale * value + offset        (e.g. K = 1 * °C + 273.15)
+# A conversion between any two units is then one formula
+#     target = a * value + b
+# composed once from the two definitions (exactly, with fractions, so
+# °C -> °F really is 9/5 * x + 32) and cached. Adding a unit is one
+# register() call instead of a new function per unit pair.
+# - convert(value, "celsius", "fahrenheit") for one value
+# - convert_many(values, ...) for lists or NumPy arrays in one pass
+# - TEMPERATURE is the ready-made registry used by convert_stream.py
+
+from fractions import Fraction
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+Number = Union[int, float, str, Fraction]  # str such as "273.15" is read exactly
+
+
+def _exact(value: Number) -> Fraction:
+    # Fraction(273.15) would keep the binary rounding error; Fraction("273.15") does not
+    return Fraction(str(value)) if isinstance(value, float) else Fraction(value)
+
+
+class Affine(NamedTuple):
+    """
+    The conversion value -> a * value + b.
+    """
+    a: float
+    b: float
+
+    def __call__(self, value: Any) -> Any:
+        # Works for plain numbers and NumPy arrays alike
+        return self.a * value + self.b
+
+    def many(self, values: Iterable[float]) -> Any:
+        """
+        Apply to a whole sequence: a NumPy array in gives an array out,
+        anything else gives a list.
+        """
+        a, b = self.a, self.b
+        if np is not None and isinstance(values, np.ndarray):
+            return values * a + b
+        if b == 0:
+            return [a * x for x in values]
+        return [a * x + b for x in values]
+
+
+class UnitRegistry:
+    """
+    Units of one kind (e.g. temperature), each defined relative to base.
+    """
+    def __init__(self, base: str, aliases: Iterable[str] = ()):
+        self.base = base
+        self._units: Dict[str, Tuple[Fraction, Fraction]] = {}
+        self._names: Dict[str, str] = {}
+        self._cache: Dict[Tuple[str, str], Affine] = {}
+        self.register(base, 1, 0, aliases)
+
+    def register(self, name: str, scale: Number, offset: Number = 0,
+                 aliases: Iterable[str] = ()) -> None:
+        """
+        Add a unit: base = scale * value + offset.
+        """
+        scale, offset = _exact(scale), _exact(offset)
+        if scale == 0:
+            raise ValueError("scale cannot be 0")
+        for key in (name, *aliases):
+            if key.lower() in self._names:
+                raise ValueError(f"Unit already registered: {key}")
+        self._units[name] = (scale, offset)
+        for key in (name, *aliases):
+            self._names[key.lower()] = name
+        self._cache.clear()
+
+    def units(self) -> List[str]:
+        return list(self._units)
+
+    def resolve(self, unit: str) -> str:
+        """
+        Registered name for unit or one of its aliases (any case).
+        """
+        try:
+            return self._names[unit.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown unit {unit!r}; known units: {', '.join(self._units)}") from None
+
+    def transform(self, source: str, target: str) -> Affine:
+        """
+        The compiled source -> target conversion (cached).
+        """
+        key = (source, target)
+        found = self._cache.get(key)
+        if found is not None:
+            return found
+        source_scale, source_offset = self._units[self.resolve(source)]
+        target_scale, target_offset = self._units[self.resolve(target)]
+        # target = (source_scale * x + source_offset - target_offset) / target_scale
+        a = source_scale / target_scale
+        b = (source_offset - target_offset) / target_scale
+        found = self._cache[key] = Affine(float(a), float(b))
+        return found
+
+    def convert(self, value: float, source: str, target: str) -> float:
+        return self.transform(source, target)(value)
+
+    def convert_many(self, values: Iterable[float], source: str, target: str) -> Any:
+        return self.transform(source, target).many(values)
+
+
+TEMPERATURE = UnitRegistry("kelvin", aliases=["K"])
+TEMPERATURE.register("celsius", 1, "273.15", aliases=["C", "°C"])
+TEMPERATURE.register("fahrenheit", Fraction(5, 9), Fraction("273.15") - Fraction(160, 9),
+                     aliases=["F", "°F"])
+TEMPERATURE.register("rankine", Fraction(5, 9), 0, aliases=["R", "°R"])
+
+
+def convert(value: float, source: str, target: str) -> float:
+    return TEMPERATURE.convert(value, source, target)
+
+
+def convert_many(values: Iterable[float], source: str, target: str) -> Any:
+    return TEMPERATURE.convert_many(values, source, target)
+
+
+# ----------------------------------------------
+# Benchmark: chained converter functions vs one compiled transform
+# ----------------------------------------------
+def benchmark(count: int = 1_000_000) -> None:
+    import random
+    import time
+
+    import day10_converter as converter
+
+    values = [random.uniform(-100, 100) for _ in range(count)]
+
+    start = time.perf_counter()
+    [converter.kelvin_to_fahrenheit(converter.celsius_to_kelvin(x)) for x in values]
+    chained = time.perf_counter() - start
+
+    start = time.perf_counter()
+    convert_many(values, "celsius", "fahrenheit")
+    compiled = time.perf_counter() - start
+
+    print(f"{count:,} values, °C -> K -> °F")
+    print(f"two converter calls each  {count / chained:>13,.0f}/s")
+    print(f"compiled a*x + b          {count / compiled:>13,.0f}/s   "
+          f"{TEMPERATURE.transform('celsius', 'fahrenheit')}")
+
+
+if __name__ == "__main__":
+    benchmark()
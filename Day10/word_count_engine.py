@@ -0,0 +1,184 @@
+# ----------------------------------------------
+# Parallel Word Counting for large text corpora
+# ----------------------------------------------
+# Usage:
+#   python word_count_engine.py books/*.txt [--top 20] [--workers N]
+#   python word_count_engine.py logs/*.txt --words python,error,timeout
+#   python word_count_engine.py --benchmark 200
+# - Map: every file is cut into byte ranges that end on whitespace; each
+#   worker process reads its range BLOCK_BYTES at a time (memory stays
+#   bounded) and counts words into a Counter
+# - Reduce: the parent adds the partial Counters together
+# - --words counts only the given words: each block's words are filtered
+#   through a set, so only those words ever reach the Counters
+# - Words are case-folded and stripped of punctuation the same way as
+#   text_utils.words(), so "Python," counts as "python" (Day 11 Task 5
+#   and text_utils.count_word() match whole whitespace-separated words)
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+from typing import FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from text_utils import top_k, words
+
+CHUNK_MB = 16             # size of one unit of work
+BLOCK_BYTES = 1024 * 1024  # bytes a worker reads at a time
+WHITESPACE = b" \t\r\n"
+
+Task = Tuple[str, int, int, Optional[FrozenSet[str]]]  # (file, start, end, target words)
+
+
+class WordCounts(NamedTuple):
+    counts: Counter
+    bytes_read: int
+    seconds: float
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes_read / 1024 / 1024 / self.seconds if self.seconds else 0.0
+
+
+def split_ranges(file_name: str, chunk_size: int) -> List[Tuple[str, int, int]]:
+    """
+    Cut file_name into ranges of about chunk_size bytes that end on whitespace.
+    """
+    size = os.path.getsize(file_name)
+    boundaries = [0]
+    with open(file_name, "rb") as f:
+        position = chunk_size
+        while position < size:
+            f.seek(position)
+            data = f.read(BLOCK_BYTES)
+            offsets = [i for i in (data.find(c) for c in (b" ", b"\n", b"\t", b"\r")) if i != -1]
+            if not offsets:
+                position += len(data)  # no whitespace nearby: look further on
+                continue
+            boundary = position + min(offsets) + 1
+            if boundary >= size:
+                break
+            boundaries.append(boundary)
+            position = boundary + chunk_size
+    boundaries.append(size)
+    return [(file_name, start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _blocks(file_name: str, start: int, end: int) -> Iterable[str]:
+    # Text of [start, end) in blocks that end on whitespace
+    with open(file_name, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        tail = b""
+        while remaining > 0:
+            data = tail + f.read(min(BLOCK_BYTES, remaining))
+            remaining = end - f.tell()
+            cut = max(data.rfind(c) for c in WHITESPACE)
+            if remaining > 0 and cut != -1:
+                tail = data[cut + 1:]
+                data = data[:cut + 1]
+            else:
+                tail = b""
+            yield data.decode("utf-8", errors="replace")
+
+
+def count_range(task: Task) -> Counter:
+    """
+    Word counts for one byte range (runs in a worker process).
+    """
+    file_name, start, end, targets = task
+    counts: Counter = Counter()
+    for block in _blocks(file_name, start, end):
+        if targets is None:
+            counts.update(words(block))
+        else:
+            counts.update(filter(targets.__contains__, words(block)))
+    return counts
+
+
+def count_corpus(file_names: List[str], targets: Optional[Iterable[str]] = None,
+                 workers: Optional[int] = None, chunk_size: int = CHUNK_MB * 1024 * 1024) -> WordCounts:
+    """
+    Word counts over all files (only the target words, if given).
+    """
+    start = time.perf_counter()
+    target_set = frozenset(word.casefold() for word in targets) if targets is not None else None
+    tasks = [(name, a, b, target_set)
+             for file_name in file_names for name, a, b in split_ranges(file_name, chunk_size)]
+    total: Counter = Counter()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        for partial in map(count_range, tasks):
+            total.update(partial)
+    else:
+        with Pool(workers) as pool:
+            for partial in pool.imap_unordered(count_range, tasks):
+                total.update(partial)
+    if target_set is not None:
+        for word in target_set:
+            total.setdefault(word, 0)  # report targets that never appeared
+    size = sum(os.path.getsize(name) for name in file_names)
+    return WordCounts(total, size, time.perf_counter() - start)
+
+
+# ----------------------------------------------
+# Benchmark: MB/s with 1 .. N workers
+# ----------------------------------------------
+def benchmark(size_mb: int = 200, max_workers: Optional[int] = None) -> None:
+    import random
+
+    vocabulary = ("the quick brown fox jumps over the lazy dog Python python "
+                  "data, error! timeout. I love because easy").split()
+    file_name = "bench_corpus.txt"
+    with open(file_name, "w") as f:
+        while f.tell() < size_mb * 1024 * 1024:
+            f.write(" ".join(random.choices(vocabulary, k=100_000)) + "\n")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = max(1, os.path.getsize(file_name) // (max_workers * 8))
+    workers = 1
+    while True:
+        every = count_corpus([file_name], workers=workers, chunk_size=chunk_size)
+        some = count_corpus([file_name], ["python", "error"], workers, chunk_size)
+        print(f"{workers:3d} workers: all words {every.mb_per_s:7.1f} MB/s   "
+              f"2 target words {some.mb_per_s:7.1f} MB/s")
+        if workers >= max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+    print("Top 3:", top_k(every.counts, 3), " targets:", dict(some.counts))
+    os.remove(file_name)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Count words in many text files in parallel.")
+    parser.add_argument("files", nargs="*", help="text files")
+    parser.add_argument("--words", help="comma-separated words to count (default: every word)")
+    parser.add_argument("--top", type=int, default=10, help="how many of the most common words to show")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_MB, help="size of one unit of work")
+    parser.add_argument("--benchmark", type=int, metavar="MB", help="time 1..N workers on a generated file")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark, args.workers)
+        return
+    if not args.files:
+        parser.error("give at least one text file")
+
+    targets = [w.strip() for w in args.words.split(",") if w.strip()] if args.words else None
+    try:
+        result = count_corpus(args.files, targets, args.workers, args.chunk_mb * 1024 * 1024)
+    except FileNotFoundError as e:
+        print("⚠️ File not found:", e.filename)
+        sys.exit(1)
+
+    shown = sorted(result.counts.items()) if targets else top_k(result.counts, args.top)
+    for word, count in shown:
+        print(f"{word:<20} {count:>12,}")
+    print(f"📚 {result.bytes_read / 1024 / 1024:,.1f} MB in {result.seconds:.2f} s ({result.mb_per_s:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,42 @@
 # -------------------------------
 # File-Based Login System
 # -------------------------------
+import os
+import sys
+
+# Make the shared rate_limiter module (repo root) importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from credential_store import CredentialStore, PLAINTEXT_FILE, migrate_plaintext
+from rate_limiter import LOCKOUT_FILE, LockoutTracker, make_key
+from session_store import SessionStore
+
+CLIENT = "console"  # every attempt from this program comes from the terminal
+
+store = CredentialStore()
+# Failed attempts persist per username in lockouts.db across restarts
+lockouts = LockoutTracker(max_failures=3, filename=LOCKOUT_FILE)
+# Signed session tokens, so a logged-in user is not asked for the password again
+sessions = SessionStore()
+
+# One-time migration of the old plaintext users.txt (deleted afterwards)
+if os.path.exists(PLAINTEXT_FILE):
+    migrate_plaintext(store, PLAINTEXT_FILE)
+
 
 def register_user():
     """
-    Registers a new user by saving username and password to a file
+    Registers a new user by saving username and a salted password hash
     """
     try:
         username = input("Enter new username: ").strip()
         password = input("Enter new password: ").strip()
 
-        if username == "" or password == "":
-            raise ValueError("Username or password cannot be empty!")
-
-        # Check if username already exists
-        with open("users.txt", "r") as file:
-            for line in file:
-                stored_username = line.strip().split(",")[0]
-                if username == stored_username:
-                    raise ValueError("Username already exists!")
-
-        # Append new user to file
-        with open("users.txt", "a") as file:
-            file.write(f"{username},{password}\n")
+        # Raises ValueError for empty input or an existing username
+        store.register(username, password)
 
         print("✅ Registration successful!")
 
-    except FileNotFoundError:
-        # If users.txt does not exist, create it and register first user
-        with open("users.txt", "w") as file:
-            file.write(f"{username},{password}\n")
-        print("✅ Registration successful! (File created)")
-
     except ValueError as ve:
         print("Error:", ve)
 
@@ -41,10 +46,12 @@ def register_user():
 
 def login_user():
     """
-    Logs in a user by checking credentials from the file
+    Logs in a user by checking credentials against the hashed store.
+    Returns a session token on success, otherwise None.
     """
-    attempts = 3
+    attempts = 3  # per session, on top of the per-username lockout
     while attempts > 0:
+        key = None
         try:
             username = input("Enter username: ").strip()
             password = input("Enter password: ").strip()
@@ -52,53 +59,71 @@ def login_user():
             if username == "" or password == "":
                 raise ValueError("Username or password cannot be empty!")
 
-            found = False
-            with open("users.txt", "r") as file:
-                for line in file:
-                    stored_username, stored_password = line.strip().split(",")
-                    if username == stored_username and password == stored_password:
-                        found = True
-                        break
+            if store.is_empty():
+                print("No users registered yet. Please register first.")
+                return
 
-            if not found:
-                raise ValueError("Incorrect username or password!")
+            key = make_key(username, CLIENT)
+            if lockouts.is_locked(key):
+                print("❌ Too many failed login attempts. Access denied.")
+                return
 
-        except FileNotFoundError:
-            print("No users registered yet. Please register first.")
-            return
+            # Indexed lookup + salted hash check (no full file scan)
+            if not store.verify(username, password):
+                raise ValueError("Incorrect username or password!")
 
         except ValueError as ve:
             print("Login Error:", ve)
-            attempts -= 1
-            print(f"Attempts left: {attempts}")
+            if key is not None:
+                attempts = min(attempts - 1, lockouts.record_failure(key))
+                print(f"Attempts left: {attempts}")
 
         else:
+            lockouts.reset(key)
             print("✅ Login successful! Welcome,", username)
-            break
+            return sessions.issue(username)
 
         finally:
             print("Login attempt finished.\n")
 
-    if attempts == 0:
-        print("❌ Too many failed login attempts. Access denied.")
+    print("❌ Too many failed login attempts. Access denied.")
 
 
 # -------------------------------
 # Main Menu
 # -------------------------------
+token = None  # session token of the logged-in user, if any
+
 while True:
     print("1. Register")
     print("2. Login")
-    print("3. Exit")
+    print("3. Continue session")
+    print("4. Logout")
+    print("5. Exit")
 
     choice = input("Enter choice: ").strip()
 
     if choice == "1":
         register_user()
     elif choice == "2":
-        login_user()
+        token = login_user() or token
     elif choice == "3":
+        # Validate the signed token only; users.db is not read
+        username = sessions.validate(token) if token else None
+        if username:
+            print("✅ Welcome back,", username)
+            print()
+        else:
+            token = None
+            print("Session expired or not logged in. Please login.\n")
+    elif choice == "4":
+        if token:
+            sessions.revoke(token)
+            token = None
+        print("Logged out.\n")
+    elif choice == "5":
         print("Goodbye!")
+        store.close()
         break
     else:
         print("Invalid choice. Try again.\n")
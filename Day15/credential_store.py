@@ -0,0 +1,220 @@
+# -------------------------------
+# Credential Store for the File-Based Login System
+# -------------------------------
+# - Passwords are never stored in plaintext: each user gets a random salt
+#   and a PBKDF2-HMAC-SHA256 hash (stdlib hashlib)
+# - Records live in an SQLite file whose primary-key B-tree gives
+#   O(log n) lookups without scanning the whole file
+# - Recently verified users are kept in a small in-process LRU so repeated
+#   logins skip the disk lookup
+# - Old plaintext users.txt files are imported once with migrate_plaintext(),
+#   which then overwrites and deletes the plaintext file
+
+import hashlib
+import hmac
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+DB_FILE = "users.db"           # hashed credential store
+PLAINTEXT_FILE = "users.txt"   # legacy "username,password" file
+ITERATIONS = 200_000           # PBKDF2 work factor
+SALT_BYTES = 16
+CACHE_SIZE = 1024              # how many verified users the LRU remembers
+
+
+def hash_password(password: str, salt: bytes, iterations: int = ITERATIONS) -> bytes:
+    """
+    Derive the PBKDF2-HMAC-SHA256 hash of password with the given salt.
+    Kept at module level so it can be sent to worker processes.
+    """
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+
+def check_password(password: str, salt: bytes, iterations: int, stored_hash: bytes) -> bool:
+    """
+    Return True if password hashes to stored_hash (constant-time compare).
+    """
+    return hmac.compare_digest(hash_password(password, salt, iterations), stored_hash)
+
+
+class CredentialStore:
+    """
+    Salted, hashed username/password storage with indexed lookup.
+    Each record is (salt, iterations, hash), keyed by username.
+    """
+    def __init__(self, db_file: str = DB_FILE, cache_size: int = CACHE_SIZE,
+                 iterations: int = ITERATIONS):
+        self.db_file = db_file
+        self.iterations = iterations
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[bytes, int, bytes]]" = OrderedDict()
+        self._conn = sqlite3.connect(db_file)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            " username TEXT PRIMARY KEY,"
+            " salt BLOB NOT NULL,"
+            " iterations INTEGER NOT NULL,"
+            " hash BLOB NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ---------- lookups ----------
+    def get_record(self, username: str) -> Optional[Tuple[bytes, int, bytes]]:
+        """
+        Return (salt, iterations, hash) for username, or None if unknown.
+        Checks the LRU first, then the indexed table.
+        """
+        record = self._cache.get(username)
+        if record is not None:
+            self._cache.move_to_end(username)
+            return record
+        row = self._conn.execute(
+            "SELECT salt, iterations, hash FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def exists(self, username: str) -> bool:
+        return self.get_record(username) is not None
+
+    def is_empty(self) -> bool:
+        return self._conn.execute("SELECT 1 FROM users LIMIT 1").fetchone() is None
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def _remember(self, username: str, record: Tuple[bytes, int, bytes]) -> None:
+        # Keep the most recently verified users; drop the oldest when full
+        self._cache[username] = record
+        self._cache.move_to_end(username)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # ---------- register / verify ----------
+    def register(self, username: str, password: str) -> None:
+        """
+        Store a new user. Raises ValueError for empty input or duplicates.
+        """
+        if username == "" or password == "":
+            raise ValueError("Username or password cannot be empty!")
+        if "," in username:
+            raise ValueError("Username cannot contain commas!")
+        salt = os.urandom(SALT_BYTES)
+        digest = hash_password(password, salt, self.iterations)
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO users (username, salt, iterations, hash) VALUES (?, ?, ?, ?)",
+                    (username, salt, self.iterations, digest),
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError("Username already exists!")
+
+    def verify(self, username: str, password: str) -> bool:
+        """
+        Return True if the username exists and the password matches.
+        """
+        record = self.get_record(username)
+        if record is None:
+            return False
+        salt, iterations, stored_hash = record
+        if not check_password(password, salt, iterations, stored_hash):
+            return False
+        self._remember(username, record)
+        return True
+
+    def import_plaintext(self, filename: str = PLAINTEXT_FILE) -> int:
+        """
+        Hash every "username,password" line of a legacy users.txt into the store.
+        Users that already exist and malformed lines are skipped.
+        Returns how many were imported.
+        """
+        imported = 0
+        with open(filename, "r") as file:
+            for line_number, line in enumerate(file, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    username, password = line.split(",", 1)
+                    self.register(username, password)
+                    imported += 1
+                except ValueError as ve:
+                    print(f"⚠️ {filename} line {line_number} skipped: {ve}")
+        return imported
+
+
+def migrate_plaintext(store: CredentialStore, filename: str = PLAINTEXT_FILE) -> int:
+    """
+    Import a legacy plaintext file into store, then overwrite it with zeros
+    and delete it so no password stays on disk. Returns how many were imported.
+    """
+    imported = store.import_plaintext(filename)
+    size = os.path.getsize(filename)
+    with open(filename, "r+b") as file:
+        file.write(b"\0" * size)
+        file.flush()
+        os.fsync(file.fileno())
+    os.remove(filename)
+    return imported
+
+
+# -------------------------------
+# Benchmark: lookup time as the store grows
+# -------------------------------
+def benchmark(accounts: int = 10_000_000, lookups: int = 100_000,
+              db_file: str = "bench_users.db") -> None:
+    """
+    Fill a store with `accounts` users and time indexed lookups.
+    All rows share one precomputed hash so the fill measures storage,
+    not PBKDF2 (which is deliberately slow).
+    """
+    import random
+
+    if os.path.exists(db_file):
+        os.remove(db_file)
+    store = CredentialStore(db_file, iterations=1_000)
+    salt = os.urandom(SALT_BYTES)
+    digest = hash_password("secret", salt, 1_000)
+
+    start = time.perf_counter()
+    batch = 100_000
+    with store._conn:
+        for first in range(0, accounts, batch):
+            store._conn.executemany(
+                "INSERT INTO users VALUES (?, ?, ?, ?)",
+                ((f"user{i:09d}", salt, 1_000, digest)
+                 for i in range(first, min(first + batch, accounts))),
+            )
+    fill = time.perf_counter() - start
+    print(f"Filled {accounts:,} accounts in {fill:.1f}s")
+
+    names = [f"user{random.randrange(accounts):09d}" for _ in range(lookups)]
+    start = time.perf_counter()
+    for name in names:
+        store.get_record(name)
+    elapsed = time.perf_counter() - start
+    print(f"Indexed lookups: {lookups / elapsed:,.0f}/s "
+          f"({elapsed / lookups * 1e6:.1f} µs each)")
+
+    start = time.perf_counter()
+    store.verify(names[0], "secret")
+    first_verify = time.perf_counter() - start
+    start = time.perf_counter()
+    store.verify(names[0], "secret")
+    cached_verify = time.perf_counter() - start
+    print(f"verify(): {first_verify * 1e3:.2f} ms cold, {cached_verify * 1e3:.2f} ms with LRU hit")
+
+    store.close()
+    os.remove(db_file)
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
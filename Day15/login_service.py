@@ -0,0 +1,147 @@
+# -------------------------------
+# Asynchronous Login Verification Service
+# -------------------------------
+# - Login requests are accepted concurrently with asyncio
+# - The CPU-heavy PBKDF2 check runs in a process pool, so it is not
+#   serialized behind the GIL and never blocks the event loop
+# - The 3-attempt rule is enforced per user with the shared LockoutTracker:
+#   each username has its own sliding-window counter, so one user's
+#   attempts never wait on another's. Attempts for the same user are taken
+#   one at a time, so a burst of guesses cannot get past the limit and a
+#   failure is only counted once the password check has actually failed
+# - run_load_test() reports logins/sec and latency percentiles
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+# Make the shared rate_limiter module (repo root) importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from credential_store import CredentialStore, check_password
+from rate_limiter import LockoutTracker, make_key
+
+MAX_ATTEMPTS = 3
+
+
+class LoginService:
+    """
+    Verifies credentials from a CredentialStore using a pool of worker processes.
+    """
+    def __init__(self, store: CredentialStore, workers: Optional[int] = None,
+                 max_attempts: int = MAX_ATTEMPTS,
+                 lockouts: Optional[LockoutTracker] = None):
+        self.store = store
+        self.lockouts = lockouts if lockouts is not None else LockoutTracker(max_failures=max_attempts)
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._in_flight: Dict[str, list] = {}  # key -> [asyncio.Lock, requests using it]
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+    def attempts_left(self, username: str, client: Optional[str] = None) -> int:
+        return self.lockouts.attempts_left(make_key(username, client))
+
+    async def login(self, username: str, password: str,
+                    client: Optional[str] = None) -> bool:
+        """
+        Return True if the credentials are valid.
+        Raises PermissionError once a user has used up their attempts.
+        """
+        if username == "" or password == "":
+            raise ValueError("Username or password cannot be empty!")
+
+        # One attempt per key at a time: the next one only sees the lockout
+        # state after the previous check has finished. The dict is only
+        # touched from the event loop thread, so no other lock is needed.
+        key = make_key(username, client)
+        entry = self._in_flight.get(key)
+        if entry is None:
+            entry = self._in_flight[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                if self.lockouts.is_locked(key):
+                    raise PermissionError("Too many failed login attempts. Access denied.")
+                ok = False
+                record = self.store.get_record(username)
+                if record is not None:
+                    salt, iterations, stored_hash = record
+                    loop = asyncio.get_running_loop()
+                    ok = await loop.run_in_executor(
+                        self._pool, check_password, password, salt, iterations, stored_hash
+                    )
+                if ok:
+                    self.lockouts.reset(key)  # success clears the counter
+                else:
+                    self.lockouts.record_failure(key)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._in_flight[key]
+        return ok
+
+
+# -------------------------------
+# Local load generator
+# -------------------------------
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def _load(service: LoginService, users: List[str], requests: int,
+                concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await service.login(users[i % len(users)], "secret")
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return latencies
+
+
+def run_load_test(users: int = 100, requests: int = 2_000, concurrency: int = 64,
+                  workers: Optional[int] = None, iterations: int = 20_000,
+                  db_file: str = "bench_login.db") -> None:
+    """
+    Register `users` accounts, then fire `requests` concurrent logins and
+    report throughput and latency percentiles.
+    """
+    if users < 1 or requests < 1 or concurrency < 1:
+        raise ValueError("users, requests and concurrency must be at least 1")
+    concurrency = min(concurrency, requests)
+    if os.path.exists(db_file):
+        os.remove(db_file)
+    store = CredentialStore(db_file, iterations=iterations)
+    names = [f"user{i}" for i in range(users)]
+    for name in names:
+        store.register(name, "secret")
+
+    service = LoginService(store, workers=workers)
+    start = time.perf_counter()
+    latencies = asyncio.run(_load(service, names, requests, concurrency))
+    elapsed = time.perf_counter() - start
+    service.close()
+    store.close()
+    os.remove(db_file)
+
+    latencies.sort()
+    print(f"{requests} logins with {service.workers} workers, "
+          f"concurrency {concurrency}")
+    print(f"Throughput: {requests / elapsed:,.0f} logins/s")
+    print(f"Latency p50: {_percentile(latencies, 0.50) * 1e3:.1f} ms, "
+          f"p99: {_percentile(latencies, 0.99) * 1e3:.1f} ms, "
+          f"max: {latencies[-1] * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    run_load_test()
@@ -0,0 +1,144 @@
+# -------------------------------
+# Session Tokens for the File-Based Login System
+# -------------------------------
+# - After a successful login the user gets a signed session token:
+#       <username>.<expiry>.<session id>.<HMAC-SHA256 signature>
+# - Validating a token is O(1): check the signature, the expiry and the
+#   session table. The credential store is never touched.
+# - The session table is bounded: expired sessions are dropped and, when
+#   full, the least recently used session is evicted (LRU + TTL)
+
+import base64
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+SESSION_TTL = 30 * 60       # seconds a session stays valid
+MAX_SESSIONS = 100_000      # upper bound on the in-memory session table
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class SessionStore:
+    """
+    Issues and validates HMAC-signed session tokens.
+    The table maps session id -> (username, expiry) in LRU order.
+    """
+    def __init__(self, secret: Optional[bytes] = None, ttl: float = SESSION_TTL,
+                 max_sessions: int = MAX_SESSIONS,
+                 clock: Callable[[], float] = time.time):
+        self.secret = secret or secrets.token_bytes(32)
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.clock = clock
+        self._sessions: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _sign(self, payload: str) -> str:
+        return _b64(hmac.new(self.secret, payload.encode("ascii"), hashlib.sha256).digest())
+
+    def issue(self, username: str) -> str:
+        """
+        Create a session for username and return its token.
+        """
+        now = self.clock()
+        expiry = int(now + self.ttl)
+        session_id = secrets.token_urlsafe(12)
+        payload = f"{_b64(username.encode('utf-8'))}.{expiry}.{session_id}"
+
+        self._sessions[session_id] = (username, expiry)
+        self._evict(now)
+        return f"{payload}.{self._sign(payload)}"
+
+    def validate(self, token: str) -> Optional[str]:
+        """
+        Return the username for a valid, unexpired, known token; otherwise None.
+        """
+        try:
+            encoded_user, expiry_text, session_id, signature = token.split(".")
+            expiry = int(expiry_text)
+            payload = f"{encoded_user}.{expiry_text}.{session_id}"  # exactly as signed
+            # Compared as bytes: non-ASCII text raises UnicodeEncodeError
+            # (a ValueError) here instead of a TypeError in compare_digest
+            valid = hmac.compare_digest(self._sign(payload).encode("ascii"),
+                                        signature.encode("ascii"))
+        except ValueError:  # wrong number of parts, bad expiry, non-ASCII
+            return None
+        if not valid:
+            return None
+
+        now = self.clock()
+        if now >= expiry:
+            self._sessions.pop(session_id, None)
+            return None
+        session = self._sessions.get(session_id)
+        if session is None:  # logged out or evicted
+            return None
+        self._sessions.move_to_end(session_id)
+        return session[0]
+
+    def revoke(self, token: str) -> None:
+        """
+        Log a token out. Unknown or malformed tokens are ignored.
+        """
+        parts = token.split(".")
+        if len(parts) == 4:
+            self._sessions.pop(parts[2], None)
+
+    def _evict(self, now: float) -> None:
+        # Drop expired sessions from the LRU end, then enforce the size bound
+        while self._sessions:
+            session_id, (_, expiry) = next(iter(self._sessions.items()))
+            if expiry > now and len(self._sessions) <= self.max_sessions:
+                break
+            del self._sessions[session_id]
+
+
+# -------------------------------
+# Benchmark: token validation vs full credential check
+# -------------------------------
+def benchmark(sessions: int = 10_000, validations: int = 200_000) -> None:
+    import os
+    import random
+
+    from credential_store import CredentialStore
+
+    sessions_store = SessionStore()
+    tokens = [sessions_store.issue(f"user{i}") for i in range(sessions)]
+    picks = [random.choice(tokens) for _ in range(validations)]
+    start = time.perf_counter()
+    for token in picks:
+        sessions_store.validate(token)
+    elapsed = time.perf_counter() - start
+    print(f"Session validation: {validations / elapsed:,.0f}/s "
+          f"({elapsed / validations * 1e6:.1f} µs each)")
+
+    db_file = "bench_sessions.db"
+    if os.path.exists(db_file):
+        os.remove(db_file)
+    store = CredentialStore(db_file)
+    store.register("alice", "secret")
+    checks = 20
+    start = time.perf_counter()
+    for _ in range(checks):
+        store.verify("alice", "secret")
+    elapsed = time.perf_counter() - start
+    store.close()
+    os.remove(db_file)
+    print(f"Credential check:   {checks / elapsed:,.0f}/s "
+          f"({elapsed / checks * 1e3:.1f} ms each)")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -4,35 +4,42 @@
 # Description:
 # This program allows the user to enter their name and message,
 # saves it into a text file called 'messages.txt', and then
-# reads and displays all saved messages.
+# reads and displays the most recent saved messages.
 # ------------------------------------------
 
+from append_writer import get_writer
+from log_reader import LogReader
+
+RECENT_MESSAGES = 20  # how many of the newest messages to show
+
 # Function to save a message into the file
 def save_message(name, message):
     """
     Saves a new message to messages.txt.
-    The 'a' mode means append — it adds new lines without deleting old ones.
+    The file stays open in append mode and lines are written in batches,
+    so saving many messages does not reopen the file every time.
     """
-    with open("messages.txt", "a") as file:
-        file.write(f"{name}: {message}\n")  # Write name and message in one line
+    writer = get_writer("messages.txt")
+    writer.write(f"{name}: {message}\n")  # Write name and message in one line
 
 
-# Function to read all messages from the file
-def read_messages():
+# Function to read the most recent messages from the file
+def read_messages(limit=RECENT_MESSAGES):
     """
-    Reads all messages from messages.txt and displays them.
+    Shows the newest messages from messages.txt and the total count.
+    Only the end of the file is read, so this stays fast for huge files.
     If the file does not exist yet, it shows a friendly message.
     """
     try:
-        with open("messages.txt", "r") as file:
-            messages = file.readlines()  # Read all lines as a list
-            if len(messages) == 0:
-                print("\nNo messages found yet.")
-            else:
-                print("\n--- All Messages ---")
-                for msg in messages:
-                    print(msg.strip())  # Remove extra newline characters
-                print(f"\nTotal messages: {len(messages)}")
+        reader = LogReader("messages.txt")
+        total = reader.count()  # kept up to date in messages.txt.idx
+        if total == 0:
+            print("\nNo messages found yet.")
+        else:
+            print("\n--- Latest Messages ---")
+            for msg in reader.tail(limit):
+                print(msg.strip())  # Remove extra spaces
+            print(f"\nTotal messages: {total}")
     except FileNotFoundError:
         print("\nNo message file found yet. Try adding a message first.")
 
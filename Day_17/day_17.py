@@ -2,34 +2,108 @@
 # 🗒️ Personal Notes Manager
 # -------------------------------
 
-# This program helps users store and read personal notes from a file.
+# This program helps users store, search and edit personal notes in a file.
 # It demonstrates file handling (read, write, append) and error handling.
 
+import os
+import sys
+
+# Make the shared log_reader module (repo root) importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from log_reader import LogReader
+from notes_store import NotesStore, parse_record
+
 NOTES_FILE = "notes.txt"
+PAGE_SIZE = 10  # notes shown per page
+
+# Every note gets a stable ID; the store keeps a search index in memory
+store = NotesStore(NOTES_FILE)
 
 def add_note():
     note = input("Enter your note: ")
-    with open(NOTES_FILE, "a") as file:
-        file.write(note + "\n")
-    print("✅ Note added successfully!\n")
+    try:
+        note_id = store.add(note)
+        print(f"✅ Note #{note_id} added successfully!\n")
+    except ValueError as ve:
+        print("⚠️", ve, "\n")
 
 def view_notes():
+    # Newest notes first, one page at a time, reading notes.txt backwards
+    # from the end so old notes are only read if the user asks for them
+    if len(store) == 0:
+        print("No notes found.\n")
+        return
     try:
-        with open(NOTES_FILE, "r") as file:
-            notes = file.readlines()
-            if notes:
-                print("\n📝 Your Notes:")
-                for i, note in enumerate(notes, 1):
-                    print(f"{i}. {note.strip()}")
-            else:
-                print("No notes found.\n")
+        store.flush()  # write buffered changes before reading the file
+        reader = LogReader(NOTES_FILE)
+        line_number = reader.count() + 1
     except FileNotFoundError:
         print("⚠️ No notes file found. Add a note first!\n")
+        return
+
+    print("\n📝 Your Notes (newest first):")
+    seen = set()  # ids already shown, edited later, or deleted
+    shown = 0
+    for line in reader.iter_backward():
+        line_number -= 1
+        record = parse_record(line, line_number)
+        if record is None or record[0] in seen:
+            continue
+        note_id, note = record
+        seen.add(note_id)
+        if note is None:
+            continue  # deleted
+        print(f"{note_id}. {note}")
+        shown += 1
+        if shown % PAGE_SIZE == 0 and shown < len(store):
+            if input("Show older notes? (y/n): ").lower() != "y":
+                break
+
+def search_notes():
+    query = input('Search for (use "quotes" for an exact phrase): ')
+    results = store.search(query)
+    if results:
+        print(f"\n🔎 {len(results)} matching note(s):")
+        for note_id, note in results:
+            print(f"{note_id}. {note}")
+    else:
+        print("No matching notes.\n")
+
+def read_note_id():
+    try:
+        return int(input("Enter note number: "))
+    except ValueError:
+        print("❌ Please enter a valid note number.\n")
+        return None
+
+def edit_note():
+    note_id = read_note_id()
+    if note_id is None:
+        return
+    if note_id not in store:
+        print("⚠️ No note with that number.\n")
+        return
+    try:
+        store.edit(note_id, input("Enter the new text: "))
+        print("✏️ Note updated!\n")
+    except ValueError as ve:
+        print("⚠️", ve, "\n")
+
+def delete_note():
+    note_id = read_note_id()
+    if note_id is None:
+        return
+    if note_id not in store:
+        print("⚠️ No note with that number.\n")
+        return
+    store.delete(note_id)
+    print("🗑️ Note deleted!\n")
 
 def delete_notes():
     confirm = input("Are you sure you want to delete all notes? (y/n): ")
     if confirm.lower() == "y":
-        open(NOTES_FILE, "w").close()  # Clears the file content
+        store.clear()  # Clears the file content
         print("🗑️ All notes deleted!\n")
 
 def menu():
@@ -37,8 +111,11 @@ def menu():
         print("\n========= Notes Manager =========")
         print("1️⃣ Add Note")
         print("2️⃣ View Notes")
-        print("3️⃣ Delete All Notes")
-        print("4️⃣ Exit")
+        print("3️⃣ Search Notes")
+        print("4️⃣ Edit a Note")
+        print("5️⃣ Delete a Note")
+        print("6️⃣ Delete All Notes")
+        print("7️⃣ Exit")
         
         choice = input("Choose an option: ")
         
@@ -47,8 +124,15 @@ def menu():
         elif choice == "2":
             view_notes()
         elif choice == "3":
-            delete_notes()
+            search_notes()
         elif choice == "4":
+            edit_note()
+        elif choice == "5":
+            delete_note()
+        elif choice == "6":
+            delete_notes()
+        elif choice == "7":
+            store.close()  # write any buffered notes
             print("👋 Goodbye!")
             break
         else:
@@ -12,11 +12,24 @@ class Employee:
         self.emp_id = emp_id
         self.salary = salary
 
-    # Method to display employee details
+    # Count every change to a public attribute, so cached output
+    # (report_render.py) knows when it has to be rebuilt
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            self.__dict__["_version"] = self.__dict__.get("_version", 0) + 1
+
+    # Lines describing the employee (child classes add their own)
+    def info_lines(self):
+        return [
+            f"Name: {self.name}",
+            f"Employee ID: {self.emp_id}",
+            f"Salary: ${self.salary}",
+        ]
+
+    # Method to display employee details (one print call)
     def display_info(self):
-        print(f"Name: {self.name}")
-        print(f"Employee ID: {self.emp_id}")
-        print(f"Salary: ${self.salary}")
+        print("\n".join(self.info_lines()))
 
     # Method to calculate yearly salary
     def yearly_salary(self):
@@ -31,10 +44,8 @@ class Manager(Employee):
         self.department = department
 
     # Override method (Polymorphism)
-    def display_info(self):
-        print(f"[Manager Info]")
-        super().display_info()
-        print(f"Department: {self.department}")
+    def info_lines(self):
+        return ["[Manager Info]"] + super().info_lines() + [f"Department: {self.department}"]
 
 
 # 3️⃣ Another Child Class (Inheritance)
@@ -44,10 +55,9 @@ class Developer(Employee):
         self.programming_language = programming_language
 
     # Override method (Polymorphism)
-    def display_info(self):
-        print(f"[Developer Info]")
-        super().display_info()
-        print(f"Programming Language: {self.programming_language}")
+    def info_lines(self):
+        return (["[Developer Info]"] + super().info_lines()
+                + [f"Programming Language: {self.programming_language}"])
 
 
 # 4️⃣ Demonstration (Creating Objects)
@@ -0,0 +1,253 @@
+# ----------------------------------------
+# 📇 Employee Directory (persistent, indexed)
+# ----------------------------------------
+# Stores Day 18 Employee / Manager / Developer objects in an SQLite file:
+# - emp_id is the primary key, so get("M101") is one B-tree lookup
+#   (O(log n): a handful of page reads even at millions of employees);
+#   the rows of recently used employees are also kept in an in-process
+#   LRU, so repeated lookups are plain dict hits. The LRU holds the stored
+#   row (a tuple), never an Employee: get() builds a fresh object each
+#   time, so changing it does nothing until save()
+# - Secondary indexes on department (managers) and programming_language
+#   (developers) answer "everyone in IT" without scanning the table
+# - Every write is a committed transaction in WAL mode, so the directory
+#   survives crashes; opening it reads nothing up front, so startup time
+#   does not depend on how many employees are stored
+# - to_payroll() streams the rows into a PayrollTable for batch payroll
+
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from day_18 import Developer, Employee, Manager
+
+DB_FILE = "employees.db"
+CACHE_SIZE = 4096  # employees kept in the LRU
+
+Row = Tuple[str, str, float, str, Optional[str], Optional[str]]
+
+
+def to_row(employee: Employee) -> Row:
+    """(emp_id, name, salary, role, department, programming_language)"""
+    if isinstance(employee, Manager):
+        return (employee.emp_id, employee.name, employee.salary, "manager", employee.department, None)
+    if isinstance(employee, Developer):
+        return (employee.emp_id, employee.name, employee.salary, "developer", None,
+                employee.programming_language)
+    return (employee.emp_id, employee.name, employee.salary, "employee", None, None)
+
+
+def from_row(row: Row) -> Employee:
+    emp_id, name, salary, role, department, language = row
+    if role == "manager":
+        return Manager(name, emp_id, salary, department)
+    if role == "developer":
+        return Developer(name, emp_id, salary, language)
+    return Employee(name, emp_id, salary)
+
+
+class EmployeeDirectory:
+    """
+    Durable employee storage with lookup by ID, department and language.
+    """
+    def __init__(self, db_file: str = DB_FILE, cache_size: int = CACHE_SIZE):
+        self.db_file = db_file
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Row]" = OrderedDict()
+        self._conn = sqlite3.connect(db_file)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS employees ("
+            " emp_id TEXT PRIMARY KEY,"
+            " name TEXT NOT NULL,"
+            " salary REAL NOT NULL,"
+            " role TEXT NOT NULL,"
+            " department TEXT,"
+            " programming_language TEXT"
+            ") WITHOUT ROWID"
+        )
+        # Partial indexes: only managers have a department, only developers a language
+        self._conn.execute("CREATE INDEX IF NOT EXISTS by_department ON employees (department)"
+                           " WHERE department IS NOT NULL")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS by_language ON employees (programming_language)"
+                           " WHERE programming_language IS NOT NULL")
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "EmployeeDirectory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------- cache ----------
+    def _remember(self, row: Row) -> None:
+        emp_id = row[0]
+        self._cache[emp_id] = row
+        self._cache.move_to_end(emp_id)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # ---------- writing ----------
+    def add(self, employee: Employee) -> None:
+        """
+        Store a new employee. Raises ValueError if the ID is taken.
+        """
+        row = to_row(employee)
+        try:
+            with self._conn:
+                self._conn.execute("INSERT INTO employees VALUES (?, ?, ?, ?, ?, ?)", row)
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Employee ID already exists: {employee.emp_id}") from None
+        self._remember(row)
+
+    def add_many(self, employees: Iterable[Employee]) -> int:
+        """
+        Store many new employees in one transaction (all or nothing).
+        Returns how many were added.
+        """
+        before = self._conn.total_changes
+        try:
+            with self._conn:
+                self._conn.executemany("INSERT INTO employees VALUES (?, ?, ?, ?, ?, ?)",
+                                       map(to_row, employees))
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Duplicate employee ID: {e}") from None
+        return self._conn.total_changes - before
+
+    def save(self, employee: Employee) -> None:
+        """
+        Store an existing employee again after changing it (e.g. a raise).
+        """
+        row = to_row(employee)
+        with self._conn:
+            cursor = self._conn.execute(
+                "UPDATE employees SET name = ?, salary = ?, role = ?, department = ?,"
+                " programming_language = ? WHERE emp_id = ?", row[1:] + row[:1])
+        if cursor.rowcount == 0:
+            raise KeyError(f"No employee with ID {employee.emp_id}")
+        self._remember(row)
+
+    def remove(self, emp_id: str) -> None:
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM employees WHERE emp_id = ?", (emp_id,))
+        self._cache.pop(emp_id, None)
+        if cursor.rowcount == 0:
+            raise KeyError(f"No employee with ID {emp_id}")
+
+    # ---------- lookups ----------
+    def get(self, emp_id: str) -> Optional[Employee]:
+        """
+        The employee with emp_id, or None. Every call returns a new object:
+        changes to it are only stored (and seen by later calls) after save().
+        """
+        row = self._cache.get(emp_id)
+        if row is not None:
+            self._cache.move_to_end(emp_id)
+            return from_row(row)
+        row = self._conn.execute("SELECT * FROM employees WHERE emp_id = ?", (emp_id,)).fetchone()
+        if row is None:
+            return None
+        self._remember(row)
+        return from_row(row)
+
+    def __contains__(self, emp_id: str) -> bool:
+        if emp_id in self._cache:
+            return True
+        return self._conn.execute("SELECT 1 FROM employees WHERE emp_id = ?",
+                                  (emp_id,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+    def by_department(self, department: str) -> List[Manager]:
+        rows = self._conn.execute("SELECT * FROM employees WHERE department = ?", (department,))
+        return [from_row(row) for row in rows]
+
+    def by_language(self, programming_language: str) -> List[Developer]:
+        rows = self._conn.execute("SELECT * FROM employees WHERE programming_language = ?",
+                                  (programming_language,))
+        return [from_row(row) for row in rows]
+
+    def __iter__(self) -> Iterator[Employee]:
+        """
+        Every employee, in emp_id order, streamed from the file.
+        """
+        for row in self._conn.execute("SELECT * FROM employees ORDER BY emp_id"):
+            yield from_row(row)
+
+    def to_payroll(self):
+        """
+        A PayrollTable (payroll.py) with every employee, for batch payroll.
+        """
+        from payroll import PayrollTable
+
+        table = PayrollTable()
+        for emp_id, name, salary, role, department, language in self._conn.execute(
+                "SELECT * FROM employees ORDER BY emp_id"):
+            table.add(name, emp_id, salary, role, department, language)
+        return table
+
+
+# ----------------------------------------
+# Benchmark: fill, startup and lookups at 1M employees
+# ----------------------------------------
+def benchmark(count: int = 1_000_000, lookups: int = 100_000,
+              db_file: str = "bench_employees.db") -> None:
+    import random
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_file + suffix):
+            os.remove(db_file + suffix)
+    departments = ["IT", "HR", "Finance", "Sales", "Ops"]
+    languages = ["Python", "Go", "Java", "Rust", "C#"]
+
+    def people() -> Iterator[Employee]:
+        for i in range(count):
+            salary = random.randint(3_000, 12_000)
+            if i % 3 == 1:
+                yield Manager(f"Mgr{i}", f"E{i:08d}", salary, random.choice(departments))
+            elif i % 3 == 2:
+                yield Developer(f"Dev{i}", f"E{i:08d}", salary, random.choice(languages))
+            else:
+                yield Employee(f"Emp{i}", f"E{i:08d}", salary)
+
+    start = time.perf_counter()
+    with EmployeeDirectory(db_file) as directory:
+        directory.add_many(people())
+    print(f"Stored {count:,} employees in {time.perf_counter() - start:.1f} s")
+
+    start = time.perf_counter()
+    directory = EmployeeDirectory(db_file)
+    first = directory.get(f"E{count // 2:08d}")
+    print(f"Startup + first lookup: {(time.perf_counter() - start) * 1e3:.1f} ms ({first.name})")
+
+    ids = [f"E{random.randrange(count):08d}" for _ in range(lookups)]
+    directory._cache.clear()
+    start = time.perf_counter()
+    for emp_id in ids:
+        directory.get(emp_id)
+    elapsed = time.perf_counter() - start
+    print(f"get(emp_id): {lookups / elapsed:,.0f}/s ({elapsed / lookups * 1e6:.1f} µs each)")
+
+    start = time.perf_counter()
+    it_managers = directory.by_department("IT")
+    print(f"by_department('IT'): {len(it_managers):,} managers in "
+          f"{(time.perf_counter() - start) * 1e3:.0f} ms")
+    start = time.perf_counter()
+    rust = directory.by_language("Rust")
+    print(f"by_language('Rust'): {len(rust):,} developers in "
+          f"{(time.perf_counter() - start) * 1e3:.0f} ms")
+
+    directory.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_file + suffix):
+            os.remove(db_file + suffix)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,279 @@
+# -------------------------------
+# 🗂️ Notes Store with Search
+# -------------------------------
+# Keeps notes.txt as an append-only log, one record per line:
+#   <id>\t<text>   add a note, or replace the text of an existing id (edit)
+#   -<id>          tombstone: the note was deleted
+# Lines without an id (notes written by older versions) get their line
+# number as id. IDs never change, not even when compact() rewrites the
+# file without the deleted and overwritten records.
+#
+# Search uses an in-memory inverted index: word -> {note id: [positions]}.
+# Positions make "exact phrase" queries possible. The index is updated on
+# every add/edit/delete, so it never has to be rebuilt.
+#
+# Records are appended through the program's shared append writer for
+# notes.txt, which is flushed every second and when the program exits;
+# call flush() before reading notes.txt directly.
+
+import os
+import re
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Make the shared append_writer module (repo root) importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from append_writer import flush_file, get_writer
+
+WORD = re.compile(r"\w+")
+RECORD = re.compile(r"(\d+)\t(.*)")
+TOMBSTONE = re.compile(r"-(\d+)")
+
+
+def tokenize(text: str) -> List[str]:
+    return WORD.findall(text.lower())
+
+
+def parse_record(line: str, line_number: int) -> Optional[Tuple[int, Optional[str]]]:
+    """
+    Decode one line of the notes file into (id, text).
+    text is None for a tombstone; blank lines give None.
+    line_number (1-based) is the id of a legacy plain-text note.
+    """
+    match = RECORD.fullmatch(line)
+    if match:
+        return int(match.group(1)), match.group(2)
+    match = TOMBSTONE.fullmatch(line)
+    if match:
+        return int(match.group(1)), None
+    if line == "":
+        return None
+    return line_number, line
+
+
+class NotesStore:
+    """
+    Notes with stable IDs, stored in an append-only file and indexed for search.
+    """
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self._notes: Dict[int, str] = {}
+        self._index: Dict[str, Dict[int, List[int]]] = {}
+        self._next_id = 1
+        self._dead_records = 0  # lines compact() would drop
+        flush_file(file_name)  # another store in this program may still have ids buffered
+        self._load()
+        self._writer = get_writer(file_name)
+
+    # ---------- loading ----------
+    def _load(self) -> None:
+        try:
+            with open(self.file_name, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    self._apply(line.rstrip("\n"), line_number)
+        except FileNotFoundError:
+            return
+        for note_id, text in self._notes.items():
+            self._index_note(note_id, text)
+
+    def _apply(self, line: str, line_number: int) -> None:
+        # Replay one log record into self._notes
+        record = parse_record(line, line_number)
+        if record is None:
+            return
+        note_id, text = record
+        self._next_id = max(self._next_id, note_id + 1)
+        if text is None:
+            self._notes.pop(note_id, None)
+            self._dead_records += 2  # the tombstone and the note it hides
+            return
+        if note_id in self._notes:
+            self._dead_records += 1
+        self._notes[note_id] = text
+
+    # ---------- index maintenance ----------
+    def _index_note(self, note_id: int, text: str) -> None:
+        for position, word in enumerate(tokenize(text)):
+            self._index.setdefault(word, {}).setdefault(note_id, []).append(position)
+
+    def _unindex_note(self, note_id: int, text: str) -> None:
+        for word in set(tokenize(text)):
+            postings = self._index.get(word)
+            if postings is not None:
+                postings.pop(note_id, None)
+                if not postings:
+                    del self._index[word]
+
+    def _write(self, record: str) -> None:
+        self._writer.write(record + "\n")
+
+    def flush(self) -> None:
+        """
+        Make sure every change so far is written to the notes file.
+        """
+        self._writer.flush()
+
+    def close(self) -> None:
+        # The shared writer stays open for other users of the file
+        self._writer.flush()
+
+    # ---------- public API ----------
+    def __len__(self) -> int:
+        return len(self._notes)
+
+    def __contains__(self, note_id: int) -> bool:
+        return note_id in self._notes
+
+    def get(self, note_id: int) -> Optional[str]:
+        return self._notes.get(note_id)
+
+    def notes(self) -> Iterator[Tuple[int, str]]:
+        """
+        (id, text) for every live note, oldest first.
+        """
+        return iter(self._notes.items())
+
+    def add(self, text: str) -> int:
+        """
+        Store a new note and return its id.
+        """
+        text = " ".join(text.split())  # one line, no tabs
+        if text == "":
+            raise ValueError("Note cannot be empty!")
+        note_id = self._next_id
+        self._write(f"{note_id}\t{text}")
+        self._next_id += 1
+        self._notes[note_id] = text
+        self._index_note(note_id, text)
+        return note_id
+
+    def edit(self, note_id: int, text: str) -> None:
+        if note_id not in self._notes:
+            raise KeyError(f"No note with id {note_id}")
+        text = " ".join(text.split())
+        if text == "":
+            raise ValueError("Note cannot be empty!")
+        self._write(f"{note_id}\t{text}")
+        self._unindex_note(note_id, self._notes[note_id])
+        self._notes[note_id] = text
+        self._index_note(note_id, text)
+        self._dead_records += 1
+
+    def delete(self, note_id: int) -> None:
+        if note_id not in self._notes:
+            raise KeyError(f"No note with id {note_id}")
+        self._write(f"-{note_id}")
+        self._unindex_note(note_id, self._notes.pop(note_id))
+        self._dead_records += 2
+        if self._dead_records > max(1000, len(self._notes)):
+            self.compact()
+
+    def clear(self) -> None:
+        """
+        Delete every note. IDs are not reused.
+        """
+        self._writer.flush()
+        with open(self.file_name, "w", encoding="utf-8") as f:
+            if self._next_id > 1:
+                # Keep the id counter: a tombstone for the last id used
+                f.write(f"-{self._next_id - 1}\n")
+        self._writer.reopen()
+        self._notes.clear()
+        self._index.clear()
+        self._dead_records = 0
+
+    def compact(self) -> None:
+        """
+        Rewrite the file with only the live notes, keeping their ids.
+        """
+        self._writer.flush()
+        temp = self.file_name + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            for note_id, text in self._notes.items():
+                f.write(f"{note_id}\t{text}\n")
+            if self._next_id - 1 not in self._notes and self._next_id > 1:
+                f.write(f"-{self._next_id - 1}\n")  # remember the id counter
+        os.replace(temp, self.file_name)
+        self._writer.reopen()  # the old file handle points at the replaced file
+        self._dead_records = 0
+
+    # ---------- search ----------
+    def _phrase_ids(self, words: List[str]) -> set:
+        # Notes containing all words in order, next to each other
+        postings = [self._index.get(word, {}) for word in words]
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting.keys()
+        matches = set()
+        for note_id in candidates:
+            for start in postings[0][note_id]:
+                if all(start + offset in postings[offset][note_id]
+                       for offset in range(1, len(words))):
+                    matches.add(note_id)
+                    break
+        return matches
+
+    def search(self, query: str) -> List[Tuple[int, str]]:
+        """
+        Notes matching every word of query. Text inside double quotes must
+        appear as an exact phrase:  python "file handling"
+        """
+        parts = query.split('"')
+        groups = []
+        for i, part in enumerate(parts):
+            words = tokenize(part)
+            if not words:
+                continue
+            if i % 2 == 1:
+                groups.append(words)  # quoted phrase
+            else:
+                groups.extend([word] for word in words)
+        if not groups:
+            return []
+
+        # Start from the rarest term so the intersection stays small
+        groups.sort(key=lambda words: min(len(self._index.get(w, {})) for w in words))
+        result: Optional[set] = None
+        for words in groups:
+            ids = set(self._index.get(words[0], {})) if len(words) == 1 else self._phrase_ids(words)
+            result = ids if result is None else result & ids
+            if not result:
+                return []
+        return [(note_id, self._notes[note_id]) for note_id in sorted(result)]
+
+
+# -------------------------------
+# Benchmark: one million notes
+# -------------------------------
+def benchmark(count: int = 1_000_000, file_name: str = "bench_notes.txt") -> None:
+    import random
+    import time
+
+    words = ("python file loop list dict class object error notes search index "
+             "read write append exception function module test data string").split()
+    with open(file_name, "w", encoding="utf-8") as f:
+        for note_id in range(1, count + 1):
+            f.write(f"{note_id}\t{' '.join(random.choices(words, k=8))} {note_id}\n")
+
+    start = time.perf_counter()
+    store = NotesStore(file_name)
+    print(f"Loaded and indexed {len(store):,} notes in {time.perf_counter() - start:.1f}s")
+
+    for query in ['python', 'python "file handling"', 'read write append', '"loop list"',
+                  str(count // 2)]:
+        start = time.perf_counter()
+        hits = len(store.search(query))
+        print(f"search({query!r}): {hits:,} hits in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        store.add("incremental note about python search")
+    print(f"add(): {(time.perf_counter() - start):.3f} ms each (incl. index update)")
+    store.close()
+    os.remove(file_name)
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,374 @@
+# ----------------------------------------
+# 💵 Payroll Table for Employee / Manager / Developer
+# ----------------------------------------
+# Stores staff column by column instead of one object each:
+#   role codes     array of small ints (0 employee, 1 manager, 2 developer)
+#   salaries       array of float64 monthly salaries
+#   department /   dictionary-encoded: each distinct name is stored once,
+#   language       rows hold its code (-1 = none)
+# so yearly totals, per-department / per-language sums and raises run
+# over whole arrays at once (NumPy when installed, plain loops otherwise).
+#
+# The Day 18 classes still work: table.get("M101") returns a ManagerView,
+# which *is* a Manager (display_info(), yearly_salary()...) but reads and
+# writes its attributes straight from/to the table row.
+#
+# Every change bumps table.version and the row's row_version(), so
+# anything cached from a row can tell when it is out of date. Views are
+# created on every lookup, so what is cached about a row (the rendered
+# report lines of report_render.py) is kept on the table, in view._cache.
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from day_18 import Developer, Employee, Manager
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+EMPLOYEE, MANAGER, DEVELOPER = 0, 1, 2
+ROLE_NAMES = {EMPLOYEE: "employee", MANAGER: "manager", DEVELOPER: "developer"}
+ROLE_CODES = {name: code for code, name in ROLE_NAMES.items()}
+NONE = -1  # code for "no department / language"
+
+
+class _Dictionary:
+    """
+    Distinct strings stored once, each with a small integer code.
+    """
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, code: int) -> Optional[str]:
+        return None if code == NONE else self.values[code]
+
+
+class PayrollTable:
+    """
+    Columnar employee table; rows never move, so a row number is stable.
+    """
+    def __init__(self):
+        self._names: List[str] = []
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}   # emp_id -> row
+        self._roles = array("b")
+        self._salaries = array("d")
+        self._departments = array("i")
+        self._languages = array("i")
+        self._row_versions = array("L")
+        self.departments = _Dictionary()
+        self.languages = _Dictionary()
+        self.version = 0
+        self._row_caches: Dict[int, dict] = {}  # row -> view._cache
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, emp_id: str) -> bool:
+        return emp_id in self._rows
+
+    # ---------- adding rows ----------
+    def add(self, name: str, emp_id: str, salary: float, role: str = "employee",
+            department: Optional[str] = None, programming_language: Optional[str] = None) -> int:
+        """
+        Add one employee and return its row number.
+        """
+        if emp_id in self._rows:
+            raise ValueError(f"Employee ID already exists: {emp_id}")
+        try:
+            code = ROLE_CODES[role]
+        except KeyError:
+            raise ValueError(f"role must be one of {', '.join(ROLE_CODES)}, not {role!r}") from None
+        row = len(self._ids)
+        self._names.append(name)
+        self._ids.append(emp_id)
+        self._rows[emp_id] = row
+        self._roles.append(code)
+        self._salaries.append(salary)
+        self._departments.append(self.departments.encode(department))
+        self._languages.append(self.languages.encode(programming_language))
+        self._row_versions.append(0)
+        self.version += 1
+        return row
+
+    def add_employee(self, employee: Employee) -> int:
+        """
+        Copy a Day 18 Employee / Manager / Developer object into the table.
+        """
+        if isinstance(employee, Manager):
+            return self.add(employee.name, employee.emp_id, employee.salary, "manager",
+                            department=employee.department)
+        if isinstance(employee, Developer):
+            return self.add(employee.name, employee.emp_id, employee.salary, "developer",
+                            programming_language=employee.programming_language)
+        return self.add(employee.name, employee.emp_id, employee.salary)
+
+    def extend(self, employees: Iterable[Employee]) -> None:
+        for employee in employees:
+            self.add_employee(employee)
+
+    # ---------- single rows ----------
+    def row_of(self, emp_id: str) -> int:
+        try:
+            return self._rows[emp_id]
+        except KeyError:
+            raise KeyError(f"No employee with ID {emp_id}") from None
+
+    def row_version(self, row: int) -> int:
+        return self._row_versions[row]
+
+    def _changed(self, row: int) -> None:
+        self._row_versions[row] += 1
+        self.version += 1
+
+    def role(self, row: int) -> str:
+        return ROLE_NAMES[self._roles[row]]
+
+    def record(self, row: int) -> Tuple[str, str, float, str, Optional[str], Optional[str]]:
+        """(name, emp_id, salary, role, department, programming_language) of a row."""
+        return (self._names[row], self._ids[row], self._salaries[row], ROLE_NAMES[self._roles[row]],
+                self.departments.decode(self._departments[row]),
+                self.languages.decode(self._languages[row]))
+
+    def get(self, emp_id: str) -> Employee:
+        """
+        The Day 18 object for emp_id, as a live view over its row.
+        """
+        return self.view(self.row_of(emp_id))
+
+    def view(self, row: int) -> Employee:
+        return _VIEWS[self._roles[row]](self, row)
+
+    def __iter__(self) -> Iterator[Employee]:
+        for row in range(len(self._ids)):
+            yield self.view(row)
+
+    # ---------- whole-table calculations ----------
+    def _mask(self, role: Optional[str], department: Optional[str],
+              programming_language: Optional[str]):
+        # Rows matching every filter given: a NumPy bool array, or a list of rows
+        # (most selective column first: it leaves the fewest rows to check)
+        checks = []
+        if department is not None:
+            checks.append((self._departments, self.departments.codes.get(department, -2)))
+        if programming_language is not None:
+            checks.append((self._languages, self.languages.codes.get(programming_language, -2)))
+        if role is not None:
+            checks.append((self._roles, ROLE_CODES[role]))
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            for column, code in checks:
+                mask &= np.frombuffer(column, dtype=column.typecode) == code
+            return mask
+        if not checks:
+            return range(len(self))
+        (column, code), rest = checks[0], checks[1:]
+        rows = [row for row, value in enumerate(column) if value == code]
+        for column, code in rest:
+            rows = [row for row in rows if column[row] == code]
+        return rows
+
+    def yearly_salaries(self):
+        """Every row's yearly salary (NumPy array, or array('d'))."""
+        if np is not None:
+            return np.frombuffer(self._salaries, dtype=np.float64) * 12
+        return array("d", [salary * 12 for salary in self._salaries])
+
+    def total_yearly(self, role: Optional[str] = None, department: Optional[str] = None,
+                     programming_language: Optional[str] = None) -> float:
+        """
+        Yearly payroll, optionally only for one role / department / language.
+        """
+        if role is None and department is None and programming_language is None:
+            return sum(self._salaries) * 12
+        mask = self._mask(role, department, programming_language)
+        if np is not None:
+            return float(np.frombuffer(self._salaries, dtype=np.float64)[mask].sum() * 12)
+        salaries = self._salaries
+        return sum(salaries[row] for row in mask) * 12
+
+    def _totals_by(self, codes: array, dictionary: _Dictionary) -> Dict[str, float]:
+        if np is not None:
+            column = np.frombuffer(codes, dtype=codes.typecode)
+            present = column != NONE
+            sums = np.bincount(column[present], np.frombuffer(self._salaries, dtype=np.float64)[present],
+                               minlength=len(dictionary.values))
+            return {value: float(total) * 12 for value, total in zip(dictionary.values, sums)}
+        sums = [0.0] * len(dictionary.values)
+        for code, salary in zip(codes, self._salaries):
+            if code != NONE:
+                sums[code] += salary
+        return {value: total * 12 for value, total in zip(dictionary.values, sums)}
+
+    def yearly_by_department(self) -> Dict[str, float]:
+        """Yearly salary total of the managers in each department."""
+        return self._totals_by(self._departments, self.departments)
+
+    def yearly_by_language(self) -> Dict[str, float]:
+        """Yearly salary total of the developers for each language."""
+        return self._totals_by(self._languages, self.languages)
+
+    def yearly_by_role(self) -> Dict[str, float]:
+        return {name: self.total_yearly(role=name) for name in ROLE_CODES}
+
+    def give_raise(self, percent: float, role: Optional[str] = None, department: Optional[str] = None,
+                   programming_language: Optional[str] = None) -> int:
+        """
+        Raise the monthly salary of every matching row by percent.
+        Returns how many employees got the raise.
+        """
+        factor = 1 + percent / 100
+        mask = self._mask(role, department, programming_language)
+        if np is not None:
+            salaries = np.frombuffer(self._salaries, dtype=np.float64)
+            salaries[mask] *= factor
+            versions = np.frombuffer(self._row_versions, dtype=self._row_versions.typecode)
+            versions[mask] += 1
+            count = int(mask.sum())
+            del salaries, versions  # release the buffers so the arrays can grow again
+        else:
+            salaries, versions = self._salaries, self._row_versions
+            for row in mask:
+                salaries[row] *= factor
+                versions[row] += 1
+            count = len(mask)
+        if count:
+            self.version += 1
+        return count
+
+
+# ----------------------------------------
+# Day 18 classes as views over table rows
+# ----------------------------------------
+def _column(column: str, decode: Optional[str] = None):
+    # Property reading/writing one column of the view's row
+    def getter(self):
+        value = getattr(self._table, column)[self._row]
+        return getattr(self._table, decode).decode(value) if decode else value
+
+    def setter(self, value):
+        table = self._table
+        if decode:
+            value = getattr(table, decode).encode(value)
+        getattr(table, column)[self._row] = value
+        table._changed(self._row)
+    return property(getter, setter)
+
+
+class _RowView:
+    """
+    Mixin: attributes come from PayrollTable row self._row. __init__ of
+    the Day 18 class is not called; there is nothing to copy.
+    """
+    def __init__(self, table: PayrollTable, row: int):
+        self._table = table
+        self._row = row
+
+    name = _column("_names")
+    salary = _column("_salaries")
+
+    @property
+    def emp_id(self) -> str:
+        return self._table._ids[self._row]
+
+    @property
+    def row_version(self) -> int:
+        return self._table._row_versions[self._row]
+
+    _version = row_version  # what report_render.py checks for changes
+
+    @property
+    def _cache(self) -> dict:
+        # Lives on the table, so it outlasts this view object
+        return self._table._row_caches.setdefault(self._row, {})
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.emp_id!r}, row={self._row})"
+
+
+class EmployeeView(_RowView, Employee):
+    pass
+
+
+class ManagerView(_RowView, Manager):
+    department = _column("_departments", "departments")
+
+
+class DeveloperView(_RowView, Developer):
+    programming_language = _column("_languages", "languages")
+
+
+_VIEWS = {EMPLOYEE: EmployeeView, MANAGER: ManagerView, DEVELOPER: DeveloperView}
+
+
+# ----------------------------------------
+# Benchmark: one object at a time vs the table
+# ----------------------------------------
+def benchmark(count: int = 500_000) -> None:
+    import random
+    import time
+
+    departments = ["IT", "HR", "Finance", "Sales", "Ops"]
+    languages = ["Python", "Go", "Java", "Rust", "C#"]
+    people: List[Employee] = []
+    for i in range(count):
+        salary = random.randint(3_000, 12_000)
+        kind = i % 3
+        if kind == 0:
+            people.append(Employee(f"Emp{i}", f"E{i}", salary))
+        elif kind == 1:
+            people.append(Manager(f"Mgr{i}", f"M{i}", salary, random.choice(departments)))
+        else:
+            people.append(Developer(f"Dev{i}", f"D{i}", salary, random.choice(languages)))
+    table = PayrollTable()
+    table.extend(people)
+    print(f"{count:,} employees, table uses {'NumPy' if np is not None else 'pure Python'}")
+
+    def timed(label: str, objects, columnar) -> None:
+        start = time.perf_counter()
+        expected = objects()
+        loop = time.perf_counter() - start
+        start = time.perf_counter()
+        result = columnar()
+        fast = time.perf_counter() - start
+        assert abs(expected - result) <= 1e-6 * abs(expected), label
+        print(f"{label:<28} objects {loop * 1e3:8.1f} ms   table {fast * 1e3:8.1f} ms")
+
+    timed("total yearly payroll", lambda: sum(p.yearly_salary() for p in people),
+          table.total_yearly)
+
+    def by_department():
+        totals: Dict[str, float] = {}
+        for p in people:
+            if isinstance(p, Manager):
+                totals[p.department] = totals.get(p.department, 0) + p.yearly_salary()
+        return sum(totals.values())
+    timed("yearly by department", by_department, lambda: sum(table.yearly_by_department().values()))
+
+    def raise_python():
+        raised = 0
+        for p in people:
+            if isinstance(p, Developer) and p.programming_language == "Python":
+                p.salary *= 1.05
+                raised += 1
+        return raised
+    timed("5% raise for Python devs", raise_python,
+          lambda: table.give_raise(5, role="developer", programming_language="Python"))
+    timed("total after the raise", lambda: sum(p.yearly_salary() for p in people),
+          table.total_yearly)
+
+
+if __name__ == "__main__":
+    benchmark()
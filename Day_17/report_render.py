@@ -0,0 +1,174 @@
+# ----------------------------------------
+# 🖨️ Employee Reports (text table, CSV, JSON lines)
+# ----------------------------------------
+# Renders any number of Day 18 employees (a list, an EmployeeDirectory,
+# a PayrollTable...) into one output:
+# - every employee becomes one row; rows are collected in a buffer and
+#   written BUFFER_CHARS at a time, instead of several print() calls per
+#   employee
+# - input is consumed as a stream, so a directory of millions of
+#   employees never has to be in memory at once
+# - each employee keeps its rendered row per format; the row is reused
+#   until an attribute changes (Employee._version, or the table row
+#   version for payroll views). Payroll views are new objects on every
+#   lookup, so their rows are cached on the table (view._cache) and
+#   repeated reports of one PayrollTable are cache hits too. Filling the
+#   cache costs time and memory, so pass cache=False for one-off streams
+#   of fresh objects (e.g. iterating an EmployeeDirectory)
+
+import json
+import sys
+from typing import Iterable, Optional, TextIO
+
+from day_18 import Developer, Employee, Manager
+
+FORMATS = ("text", "csv", "jsonl")
+BUFFER_CHARS = 64 * 1024  # characters collected before each write
+TEXT_HEADER = f"{'Role':<10} {'ID':<10} {'Name':<20} {'Salary':>12}  Department / Language\n"
+CSV_HEADER = "role,emp_id,name,salary,department,programming_language\n"
+
+
+def _role(employee: Employee) -> str:
+    if isinstance(employee, Manager):
+        return "Manager"
+    if isinstance(employee, Developer):
+        return "Developer"
+    return "Employee"
+
+
+_CACHE_KEYS = {fmt: f"_rendered_{fmt}" for fmt in FORMATS}  # one (version, row) per format
+
+
+def _csv_field(value) -> str:
+    text = "" if value is None else str(value)
+    if any(c in text for c in ',"\n\r'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _render(employee: Employee, fmt: str) -> str:
+    role = _role(employee)
+    department = getattr(employee, "department", None)
+    language = getattr(employee, "programming_language", None)
+    if fmt == "text":
+        extra = department if department is not None else (language or "")
+        return (f"{role:<10} {employee.emp_id:<10} {employee.name:<20} "
+                f"{'$' + str(employee.salary):>12}  {extra}\n")
+    if fmt == "csv":
+        values = (role.lower(), employee.emp_id, employee.name, employee.salary, department, language)
+        line = ",".join("" if v is None else str(v) for v in values)
+        if line.count(",") != 5 or '"' in line or "\n" in line or "\r" in line:
+            line = ",".join(_csv_field(v) for v in values)  # something needs quoting
+        return line + "\n"
+    record = {"role": role.lower(), "emp_id": employee.emp_id, "name": employee.name,
+              "salary": employee.salary}
+    if department is not None:
+        record["department"] = department
+    if language is not None:
+        record["programming_language"] = language
+    return json.dumps(record) + "\n"
+
+
+def render_row(employee: Employee, fmt: str = "text") -> str:
+    """
+    One employee as one line of fmt, reused while the employee is unchanged.
+    """
+    version = getattr(employee, "_version", 0)
+    key = _CACHE_KEYS[fmt]
+    # Written directly: caching is not an attribute change
+    state = getattr(employee, "_cache", None)
+    if state is None:
+        state = employee.__dict__
+    hit = state.get(key)
+    if hit is not None and hit[0] == version:
+        return hit[1]
+    text = _render(employee, fmt)
+    state[key] = (version, text)
+    return text
+
+
+def header(fmt: str = "text") -> str:
+    return {"text": TEXT_HEADER, "csv": CSV_HEADER, "jsonl": ""}[fmt]
+
+
+def render(employees: Iterable[Employee], out: Optional[TextIO] = None, fmt: str = "text",
+           buffer_chars: int = BUFFER_CHARS, cache: bool = True) -> int:
+    """
+    Write a report of employees to out (default: the screen).
+    Returns how many employees were written.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"fmt must be one of {FORMATS}, not {fmt!r}")
+    out = out or sys.stdout
+    row_of = render_row if cache else _render
+    parts = [header(fmt)]
+    size = len(parts[0])
+    count = 0
+    for employee in employees:
+        row = row_of(employee, fmt)
+        parts.append(row)
+        size += len(row)
+        count += 1
+        if size >= buffer_chars:
+            out.write("".join(parts))
+            parts.clear()
+            size = 0
+    out.write("".join(parts))
+    return count
+
+
+def render_to_file(employees: Iterable[Employee], file_name: str, fmt: str = "text",
+                   cache: bool = True) -> int:
+    with open(file_name, "w", encoding="utf-8", newline="") as f:
+        return render(employees, f, fmt, cache=cache)
+
+
+# ----------------------------------------
+# Benchmark: display_info() per employee vs render()
+# ----------------------------------------
+def benchmark(count: int = 200_000) -> None:
+    import contextlib
+    import io
+    import os
+    import random
+    import time
+
+    people = []
+    for i in range(count):
+        salary = random.randint(3_000, 12_000)
+        if i % 3 == 1:
+            people.append(Manager(f"Mgr{i}", f"M{i}", salary, random.choice(["IT", "HR", "Ops"])))
+        elif i % 3 == 2:
+            people.append(Developer(f"Dev{i}", f"D{i}", salary, random.choice(["Python", "Go"])))
+        else:
+            people.append(Employee(f"Emp{i}", f"E{i}", salary))
+
+    with open(os.devnull, "w") as devnull:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(devnull):
+            for person in people:
+                person.display_info()
+        print(f"{'display_info() for each':<32} {time.perf_counter() - start:.2f} s")
+
+        for fmt in FORMATS:
+            start = time.perf_counter()
+            render(people, devnull, fmt, cache=False)
+            uncached = time.perf_counter() - start
+            start = time.perf_counter()
+            render(people, devnull, fmt)
+            cold = time.perf_counter() - start
+            start = time.perf_counter()
+            render(people, devnull, fmt)
+            warm = time.perf_counter() - start
+            print(f"{'render(' + fmt + ')':<32} {uncached:.2f} s no cache, "
+                  f"{cold:.2f} s filling cache, {warm:.2f} s cached")
+
+    for person in people[:count // 10]:
+        person.salary += 100  # a tenth of the rows must be rebuilt
+    start = time.perf_counter()
+    render(people, io.StringIO())
+    print(f"{'render(text), 10% changed':<32} {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    benchmark()
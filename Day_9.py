@@ -3,13 +3,19 @@
 # Concepts used: File Handling, Functions, Error Handling, Dictionaries
 # ------------------------------------------
 
+import datetime
+
+# The ledger keeps running totals next to the file, so the summary
+# does not have to re-read every expense each time
+from expense_ledger import ExpenseLedger
+from expense_analytics import ExpenseAnalytics
+
+
 # Define a function to add a new expense entry
 def add_expense(file_name, category, amount):
     try:
-        # Open the file in 'append' mode ('a') to add data without deleting previous entries
-        with open(file_name, 'a') as f:
-            # Write the expense details (category and amount) separated by a comma
-            f.write(f"{category},{amount}\n")
+        # Append "category,amount,timestamp" to the file (locked, so several programs can add at once)
+        ExpenseLedger(file_name).add(category, amount)
         # Print confirmation message when expense is successfully recorded
         print("✅ Expense recorded successfully.")
     
@@ -20,18 +26,9 @@ def add_expense(file_name, category, amount):
 
 # Define a function to show the total expenses by category
 def show_summary(file_name):
-    # Create an empty dictionary to store total expenses per category
-    expenses = {}
-    
     try:
-        # Open the file in read mode ('r') to read all recorded expenses
-        with open(file_name, 'r') as f:
-            # Loop through each line in the file
-            for line in f:
-                # Remove any extra spaces or newline characters, then split by comma
-                category, amount = line.strip().split(',')
-                # Convert amount from string to float and add it to the correct category
-                expenses[category] = expenses.get(category, 0) + float(amount)
+        # Get the total per category; only lines added since the last summary are parsed
+        expenses = ExpenseLedger(file_name).totals()
         
         # Print the final summary of all expenses grouped by category
         print("\n💰 Expense Summary:")
@@ -47,6 +44,26 @@ def show_summary(file_name):
         print("⚠️ Error reading file:", e)
 
 
+# Define a function to show month-by-month spending for one year
+def show_monthly_summary(file_name, year):
+    try:
+        # Range sums over the ledger's daily buckets (no rescan of the file)
+        analytics = ExpenseAnalytics.from_file(file_name)
+
+        print(f"\n📅 Monthly Expenses for {year}:")
+        for month, total in analytics.monthly(year):
+            if total:
+                print(f"  - {datetime.date(year, month, 1):%B}: {total} birr")
+
+    # Handle the case where the file does not exist
+    except FileNotFoundError:
+        print("⚠️ No expense records found. Please add some expenses first.")
+
+    # Handle any other general error
+    except Exception as e:
+        print("⚠️ Error reading file:", e)
+
+
 # ------------------------------------------
 # 🧪 Example usage of the functions
 # ------------------------------------------
@@ -59,3 +76,6 @@ add_expense("expenses.txt", "Food", 70)
 
 # Display the total summary of expenses
 show_summary("expenses.txt")
+
+# Display this year's spending month by month
+show_monthly_summary("expenses.txt", datetime.date.today().year)
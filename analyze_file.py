@@ -0,0 +1,183 @@
+# ------------------------------------------
+# 🔢 Parallel Number Analysis for large files
+# ------------------------------------------
+# Usage:
+#   python analyze_file.py numbers.txt [--workers N] [--chunk-mb 16]
+#   python analyze_file.py readings.bin          (raw float64 values)
+#   python analyze_file.py --benchmark 500
+# - Gives the same report as analyze_stream() in day5_list_analysis.py:
+#   count, sum, min, max, average, variance, approximate median and
+#   percentiles, and the exact largest/smallest values
+# - The file is memory-mapped and cut into chunks (on whitespace/comma
+#   boundaries for text, on 8-byte boundaries for binary); each worker
+#   process summarizes its chunks into RunningStats + KLLSketch + TopK,
+#   and the parent merges the partial results
+# - --benchmark times the same file with 1, 2, ... N workers
+
+import argparse
+import mmap
+import os
+import sys
+import time
+from array import array
+from multiprocessing import Pool
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from quantile_sketch import KLLSketch, TopK
+from streaming_stats import RunningStats
+
+CHUNK_MB = 16  # default size of one unit of work
+TOP = 5        # largest/smallest values reported
+SEPARATORS = b" \t\r\n,"
+
+Task = Tuple[str, int, int, bool]  # (file name, start, end, binary)
+
+
+class Summary(NamedTuple):
+    stats: RunningStats
+    sketch: KLLSketch
+    largest: TopK
+    smallest: TopK
+
+
+def empty_summary(top: int = TOP) -> Summary:
+    return Summary(RunningStats(), KLLSketch(), TopK(top), TopK(top, largest=False))
+
+
+def is_binary(file_name: str) -> bool:
+    return file_name.lower().endswith(".bin")
+
+
+def split_ranges(file_name: str, chunk_size: int, binary: Optional[bool] = None) -> List[Task]:
+    """
+    Cut file_name into ranges of about chunk_size bytes that never split a
+    number: multiples of 8 bytes for binary, separator-aligned for text.
+    """
+    binary = is_binary(file_name) if binary is None else binary
+    size = os.path.getsize(file_name)
+    if binary:
+        if size % 8:
+            raise ValueError("Binary file size is not a multiple of 8 bytes (float64)")
+        chunk_size = max(8, chunk_size - chunk_size % 8)
+        return [(file_name, start, min(start + chunk_size, size), True)
+                for start in range(0, size, chunk_size)]
+
+    boundaries = [0]
+    if size:
+        with open(file_name, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            position = chunk_size
+            while position < size:
+                while position < size and mm[position] not in SEPARATORS:
+                    position += 1  # move to the end of the current number
+                if position >= size:
+                    break
+                boundaries.append(position)
+                position += chunk_size
+    boundaries.append(size)
+    return [(file_name, start, end, False) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def summarize_range(task: Task, top: int = TOP) -> Summary:
+    """
+    Partial summary of the numbers in one byte range (runs in a worker).
+    """
+    file_name, start, end, binary = task
+    with open(file_name, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+    if binary:
+        values = array("d")
+        values.frombytes(data)
+        numbers = values.tolist()  # one float object per value, shared by all four
+    else:
+        numbers = [float(word) for word in data.replace(b",", b" ").split()]
+    summary = empty_summary(top)
+    summary.stats.update(numbers)
+    summary.sketch.update(numbers)
+    summary.largest.update(numbers)
+    summary.smallest.update(numbers)
+    return summary
+
+
+def merge_summaries(partials: Iterable[Summary], top: int = TOP) -> Summary:
+    merged = empty_summary(top)
+    for partial in partials:
+        merged.stats.merge(partial.stats)
+        merged.sketch.merge(partial.sketch)
+        merged.largest.merge(partial.largest)
+        merged.smallest.merge(partial.smallest)
+    return merged
+
+
+def analyze(file_name: str, workers: Optional[int] = None,
+            chunk_size: int = CHUNK_MB * 1024 * 1024, binary: Optional[bool] = None) -> Summary:
+    """
+    Summary of every number in file_name, using a pool of worker processes.
+    """
+    tasks = split_ranges(file_name, chunk_size, binary)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        return merge_summaries(map(summarize_range, tasks))
+    with Pool(workers) as pool:
+        return merge_summaries(pool.imap_unordered(summarize_range, tasks))
+
+
+# ------------------------------------------
+# Benchmark: speedup from 1 to N workers
+# ------------------------------------------
+def benchmark(size_mb: int = 500, max_workers: Optional[int] = None) -> None:
+    import random
+
+    file_name = "bench_numbers.bin"
+    block = array("d", (random.gauss(100, 15) for _ in range(100_000)))
+    with open(file_name, "wb") as f:
+        while f.tell() < size_mb * 1024 * 1024:
+            f.write(block.tobytes())
+            random.shuffle(block)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    # Enough chunks that every worker count gets an even share
+    chunk_size = max(8, os.path.getsize(file_name) // (max_workers * 8))
+    baseline = None
+    workers = 1
+    while True:
+        start = time.perf_counter()
+        analyze(file_name, workers, chunk_size)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:3d} workers: {elapsed:6.2f}s  "
+              f"({size_mb / elapsed:,.0f} MB/s, speedup {baseline / elapsed:.2f}x)")
+        if workers >= max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+    os.remove(file_name)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from day5_list_analysis import print_stream_report
+
+    parser = argparse.ArgumentParser(description="Analyze the numbers in a large file in parallel.")
+    parser.add_argument("file", nargs="?", help="text file of numbers, or .bin file of float64 values")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_MB, help="size of one unit of work")
+    parser.add_argument("--benchmark", type=int, metavar="MB", help="time 1..N workers on a generated file")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark, args.workers)
+        return
+    if not args.file:
+        parser.error("give a file of numbers")
+
+    try:
+        summary = analyze(args.file, args.workers, args.chunk_mb * 1024 * 1024)
+    except FileNotFoundError as e:
+        print("⚠️ File not found:", e.filename)
+        sys.exit(1)
+    except ValueError as e:
+        print("⚠️", e)
+        sys.exit(1)
+    print_stream_report(*summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# ------------------------------------------
+# ✍️ Buffered Append Writer
+# ------------------------------------------
+# Keeps one log file open for appending instead of open/write/close for
+# every line. Used by the Message Saver (Day7.py) and the Notes Manager.
+# - Lines are collected in a memory buffer and written out when it grows
+#   past max_buffer bytes or when flush_interval seconds have passed
+# - sync picks how durable a write is:
+#     "none"    hand data to the OS on flush (fastest)
+#     "fsync"   os.fsync after every flush
+#     "always"  write and fsync on every single line (slowest, safest)
+# - One lock guards the buffer, so many threads can share one writer
+# - get_writer(path) returns a process-wide shared writer for a file;
+#   all shared writers are flushed when the program exits (also on
+#   sys.exit()), and flush_file(path) lets readers flush one first
+
+import atexit
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+MAX_BUFFER = 64 * 1024   # bytes buffered before a flush
+FLUSH_INTERVAL = 1.0     # seconds a line may sit in the buffer
+SYNC_LEVELS = ("none", "fsync", "always")
+
+
+class BufferedAppendWriter:
+    """
+    Thread-safe, buffered writer that only ever appends to file_name.
+    """
+    def __init__(self, file_name: str, max_buffer: int = MAX_BUFFER,
+                 flush_interval: Optional[float] = FLUSH_INTERVAL,
+                 sync: str = "none", encoding: str = "utf-8"):
+        if sync not in SYNC_LEVELS:
+            raise ValueError(f"sync must be one of {SYNC_LEVELS}, not {sync!r}")
+        self.file_name = file_name
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self.sync = sync
+        self.encoding = encoding
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._buffered = 0
+        self._file = None
+        self._position = 0
+        self._open()
+
+        self._closed = threading.Event()
+        self._timer = None
+        if flush_interval:
+            self._timer = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._timer.start()
+
+    def _open(self) -> None:
+        self._file = open(self.file_name, "ab")
+        self._position = self._file.seek(0, os.SEEK_END)
+
+    # ---------- writing ----------
+    def write(self, text: str) -> int:
+        """
+        Append text (normally one line ending in "\\n").
+        Returns the byte offset in the file where text will start.
+        """
+        data = text.encode(self.encoding)
+        with self._lock:
+            if self._file is None:
+                raise ValueError("write to a closed BufferedAppendWriter")
+            offset = self._position
+            self._position += len(data)
+            self._buffer.append(data)
+            self._buffered += len(data)
+            if self.sync == "always" or self._buffered >= self.max_buffer:
+                self._flush_locked()
+        return offset
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.write(line if line.endswith("\n") else line + "\n")
+
+    def tell(self) -> int:
+        """
+        Offset of the end of the file, including data still buffered.
+        """
+        with self._lock:
+            return self._position
+
+    # ---------- flushing ----------
+    def _flush_locked(self) -> None:
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+            self._file.flush()
+            if self.sync != "none":
+                os.fsync(self._file.fileno())
+
+    def flush(self) -> None:
+        """
+        Write everything buffered so far to the file.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._flush_locked()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def reopen(self) -> None:
+        """
+        Flush and open the file again, e.g. after it was replaced on disk.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._flush_locked()
+                self._file.close()
+            self._open()
+
+    def close(self) -> None:
+        self._closed.set()
+        with self._lock:
+            if self._file is not None:
+                self._flush_locked()
+                self._file.close()
+                self._file = None
+        if self._timer is not None and self._timer is not threading.current_thread():
+            self._timer.join()
+
+    def __enter__(self) -> "BufferedAppendWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ------------------------------------------
+# Shared writers, one per file
+# ------------------------------------------
+_writers: Dict[str, BufferedAppendWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(file_name: str, **options) -> BufferedAppendWriter:
+    """
+    Process-wide writer for file_name (created on first use).
+    options are passed to BufferedAppendWriter the first time only.
+    """
+    key = os.path.abspath(file_name)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or writer._file is None:
+            writer = _writers[key] = BufferedAppendWriter(file_name, **options)
+        return writer
+
+
+def flush_file(file_name: str) -> None:
+    """
+    Write out what the shared writer of file_name (if any) has buffered,
+    so a reader of the file sees every line appended so far.
+    """
+    with _writers_lock:
+        writer = _writers.get(os.path.abspath(file_name))
+    if writer is not None:
+        writer.flush()
+
+
+@atexit.register
+def close_all() -> None:
+    with _writers_lock:
+        for writer in _writers.values():
+            writer.close()
+        _writers.clear()
+
+
+# ------------------------------------------
+# Benchmark: lines/sec vs open/write/close per line
+# ------------------------------------------
+def benchmark(lines: int = 200_000, threads: int = 4, file_name: str = "bench_append.txt") -> None:
+    line = "Alice: hello from the benchmark\n"
+
+    def report(label: str, count: int, elapsed: float) -> None:
+        print(f"{label:<32} {count / elapsed:>12,.0f} lines/s")
+
+    if os.path.exists(file_name):
+        os.remove(file_name)
+    naive = min(lines, 20_000)
+    start = time.perf_counter()
+    for _ in range(naive):
+        with open(file_name, "a") as f:
+            f.write(line)
+    report("open/write/close per line", naive, time.perf_counter() - start)
+
+    for sync in ("none", "fsync"):
+        os.remove(file_name)
+        start = time.perf_counter()
+        with BufferedAppendWriter(file_name, sync=sync) as writer:
+            for _ in range(lines):
+                writer.write(line)
+        report(f"buffered, sync={sync}", lines, time.perf_counter() - start)
+
+    os.remove(file_name)
+    start = time.perf_counter()
+    with BufferedAppendWriter(file_name) as writer:
+        workers = [threading.Thread(target=lambda: [writer.write(line) for _ in range(lines // threads)])
+                   for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    report(f"buffered, {threads} threads", lines // threads * threads, time.perf_counter() - start)
+    assert os.path.getsize(file_name) == len(line) * (lines // threads * threads)
+    os.remove(file_name)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -2,17 +2,88 @@
 # Author: Temesgen Meharie
 # Goal: Practice list operations, loops, and basic functions
 
+import sys
+
+from quantile_sketch import KLLSketch, TopK
+from streaming_stats import RunningStats
+
+
 def analyze_numbers(numbers):
+    # One pass for sum/max/min/average/variance, one sort for both orders.
+    # numbers may be any iterable (even a generator), so keep it in a list
+    # for the sort and the printout
+    numbers = list(numbers)
+    stats = RunningStats(numbers)
+    if stats.count == 0:
+        print("\nNo numbers to analyze.")
+        return
+    ascending = sorted(numbers)
     print("\nNumbers:", numbers)
-    print("Sum:", sum(numbers))
-    print("Max:", max(numbers))
-    print("Min:", min(numbers))
-    print("Average:", sum(numbers) / len(numbers))
-    print("Ascending:", sorted(numbers))
-    print("Descending:", sorted(numbers, reverse=True))
+    print("Sum:", stats.total)
+    print("Max:", stats.maximum)
+    print("Min:", stats.minimum)
+    print("Average:", stats.mean)
+    print("Variance:", stats.variance)
+    print("Median:", median(ascending))
+    print("Ascending:", ascending)
+    print("Descending:", ascending[::-1])
+
+
+def median(ascending):
+    middle = len(ascending) // 2
+    if len(ascending) % 2:
+        return ascending[middle]
+    return (ascending[middle - 1] + ascending[middle]) / 2
+
+
+def analyze_stream(numbers, top=5):
+    # Same report for streams too big to sort: bounded memory, approximate
+    # median/percentiles (KLL sketch), exact top/bottom values
+    stats, sketch = RunningStats(), KLLSketch()
+    largest, smallest = TopK(top), TopK(top, largest=False)
+    for block in _blocks(numbers):
+        stats.update(block)
+        sketch.update(block)
+        largest.update(block)
+        smallest.update(block)
+    print_stream_report(stats, sketch, largest, smallest)
+
+
+def _blocks(numbers, size=65_536):
+    block = []
+    for x in numbers:
+        block.append(x)
+        if len(block) == size:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def print_stream_report(stats, sketch, largest, smallest):
+    if stats.count == 0:
+        print("\nNo numbers to analyze.")
+        return
+    p10, p50, p90, p99 = sketch.quantiles([0.1, 0.5, 0.9, 0.99])
+    print(f"\nCount: {stats.count:,}")
+    print("Sum:", stats.total)
+    print("Max:", stats.maximum)
+    print("Min:", stats.minimum)
+    print("Average:", stats.mean)
+    print("Variance:", stats.variance)
+    print("Median (approx.):", p50)
+    print(f"p10 / p90 / p99 (approx.): {p10} / {p90} / {p99}")
+    print("Largest:", largest.values())
+    print("Smallest:", smallest.values())
 
 
 def main():
+    # python day5_list_analysis.py numbers.txt analyzes a whole file instead
+    if len(sys.argv) > 1:
+        from analyze_file import main as analyze_file_main
+        analyze_file_main(sys.argv[1:])
+        return
+
     numbers = []
     print("Enter 5 numbers:")
 
@@ -0,0 +1,203 @@
+# ------------------------------------------
+# 📊 Expense Analytics: spending over date ranges
+# ------------------------------------------
+# - Built from the per-day buckets the ExpenseLedger already maintains,
+#   so nothing is re-parsed from the expense log
+# - Each category (and "all categories") gets a Fenwick tree over days:
+#   adding an expense and summing any date range are both O(log days)
+# - Monthly totals are answered as range sums over the month's days
+
+import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from expense_ledger import ExpenseLedger, day_of
+
+ALL = None  # category key meaning "every category"
+
+
+class FenwickTree:
+    """
+    Binary indexed tree over days first_day .. first_day + size - 1.
+    Grows (by rebuilding at double size) when a day outside the range arrives.
+    """
+    def __init__(self, first_day: int, size: int = 366):
+        self.first_day = first_day
+        self.size = size
+        self._tree = [0.0] * (size + 1)
+
+    def _grow(self, day: int) -> None:
+        values = [self.value(self.first_day + i) for i in range(self.size)]
+        old_first = self.first_day
+        last = max(old_first + self.size - 1, day)
+        size = self.size * 2
+        while size < last - min(old_first, day) + 1:
+            size *= 2
+        # Keep the spare room on the side that grew, so the next earlier
+        # (or later) day does not trigger another rebuild
+        first = last - size + 1 if day < old_first else old_first
+        self.first_day, self.size, self._tree = first, size, [0.0] * (size + 1)
+        for i, value in enumerate(values):
+            if value:
+                self.add(old_first + i, value)
+
+    def add(self, day: int, amount: float) -> None:
+        if not self.first_day <= day < self.first_day + self.size:
+            self._grow(day)
+        i = day - self.first_day + 1
+        while i <= self.size:
+            self._tree[i] += amount
+            i += i & -i
+
+    def prefix(self, day: int) -> float:
+        """
+        Sum of all days up to and including day.
+        """
+        i = min(day - self.first_day + 1, self.size)
+        total = 0.0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def range_sum(self, first: int, last: int) -> float:
+        if last < first:
+            return 0.0
+        return self.prefix(last) - self.prefix(first - 1)
+
+    def value(self, day: int) -> float:
+        return self.range_sum(day, day)
+
+
+def _as_day(value) -> int:
+    # Accept date objects or ordinals
+    if isinstance(value, datetime.date):
+        return value.toordinal()
+    return int(value)
+
+
+class ExpenseAnalytics:
+    """
+    Range queries over daily expense buckets, per category.
+    """
+    def __init__(self):
+        self._trees: Dict[Optional[str], FenwickTree] = {}
+
+    @classmethod
+    def from_ledger(cls, ledger: ExpenseLedger) -> "ExpenseAnalytics":
+        analytics = cls()
+        for category, days in ledger.daily_totals().items():
+            for day, total in days.items():
+                analytics.add_day(category, day, total)
+        return analytics
+
+    @classmethod
+    def from_file(cls, file_name: str) -> "ExpenseAnalytics":
+        return cls.from_ledger(ExpenseLedger(file_name))
+
+    def categories(self) -> List[str]:
+        return [category for category in self._trees if category is not ALL]
+
+    def add_day(self, category: str, day: int, amount: float) -> None:
+        """
+        Add amount to category's bucket for day (a date ordinal).
+        """
+        for key in (category, ALL):
+            tree = self._trees.get(key)
+            if tree is None:
+                tree = self._trees[key] = FenwickTree(day)
+            tree.add(day, amount)
+
+    def add(self, category: str, amount: float, timestamp: float) -> None:
+        self.add_day(category, day_of(timestamp), amount)
+
+    def total(self, start, end, category: Optional[str] = ALL) -> float:
+        """
+        Total spent from start to end (dates or ordinals, inclusive).
+        category=None sums every category.
+        """
+        tree = self._trees.get(category)
+        if tree is None:
+            return 0.0
+        return tree.range_sum(_as_day(start), _as_day(end))
+
+    def daily(self, start, end, category: Optional[str] = ALL) -> List[Tuple[datetime.date, float]]:
+        """
+        [(date, total)] for every day from start to end.
+        """
+        tree = self._trees.get(category)
+        first, last = _as_day(start), _as_day(end)
+        return [(datetime.date.fromordinal(day), tree.value(day) if tree else 0.0)
+                for day in range(first, last + 1)]
+
+    def monthly(self, year: int, category: Optional[str] = ALL) -> List[Tuple[int, float]]:
+        """
+        [(month, total)] for the 12 months of year.
+        """
+        result = []
+        for month in range(1, 13):
+            first = datetime.date(year, month, 1)
+            following = datetime.date(year + month // 12, month % 12 + 1, 1)
+            result.append((month, self.total(first, following.toordinal() - 1, category)))
+        return result
+
+    def by_category(self, start, end) -> Dict[str, float]:
+        return {category: self.total(start, end, category) for category in self.categories()}
+
+
+# ------------------------------------------
+# Benchmark: 10M expense rows
+# ------------------------------------------
+def _rows(count: int, days: int) -> Iterable[Tuple[str, float, int]]:
+    import random
+
+    categories = ["Food", "Transport", "Groceries", "Rent", "Health", "Fun"]
+    first = datetime.date(2020, 1, 1).toordinal()
+    for _ in range(count):
+        yield random.choice(categories), random.randint(1, 500), first + random.randrange(days)
+
+
+def benchmark(rows: int = 10_000_000, days: int = 5 * 365, queries: int = 10_000) -> None:
+    import random
+    import time
+
+    # Pre-aggregate rows into daily buckets (what the ledger checkpoint holds)
+    start = time.perf_counter()
+    buckets: Dict[Tuple[str, int], float] = {}
+    table = []
+    for category, amount, day in _rows(rows, days):
+        buckets[category, day] = buckets.get((category, day), 0) + amount
+        if len(table) < 1_000_000:
+            table.append((category, amount, day))
+    print(f"Aggregated {rows:,} rows into {len(buckets):,} daily buckets "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    analytics = ExpenseAnalytics()
+    for (category, day), total in buckets.items():
+        analytics.add_day(category, day, total)
+    print(f"Built Fenwick trees in {time.perf_counter() - start:.2f}s")
+
+    first = datetime.date(2020, 1, 1).toordinal()
+    ranges = []
+    for _ in range(queries):
+        a, b = sorted(random.randrange(days) for _ in range(2))
+        ranges.append((first + a, first + b))
+
+    start = time.perf_counter()
+    for a, b in ranges:
+        analytics.total(a, b, "Food")
+    indexed = (time.perf_counter() - start) / queries
+    print(f"Indexed range sum: {indexed * 1e6:.1f} µs/query")
+
+    # Rescanning rows for one query, measured on up to 1M rows and scaled
+    a, b = ranges[0]
+    start = time.perf_counter()
+    sum(amount for category, amount, day in table if category == "Food" and a <= day <= b)
+    rescan = (time.perf_counter() - start) * rows / len(table)
+    print(f"Rescan of {rows:,} rows: ~{rescan * 1e3:.0f} ms/query "
+          f"({rescan / indexed:,.0f}x slower)")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,256 @@
+# ------------------------------------------
+# 🗄️ Columnar Binary Expense Log
+# ------------------------------------------
+# An alternative on-disk format for large expense logs. Instead of
+# "category,amount,timestamp" text lines, each column is its own file:
+#   <base>.cat   uint16  category code per expense (dictionary encoded)
+#   <base>.amt   int64   amount in cents
+#   <base>.ts    int64   Unix timestamp (0 = unknown)
+#   <base>.dict  JSON    category names, index = code
+# Summaries memory-map the columns and add them up without parsing any
+# text: numpy.bincount when NumPy is installed, a plain loop otherwise.
+# extend() holds <base>.lock (like ExpenseLedger), so several processes
+# can append; a row is only complete once all three columns have it, so
+# the log's length is the shortest column, and a row left half-written
+# by a crash is cut off before the next append.
+
+import array
+import json
+import mmap
+import os
+import sys
+from itertools import islice
+from typing import Dict, List, Optional
+
+from expense_ledger import file_lock, parse_line
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+CODE_TYPE = "H"    # uint16 -> up to 65,536 categories
+VALUE_TYPE = "q"   # int64
+COLUMN_TYPES = {"cat": CODE_TYPE, "amt": VALUE_TYPE, "ts": VALUE_TYPE}
+
+
+class ColumnarExpenseLog:
+    """
+    Append-only expense log stored as separate binary columns.
+    """
+    def __init__(self, base: str):
+        self.base = base
+        self.dict_file = base + ".dict"
+        self.column_files = {"cat": base + ".cat", "amt": base + ".amt", "ts": base + ".ts"}
+        self.lock_file = base + ".lock"
+        self._load_dict()
+
+    def _load_dict(self) -> None:
+        self.categories: List[str] = []
+        if os.path.exists(self.dict_file):
+            with open(self.dict_file, "r", encoding="utf-8") as f:
+                header = json.load(f)
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError(f"{self.base} was written on a {header['byteorder']}-endian machine.")
+            self.categories = header["categories"]
+        self._codes = {name: code for code, name in enumerate(self.categories)}
+
+    def __len__(self) -> int:
+        # Complete rows: the shortest column
+        rows = []
+        for name, typecode in COLUMN_TYPES.items():
+            try:
+                size = os.path.getsize(self.column_files[name])
+            except FileNotFoundError:
+                return 0
+            rows.append(size // array.array(typecode).itemsize)
+        return min(rows)
+
+    def _code(self, category: str) -> int:
+        code = self._codes.get(category)
+        if code is None:
+            code = self._codes[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def _save_dict(self) -> None:
+        temp = self.dict_file + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({"byteorder": sys.byteorder, "categories": self.categories}, f)
+        os.replace(temp, self.dict_file)
+
+    def extend(self, rows) -> int:
+        """
+        Append (category, amount, timestamp) rows. Returns how many were written.
+        """
+        with file_lock(self.lock_file):
+            self._load_dict()  # another writer may have added categories
+            self._trim()
+            codes = array.array(CODE_TYPE)
+            cents = array.array(VALUE_TYPE)
+            stamps = array.array(VALUE_TYPE)
+            for category, amount, timestamp in rows:
+                codes.append(self._code(category))
+                cents.append(round(amount * 100))
+                stamps.append(int(timestamp or 0))
+            self._save_dict()  # dictionary first, so codes on disk always resolve
+            for name, column in (("cat", codes), ("amt", cents), ("ts", stamps)):
+                with open(self.column_files[name], "ab") as f:
+                    column.tofile(f)
+        return len(codes)
+
+    def _trim(self) -> None:
+        # Cut every column back to the complete rows (after an interrupted extend)
+        count = len(self)
+        for name, typecode in COLUMN_TYPES.items():
+            path = self.column_files[name]
+            size = count * array.array(typecode).itemsize
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+
+    def append(self, category: str, amount: float, timestamp: Optional[float] = None) -> None:
+        self.extend([(category, amount, timestamp)])
+
+    def _map(self, name: str):
+        # Memory-map one column; empty files cannot be mapped
+        with open(self.column_files[name], "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def totals(self) -> Dict[str, float]:
+        """
+        Total amount per category, read straight from the mapped columns.
+        """
+        count = len(self)  # columns may be longer if a write is under way
+        if count == 0:
+            return {}
+        self._load_dict()  # after len(): every counted row's category is saved by now
+        codes_map, cents_map = self._map("cat"), self._map("amt")
+        try:
+            if np is not None:
+                codes = np.frombuffer(codes_map, dtype=np.uint16, count=count)
+                cents = np.frombuffer(cents_map, dtype=np.int64, count=count)
+                try:
+                    sums = np.bincount(codes, weights=cents, minlength=len(self.categories))
+                    # Exact integer sums per category (float64 weights are exact to 2**53 cents)
+                    sums = [int(value) for value in sums]
+                finally:
+                    del codes, cents  # release the buffers before closing the maps
+            else:
+                sums = [0] * len(self.categories)
+                with memoryview(codes_map) as raw_codes, memoryview(cents_map) as raw_cents, \
+                        raw_codes.cast(CODE_TYPE) as codes, raw_cents.cast(VALUE_TYPE) as cents:
+                    for code, value in islice(zip(codes, cents), count):
+                        sums[code] += value
+        finally:
+            codes_map.close()
+            cents_map.close()
+        return {name: sums[code] / 100 for code, name in enumerate(self.categories) if sums[code]}
+
+
+# ------------------------------------------
+# Converters to / from the text format
+# ------------------------------------------
+def text_to_columnar(text_file: str, base: str, batch: int = 1_000_000) -> int:
+    """
+    Convert a text expense log into a new columnar log at base.
+    """
+    log = ColumnarExpenseLog(base)
+    if len(log):
+        raise ValueError(f"{base} already contains expenses.")
+    written = 0
+    rows = []
+    with open(text_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                rows.append(parse_line(line))
+            if len(rows) >= batch:
+                written += log.extend(rows)
+                rows = []
+    return written + log.extend(rows)
+
+
+def columnar_to_text(base: str, text_file: str) -> int:
+    """
+    Write a columnar log back out as "category,amount,timestamp" lines.
+    """
+    log = ColumnarExpenseLog(base)
+    count = len(log)
+    if count == 0:
+        open(text_file, "w").close()
+        return 0
+    log._load_dict()
+    maps = [log._map(name) for name in COLUMN_TYPES]
+    views = []
+    try:
+        for m, typecode in zip(maps, COLUMN_TYPES.values()):
+            views.append(memoryview(m))
+            views.append(views[-1].cast(typecode))
+        with open(text_file, "w", encoding="utf-8") as f:
+            for code, cents, timestamp in islice(zip(*views[1::2]), count):
+                amount = f"{cents // 100}.{cents % 100:02d}" if cents >= 0 else f"{cents / 100:.2f}"
+                if timestamp:
+                    f.write(f"{log.categories[code]},{amount},{timestamp}\n")
+                else:
+                    f.write(f"{log.categories[code]},{amount}\n")
+    finally:
+        for view in reversed(views):  # release the views before closing the maps
+            view.release()
+        for m in maps:
+            m.close()
+    return count
+
+
+# ------------------------------------------
+# Benchmark: text summary vs columnar summary
+# ------------------------------------------
+def benchmark(size_mb: int = 1024, work_dir: str = ".") -> None:
+    """
+    Build a text log of about size_mb megabytes, convert it, and compare
+    how long a full summary takes in each format.
+    """
+    import random
+    import time
+
+    text_file = os.path.join(work_dir, "bench_expenses.txt")
+    base = os.path.join(work_dir, "bench_expenses")
+    categories = ["Food", "Transport", "Groceries", "Rent", "Health", "Fun"]
+
+    with open(text_file, "w") as f:
+        target = size_mb * 1024 * 1024
+        while f.tell() < target:
+            f.write("".join(
+                f"{random.choice(categories)},{random.randint(1, 50000) / 100},1700000000\n"
+                for _ in range(100_000)))
+
+    start = time.perf_counter()
+    totals = {}
+    with open(text_file) as f:
+        for line in f:
+            category, amount, _ = parse_line(line)
+            totals[category] = totals.get(category, 0) + amount
+    text_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rows = text_to_columnar(text_file, base)
+    convert_time = time.perf_counter() - start
+
+    log = ColumnarExpenseLog(base)
+    start = time.perf_counter()
+    log.totals()
+    columnar_time = time.perf_counter() - start
+
+    print(f"{rows:,} expenses ({size_mb} MB of text), "
+          f"{'NumPy' if np is not None else 'pure Python'} aggregation")
+    print(f"Text summary:     {text_time:.2f}s")
+    print(f"Columnar summary: {columnar_time:.2f}s ({text_time / columnar_time:.1f}x faster)")
+    print(f"One-time conversion: {convert_time:.2f}s")
+
+    for path in [text_file, log.dict_file, log.lock_file, *log.column_files.values()]:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1024)
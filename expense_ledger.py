@@ -0,0 +1,190 @@
+# ------------------------------------------
+# 📒 Expense Ledger for the Daily Expense Tracker (Day_9.py)
+# ------------------------------------------
+# - Expenses are still appended to the plain text log, now with a Unix
+#   timestamp: "category,amount,timestamp" (old "category,amount" lines
+#   are still read; they count towards totals but not any day)
+# - Running per-category totals are kept in a checkpoint file next to the
+#   log ("<log>.totals.json") together with the byte offset they cover;
+#   the per-day buckets (for expense_analytics.py) live in their own
+#   sidecar ("<log>.daily.json") with their own offset
+# - A summary only parses the lines written since the last checkpoint,
+#   so it costs O(categories + new lines) instead of re-reading everything;
+#   it never reads the per-day buckets, and nothing is rewritten when no
+#   new lines were added
+# - Each sidecar also remembers the log's inode and the last bytes it
+#   covered; a log that was truncated, replaced or rewritten no longer
+#   matches and is parsed again from the start
+# - Appends and checkpoint updates take a file lock, so several processes
+#   can add expenses to the same log safely
+
+import datetime
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+CHUNK_SIZE = 1 << 20  # bytes of new log data parsed per read
+MARKER_SIZE = 32      # bytes remembered from the end of the parsed region
+
+try:
+    import fcntl  # POSIX
+
+    def _lock(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(lock_file: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock on lock_file (created if needed) for a with block.
+    Other processes using the same lock file wait until it is released.
+    """
+    with open(lock_file, "a") as f:
+        _lock(f)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+def parse_line(line: str) -> Tuple[str, float, Optional[float]]:
+    """
+    Split one log line into (category, amount, timestamp).
+    timestamp is None for old "category,amount" lines.
+    """
+    fields = line.strip().split(",")
+    if len(fields) == 2:
+        return fields[0], float(fields[1]), None
+    category, amount, timestamp = fields
+    return category, float(amount), float(timestamp)
+
+
+def day_of(timestamp: float) -> int:
+    """
+    Local calendar day of a Unix timestamp, as a date ordinal.
+    """
+    return datetime.date.fromtimestamp(timestamp).toordinal()
+
+
+class ExpenseLedger:
+    """
+    Append-only expense log with incrementally maintained category totals.
+    """
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.checkpoint_file = file_name + ".totals.json"
+        self.daily_file = file_name + ".daily.json"
+        self.lock_file = file_name + ".lock"
+
+    def _locked(self):
+        # One lock file guards the log and both sidecars
+        return file_lock(self.lock_file)
+
+    def add(self, category: str, amount: float, timestamp: Optional[float] = None) -> None:
+        """
+        Append one expense to the log. timestamp defaults to now.
+        """
+        if "," in category or "\n" in category or category.strip() == "":
+            raise ValueError(f"Invalid category: {category!r}")
+        float(amount)  # raises ValueError for non-numbers
+        if timestamp is None:
+            timestamp = time.time()
+        with self._locked():
+            with open(self.file_name, "a") as f:
+                f.write(f"{category},{amount},{int(timestamp)}\n")
+
+    def _read_sidecar(self, sidecar: str, log) -> Tuple[int, dict]:
+        # (offset, values) from sidecar, if it still describes the start of the open log
+        try:
+            with open(sidecar, "r") as f:
+                data = json.load(f)
+            offset, values = data["offset"], data["values"]
+            inode, marker = data["inode"], bytes.fromhex(data["marker"])
+            if not (isinstance(offset, int) and isinstance(values, dict)):
+                raise ValueError("wrong types")
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return 0, {}  # missing or damaged: rebuild from the start
+        size = os.fstat(log.fileno()).st_size
+        log.seek(max(0, offset - len(marker)))
+        if inode != os.fstat(log.fileno()).st_ino or offset > size or log.read(len(marker)) != marker:
+            return 0, {}  # log was truncated, replaced or rewritten
+        return offset, values
+
+    def _write_sidecar(self, sidecar: str, log, offset: int, values: dict) -> None:
+        log.seek(max(0, offset - MARKER_SIZE))
+        marker = log.read(offset - log.tell())
+        temp = sidecar + ".tmp"
+        with open(temp, "w") as f:
+            json.dump({"offset": offset, "inode": os.fstat(log.fileno()).st_ino,
+                       "marker": marker.hex(), "values": values}, f)
+        os.replace(temp, sidecar)
+
+    def totals(self) -> Dict[str, float]:
+        """
+        Return total spending per category, parsing only the unread tail of the log.
+        Raises FileNotFoundError if nothing has been recorded yet.
+        """
+        return self._catch_up(self.checkpoint_file, _add_total)
+
+    def daily_totals(self) -> Dict[str, Dict[int, float]]:
+        """
+        Return {category: {date ordinal: total}} for all timestamped expenses.
+        """
+        daily = self._catch_up(self.daily_file, _add_daily)
+        return {category: {int(day): total for day, total in days.items()}
+                for category, days in daily.items()}
+
+    def _catch_up(self, sidecar: str, add: Callable[[dict, str, float, Optional[float]], None]) -> dict:
+        # Bring one sidecar up to date with the end of the log
+        with self._locked():
+            with open(self.file_name, "rb") as f:
+                start, values = self._read_sidecar(sidecar, f)
+                offset = start
+                f.seek(offset)
+                pending = b""
+                while True:
+                    chunk = f.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    # Only consume complete lines; a half-written last line waits
+                    chunk = pending + chunk
+                    end = chunk.rfind(b"\n") + 1
+                    pending = chunk[end:]
+                    for line in chunk[:end].decode("utf-8").splitlines():
+                        if line.strip() != "":
+                            add(values, *parse_line(line))
+                    offset += end
+
+                if offset != start:  # no new lines: the sidecar on disk is still right
+                    self._write_sidecar(sidecar, f, offset, values)
+        return values
+
+
+def _add_total(totals: Dict[str, float], category: str, amount: float,
+               timestamp: Optional[float]) -> None:
+    totals[category] = totals.get(category, 0) + amount
+
+
+def _add_daily(daily: Dict[str, Dict[str, float]], category: str, amount: float,
+               timestamp: Optional[float]) -> None:
+    if timestamp is not None:
+        # JSON object keys are strings, so days are stored as str
+        days = daily.setdefault(category, {})
+        day = str(day_of(timestamp))
+        days[day] = days.get(day, 0) + amount
@@ -0,0 +1,145 @@
+# ------------------------------------------
+# 🧮 Parallel Expense Summary for many expense files
+# ------------------------------------------
+# Usage:
+#   python expense_summarize.py branch1.txt branch2.txt ... [--workers N]
+#   python expense_summarize.py huge.txt --chunk-mb 64
+#   python expense_summarize.py --benchmark 500
+# - Every file is cut into byte ranges that start and end on line
+#   boundaries, so one huge file is shared between workers too
+# - Each worker process totals its ranges per category; the parent
+#   merges the partial totals
+# - --benchmark times the same summary with 1, 2, ... N workers
+
+import argparse
+import os
+import sys
+import time
+from multiprocessing import Pool
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from expense_ledger import parse_line
+
+CHUNK_MB = 32  # default size of one unit of work
+
+Task = Tuple[str, int, int]  # (file name, start offset, end offset)
+
+
+def split_ranges(file_name: str, chunk_size: int) -> List[Task]:
+    """
+    Cut file_name into ranges of about chunk_size bytes, aligned to line starts.
+    """
+    size = os.path.getsize(file_name)
+    boundaries = [0]
+    with open(file_name, "rb") as f:
+        position = chunk_size
+        while position < size:
+            f.seek(position)
+            f.readline()  # move to the start of the next line
+            boundary = f.tell()
+            if boundary >= size:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+            position = boundary + chunk_size
+    boundaries.append(size)
+    return [(file_name, start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def summarize_range(task: Task) -> Dict[str, float]:
+    """
+    Total per category for the lines in one byte range (runs in a worker).
+    """
+    file_name, start, end = task
+    totals: Dict[str, float] = {}
+    with open(file_name, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    for line in data.decode("utf-8").splitlines():
+        if line.strip() == "":
+            continue
+        category, amount, _ = parse_line(line)
+        totals[category] = totals.get(category, 0) + amount
+    return totals
+
+
+def merge_totals(partials: Iterable[Dict[str, float]]) -> Dict[str, float]:
+    merged: Dict[str, float] = {}
+    for partial in partials:
+        for category, amount in partial.items():
+            merged[category] = merged.get(category, 0) + amount
+    return merged
+
+
+def summarize(file_names: List[str], workers: Optional[int] = None,
+              chunk_size: int = CHUNK_MB * 1024 * 1024) -> Dict[str, float]:
+    """
+    Total per category across all files, using a pool of worker processes.
+    """
+    tasks = [task for name in file_names for task in split_ranges(name, chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        return merge_totals(map(summarize_range, tasks))
+    with Pool(workers) as pool:
+        return merge_totals(pool.imap_unordered(summarize_range, tasks))
+
+
+# ------------------------------------------
+# Benchmark: speedup from 1 to N workers
+# ------------------------------------------
+def benchmark(size_mb: int = 500, max_workers: Optional[int] = None) -> None:
+    import random
+
+    file_name = "bench_branch_expenses.txt"
+    categories = ["Food", "Transport", "Groceries", "Rent", "Health", "Fun"]
+    with open(file_name, "w") as f:
+        while f.tell() < size_mb * 1024 * 1024:
+            f.write("".join(
+                f"{random.choice(categories)},{random.randint(1, 50000) / 100},1700000000\n"
+                for _ in range(100_000)))
+
+    max_workers = max_workers or os.cpu_count() or 1
+    # Enough chunks that every worker count gets an even share
+    chunk_size = max(1, os.path.getsize(file_name) // (max_workers * 8))
+    baseline = None
+    workers = 1
+    while True:
+        start = time.perf_counter()
+        summarize([file_name], workers, chunk_size)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:3d} workers: {elapsed:6.2f}s  "
+              f"({size_mb / elapsed:,.0f} MB/s, speedup {baseline / elapsed:.2f}x)")
+        if workers >= max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+    os.remove(file_name)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Summarize expense files in parallel.")
+    parser.add_argument("files", nargs="*", help="expense files (category,amount[,timestamp])")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_MB, help="size of one unit of work")
+    parser.add_argument("--benchmark", type=int, metavar="MB", help="time 1..N workers on a generated file")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark, args.workers)
+        return
+    if not args.files:
+        parser.error("give at least one expense file")
+
+    try:
+        totals = summarize(args.files, args.workers, args.chunk_mb * 1024 * 1024)
+    except FileNotFoundError as e:
+        print("⚠️ Expense file not found:", e.filename)
+        sys.exit(1)
+
+    print("\n💰 Expense Summary:")
+    for category, total in totals.items():
+        print(f"  - {category}: {round(total, 2)} birr")
+
+
+if __name__ == "__main__":
+    main()
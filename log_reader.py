@@ -0,0 +1,207 @@
+# ------------------------------------------
+# 📜 Log File Reader: recent entries first, without loading the file
+# ------------------------------------------
+# Used by the Message Saver (Day7.py) and the Notes Manager (Day_17).
+# - tail(n)            last n lines, read backwards from the end in blocks
+# - iter_backward()    every line, newest first
+# - page_before(...)   one page of older lines ending at a byte offset
+# - page_after(...)    one page of newer lines starting at a byte offset
+# - count()            number of lines, kept in a small "<file>.idx"
+#                      sidecar so only lines added since last time are counted
+#                      (a rewritten or truncated file is detected and recounted)
+# Lines still buffered by this program's shared append writer are flushed
+# first, so they are always included.
+
+import json
+import os
+from typing import Iterator, List, Optional, Tuple
+
+from append_writer import flush_file
+
+BLOCK_SIZE = 64 * 1024
+MARKER_SIZE = 32  # bytes remembered from the end of the counted region
+
+
+class LogReader:
+    """
+    Reads a line-oriented text file from either end without loading it all.
+    """
+    def __init__(self, file_name: str, block_size: int = BLOCK_SIZE,
+                 encoding: str = "utf-8"):
+        self.file_name = file_name
+        self.block_size = block_size
+        self.encoding = encoding
+        self.index_file = file_name + ".idx"
+
+    def size(self) -> int:
+        flush_file(self.file_name)
+        return os.path.getsize(self.file_name)
+
+    # ---------- backward reading ----------
+    def _lines_backward(self, end: int) -> Iterator[Tuple[int, bytes]]:
+        # Yield (start offset, raw line) for each line ending at or before end,
+        # newest first, reading blocks from the end of the file
+        with open(self.file_name, "rb") as f:
+            position = end
+            remainder = b""
+            while position > 0:
+                read_size = min(self.block_size, position)
+                position -= read_size
+                f.seek(position)
+                block = f.read(read_size) + remainder
+                lines = block.split(b"\n")
+                remainder = lines.pop(0)  # may continue in the previous block
+                offset = position + len(remainder) + 1
+                starts = []
+                for line in lines:
+                    starts.append((offset, line))
+                    offset += len(line) + 1
+                yield from reversed(starts)
+            if remainder or end > 0:
+                yield 0, remainder
+
+    def _backward(self, end: int) -> Iterator[Tuple[int, str]]:
+        skip_trailing = True
+        for start, line in self._lines_backward(end):
+            # The empty "line" after the final newline is not an entry
+            if skip_trailing and line == b"" and start == end:
+                skip_trailing = False
+                continue
+            skip_trailing = False
+            yield start, line.decode(self.encoding)
+
+    def iter_backward(self) -> Iterator[str]:
+        """
+        Every line of the file, newest first.
+        """
+        for _, line in self._backward(self.size()):
+            yield line
+
+    def tail(self, n: int) -> List[str]:
+        """
+        The last n lines, oldest first (like `tail -n`).
+        """
+        lines, _ = self.page_before(None, n)
+        return lines
+
+    def page_before(self, offset: Optional[int], n: int) -> Tuple[List[str], int]:
+        """
+        Up to n lines ending just before byte offset (None = end of file),
+        oldest first, plus the offset where they start: pass it back in to
+        get the page before this one. An offset of 0 means the start was reached.
+        """
+        end = self.size() if offset is None else offset
+        lines: List[str] = []
+        start = end
+        if n <= 0:
+            return lines, start
+        for start, line in self._backward(end):
+            lines.append(line)
+            if len(lines) == n:
+                break
+        lines.reverse()
+        return lines, start if lines else end
+
+    # ---------- forward reading ----------
+    def page_after(self, offset: int, n: int) -> Tuple[List[str], int]:
+        """
+        Up to n lines starting at byte offset, plus the offset of the next page.
+        """
+        flush_file(self.file_name)
+        lines = []
+        with open(self.file_name, "rb") as f:
+            f.seek(offset)
+            for _ in range(n):
+                raw = f.readline()
+                if not raw:
+                    break
+                lines.append(raw.rstrip(b"\n").decode(self.encoding))
+            return lines, f.tell()
+
+    # ---------- line count ----------
+    def count(self) -> int:
+        """
+        Number of lines in the file (a last line without a newline counts
+        too, as in tail()). Only bytes added since the last call are
+        scanned; the running newline count lives in the .idx sidecar.
+        """
+        flush_file(self.file_name)  # the sidecar must only record what is on disk
+        stat = os.stat(self.file_name)
+        size = stat.st_size
+        try:
+            with open(self.index_file, "r") as f:
+                index = json.load(f)
+            covered, count = index["size"], index["count"]
+            inode, marker = index["inode"], bytes.fromhex(index["marker"])
+        except (FileNotFoundError, ValueError, KeyError):
+            covered, count, inode, marker = 0, 0, stat.st_ino, b""
+
+        with open(self.file_name, "rb") as f:
+            # The counted part must still be there: same file, not shorter,
+            # and ending in the same bytes as when it was counted
+            f.seek(max(0, covered - len(marker)))
+            if inode != stat.st_ino or covered > size or f.read(len(marker)) != marker:
+                covered, count = 0, 0
+            if covered == size:
+                return count + self._unterminated(marker)
+
+            f.seek(covered)
+            while True:
+                block = f.read(1 << 20)
+                if not block:
+                    break
+                count += block.count(b"\n")
+                covered += len(block)
+            f.seek(max(0, covered - MARKER_SIZE))
+            marker = f.read(MARKER_SIZE)
+
+        temp = self.index_file + ".tmp"
+        with open(temp, "w") as f:
+            json.dump({"size": covered, "count": count, "inode": stat.st_ino,
+                       "marker": marker.hex()}, f)
+        os.replace(temp, self.index_file)
+        return count + self._unterminated(marker)
+
+    @staticmethod
+    def _unterminated(marker: bytes) -> int:
+        # 1 if the file ends in a line without a newline (marker = its last bytes)
+        return 1 if marker and not marker.endswith(b"\n") else 0
+
+
+# ------------------------------------------
+# Benchmark: last 20 lines of a large file
+# ------------------------------------------
+def benchmark(size_mb: int = 1024, file_name: str = "bench_log.txt") -> None:
+    import time
+
+    with open(file_name, "w") as f:
+        line = "Alice: this is a fairly ordinary message line\n" * 10_000
+        while f.tell() < size_mb * 1024 * 1024:
+            f.write(line)
+    reader = LogReader(file_name)
+
+    start = time.perf_counter()
+    with open(file_name) as f:
+        lines = f.readlines()
+    recent = lines[-20:]
+    del lines
+    print(f"readlines()[-20:]: {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    assert reader.tail(20) == [line.rstrip("\n") for line in recent]
+    print(f"tail(20):          {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+    start = time.perf_counter()
+    total = reader.count()
+    print(f"count() first run: {time.perf_counter() - start:.2f}s ({total:,} lines)")
+    start = time.perf_counter()
+    reader.count()
+    print(f"count() cached:    {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+    os.remove(file_name)
+    os.remove(reader.index_file)
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1024)
@@ -0,0 +1,195 @@
+# ------------------------------------------
+# 📣 Message Board Service (built on the Day7 message store)
+# ------------------------------------------
+# - Messages are stored exactly like Day7.py does it: "name: message"
+#   lines appended to messages.txt (through the same shared, buffered
+#   append writer, which is flushed when the program exits)
+# - Any number of producers can post() concurrently on one asyncio loop
+# - Subscribers get every new message pushed into their own queue, so
+#   nobody has to poll the file
+# - A per-sender index (sender -> byte offsets of their lines) answers
+#   "messages from X" by seeking straight to those lines. Offsets are read
+#   from the file itself: before each lookup only the bytes added since the
+#   last one are scanned, so lines appended by Day7.py, another board or
+#   another process are indexed at their real position
+# - run_load_test() reports messages/sec and delivery latency
+
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from append_writer import get_writer
+
+MESSAGES_FILE = "messages.txt"
+QUEUE_SIZE = 1000  # messages a slow subscriber may fall behind by
+
+Message = Tuple[str, str, float]  # (sender, text, time posted)
+
+
+def parse_message(line: str) -> Tuple[str, str]:
+    sender, _, text = line.rstrip("\n").partition(": ")
+    return sender, text
+
+
+class Subscription:
+    """
+    Queue of new messages for one subscriber. Use with `async for`.
+    If the subscriber falls more than QUEUE_SIZE messages behind, the
+    oldest undelivered messages are dropped and counted in `dropped`.
+    """
+    def __init__(self, board: "MessageBoard", maxsize: int):
+        self._board = board
+        self.queue: "asyncio.Queue[Message]" = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def _deliver(self, message: Message) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    async def get(self) -> Message:
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self._board._subscribers.discard(self)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Message:
+        return await self.queue.get()
+
+
+class MessageBoard:
+    """
+    Multi-user message board over an append-only messages file.
+    """
+    def __init__(self, file_name: str = MESSAGES_FILE):
+        self.file_name = file_name
+        self._by_sender: Dict[str, List[int]] = {}
+        self._indexed = 0  # bytes of the file already in _by_sender
+        self._subscribers: Set[Subscription] = set()
+        self._writer = get_writer(file_name)
+        self._catch_up()
+
+    def _catch_up(self) -> None:
+        # Index the complete lines added to the file since the last call
+        self._writer.flush()
+        try:
+            size = os.path.getsize(self.file_name)
+        except FileNotFoundError:
+            size = 0
+        if size < self._indexed:  # truncated or replaced: start over
+            self._by_sender.clear()
+            self._indexed = 0
+        if size == self._indexed:
+            return
+        with open(self.file_name, "rb") as f:
+            f.seek(self._indexed)
+            offset = self._indexed
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # still being written by someone else
+                sender, _ = parse_message(raw.decode("utf-8", errors="replace"))
+                self._by_sender.setdefault(sender, []).append(offset)
+                offset += len(raw)
+        self._indexed = offset
+
+    def close(self) -> None:
+        # The shared writer stays open for other users of the file
+        self._writer.flush()
+
+    def senders(self) -> List[str]:
+        self._catch_up()
+        return list(self._by_sender)
+
+    def subscribe(self, maxsize: int = QUEUE_SIZE) -> Subscription:
+        subscription = Subscription(self, maxsize)
+        self._subscribers.add(subscription)
+        return subscription
+
+    async def post(self, sender: str, text: str) -> None:
+        """
+        Store a message and push it to every subscriber.
+        """
+        sender, text = sender.strip(), " ".join(text.split())
+        if sender == "" or ":" in sender or "\n" in sender:
+            raise ValueError("Sender name cannot be empty or contain ':'")
+        self._writer.write(f"{sender}: {text}\n")
+        message = (sender, text, time.perf_counter())
+        for subscription in list(self._subscribers):
+            subscription._deliver(message)
+
+    def messages_from(self, sender: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Texts posted by sender, oldest first (the newest `limit` if given).
+        Reads only that sender's lines from the file.
+        """
+        self._catch_up()
+        offsets = self._by_sender.get(sender, [])
+        if limit is not None:
+            offsets = offsets[-limit:] if limit > 0 else []
+        if not offsets:
+            return []
+        texts = []
+        with open(self.file_name, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                texts.append(parse_message(f.readline().decode("utf-8"))[1])
+        return texts
+
+
+# ------------------------------------------
+# Local load test
+# ------------------------------------------
+async def _load(board: MessageBoard, producers: int, messages: int,
+                subscribers: int) -> Tuple[float, List[float]]:
+    subscriptions = [board.subscribe(maxsize=producers * messages) for _ in range(subscribers)]
+    latencies: List[float] = []
+    total = producers * messages
+
+    async def consume(subscription: Subscription) -> None:
+        for _ in range(total):
+            _, _, posted = await subscription.get()
+            latencies.append(time.perf_counter() - posted)
+        subscription.close()
+
+    async def produce(number: int) -> None:
+        for i in range(messages):
+            await board.post(f"user{number}", f"message {i} from producer {number}")
+            if i % 100 == 0:
+                await asyncio.sleep(0)  # let subscribers run
+
+    start = time.perf_counter()
+    consumers = [asyncio.create_task(consume(s)) for s in subscriptions]
+    await asyncio.gather(*(produce(n) for n in range(producers)))
+    await asyncio.gather(*consumers)
+    return time.perf_counter() - start, latencies
+
+
+def run_load_test(producers: int = 20, messages: int = 5_000, subscribers: int = 5,
+                  file_name: str = "bench_messages.txt") -> None:
+    if os.path.exists(file_name):
+        os.remove(file_name)
+    board = MessageBoard(file_name)
+    elapsed, latencies = asyncio.run(_load(board, producers, messages, subscribers))
+    total = producers * messages
+
+    start = time.perf_counter()
+    found = len(board.messages_from("user0"))
+    lookup = time.perf_counter() - start
+    board.close()
+    os.remove(file_name)
+
+    latencies.sort()
+    print(f"{producers} producers x {messages:,} messages, {subscribers} subscribers")
+    print(f"Throughput: {total / elapsed:,.0f} messages/s posted and delivered")
+    print(f"Delivery latency p50: {latencies[len(latencies) // 2] * 1e3:.2f} ms, "
+          f"p99: {latencies[int(len(latencies) * 0.99)] * 1e3:.2f} ms")
+    print(f"messages_from('user0'): {found:,} messages in {lookup * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    run_load_test()
@@ -0,0 +1,228 @@
+# ------------------------------------------
+# 📊 Quantiles and Top-k for huge number streams
+# ------------------------------------------
+# - KLLSketch: approximate median / percentiles of any number of values
+#   in a few hundred stored numbers plus one BLOCK of input (the KLL
+#   sketch by Karnin, Lang and Liberty). Rank error is typically well
+#   under 1% with the default k=200, shrinks as k grows and does not grow
+#   with the stream length.
+# - TopK: the exact k largest (or smallest) values, kept with heapq
+# - Both are mergeable: sketches built on different files or in different
+#   worker processes combine with merge(), as if one had seen all data.
+#   They hold only plain lists, so they pickle cheaply between processes.
+
+import heapq
+import math
+import random
+from itertools import islice
+from typing import Iterable, List, Optional, Sequence
+
+BLOCK = 65_536  # numbers taken from the input at a time
+
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch. Level h stores values that each stand for
+    2**h original values; a full level is sorted and every other value
+    (random start) is promoted to the next level.
+    """
+    def __init__(self, k: int = 200, c: float = 2 / 3, seed: Optional[int] = None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.c = c
+        self.count = 0  # values seen
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._levels: List[List[float]] = [[]]
+        self._size = 0       # values stored over all levels
+        self._max_size = self._capacity(0)
+        self._random = random.Random(seed)
+
+    def __repr__(self) -> str:
+        return f"KLLSketch(k={self.k}, count={self.count}, stored={self._size})"
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_random"] = None  # reseeded on unpickle; no need to ship RNG state
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._random = random.Random()
+
+    # ---------- capacity ----------
+    def _capacity(self, level: int) -> int:
+        # The top level holds k values; each level below holds c times fewer
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self.k * self.c ** depth)))
+
+    def _add_level(self) -> None:
+        self._levels.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self._levels)))
+
+    def _compress(self) -> None:
+        while self._size >= self._max_size:
+            for h, level in enumerate(self._levels):
+                if len(level) >= self._capacity(h):
+                    if h + 1 == len(self._levels):
+                        self._add_level()
+                    level.sort()
+                    keep = [level.pop()] if len(level) % 2 else []
+                    self._levels[h + 1].extend(level[self._random.randint(0, 1)::2])
+                    self._size -= len(level) // 2
+                    self._levels[h] = keep
+                    break
+
+    # ---------- adding values ----------
+    def add(self, x: float) -> None:
+        self.update((x,))
+
+    def update(self, numbers: Iterable[float]) -> "KLLSketch":
+        iterator = iter(numbers)
+        while True:
+            # Level 0 takes up to BLOCK values before compressing: fewer,
+            # larger compactions are faster and never add error (each
+            # compaction shifts any rank by at most its level's weight)
+            block = list(islice(iterator, BLOCK))
+            if not block:
+                return self
+            self.count += len(block)
+            self.minimum = min(self.minimum, min(block))
+            self.maximum = max(self.maximum, max(block))
+            self._levels[0].extend(block)
+            self._size += len(block)
+            self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Add everything other has seen into self.
+        """
+        while len(self._levels) < len(other._levels):
+            self._add_level()
+        for h, level in enumerate(other._levels):
+            self._levels[h].extend(level)
+        self._size += other._size
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._compress()
+        return self
+
+    # ---------- queries ----------
+    def _weighted(self) -> List[tuple]:
+        return sorted((x, 1 << h) for h, level in enumerate(self._levels) for x in level)
+
+    def quantiles(self, fractions: Sequence[float]) -> List[float]:
+        """
+        Approximate values at each fraction (0.5 = median, 0.99 = p99).
+        Exact when everything still fits in the sketch.
+        """
+        if self.count == 0:
+            raise ValueError("quantiles of an empty sketch")
+        items = self._weighted()
+        total = sum(weight for _, weight in items)
+        answers = []
+        for q in fractions:
+            if not 0 <= q <= 1:
+                raise ValueError("fractions must be between 0 and 1")
+            if q == 0:
+                answers.append(self.minimum)
+                continue
+            if q == 1:
+                answers.append(self.maximum)
+                continue
+            target = q * total
+            seen = 0
+            for x, weight in items:
+                seen += weight
+                if seen >= target:
+                    answers.append(x)
+                    break
+        return answers
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles([q])[0]
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+    def rank(self, x: float) -> float:
+        """
+        Approximate fraction of values <= x.
+        """
+        items = self._weighted()
+        total = sum(weight for _, weight in items)
+        return sum(weight for value, weight in items if value <= x) / total if total else 0.0
+
+
+class TopK:
+    """
+    The k largest values seen (or the k smallest with largest=False), exact.
+    """
+    def __init__(self, k: int = 10, largest: bool = True):
+        self.k = k
+        self.largest = largest
+        self._items: List[float] = []
+
+    def _select(self, values: Iterable[float]) -> List[float]:
+        return heapq.nlargest(self.k, values) if self.largest else heapq.nsmallest(self.k, values)
+
+    def update(self, numbers: Iterable[float]) -> "TopK":
+        iterator = iter(numbers)
+        while True:
+            block = list(islice(iterator, BLOCK))
+            if not block:
+                return self
+            self._items = self._select(self._items + block)
+
+    def merge(self, other: "TopK") -> "TopK":
+        self._items = self._select(self._items + other._items)
+        return self
+
+    def values(self) -> List[float]:
+        """Largest first (or smallest first for largest=False)."""
+        return list(self._items)
+
+
+# ------------------------------------------
+# Benchmark: sorting everything vs the sketch
+# ------------------------------------------
+def benchmark(count: int = 2_000_000) -> None:
+    import bisect
+    import time
+
+    numbers = [random.gauss(0, 1) for _ in range(count)]
+    fractions = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+    start = time.perf_counter()
+    ordered = sorted(numbers)
+    exact = [ordered[min(count - 1, int(q * count))] for q in fractions]
+    top = ordered[-10:][::-1]
+    sorting = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sketch = KLLSketch().update(numbers)
+    approx = sketch.quantiles(fractions)
+    largest = TopK(10).update(numbers).values()
+    sketching = time.perf_counter() - start
+
+    # Merging: four "workers" each sketch a quarter
+    quarter = count // 4
+    merged = KLLSketch()
+    for i in range(4):
+        merged.merge(KLLSketch().update(numbers[i * quarter:(i + 1) * quarter]))
+
+    print(f"{count:,} numbers")
+    print(f"sort everything      {sorting:.2f} s")
+    print(f"KLL sketch + top-10  {sketching:.2f} s, {sketch._size:,} values stored")
+    assert largest == top
+    for q, e, a, m in zip(fractions, exact, approx, merged.quantiles(fractions)):
+        rank_error = abs(bisect.bisect_right(ordered, a) / count - q)
+        print(f"  q={q:<5} exact {e:>8.4f}  sketch {a:>8.4f}  merged {m:>8.4f}  "
+              f"rank error {rank_error:.2%}")
+    print(f"  merged from 4 parts: {merged}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,345 @@
+# ------------------------------------------
+# Rate Limiter + Lockout Tracker
+# Shared by the login systems (Day10/Day14 and Day15)
+# ------------------------------------------
+# - TokenBucketLimiter: steady refill rate with a burst capacity
+# - SlidingWindowLimiter: at most `limit` events per `window` seconds
+#   (sliding-window counter: two counters per key, not a list of timestamps)
+# - LockoutTracker: the "3 failed attempts" rule on top of a sliding window
+# Every limiter keeps O(1) state per key, forgets keys that have been idle
+# longer than `ttl`, and can be saved to / loaded from a JSON file.
+# LockoutTracker can instead keep its state in an SQLite file, one row per
+# key: each failure reads and writes only that key's row inside a write
+# transaction, so several processes (both login programs) share lockouts.
+
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+# Shared by every login program, wherever it is started from
+LOCKOUT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lockouts.db")
+
+
+def make_key(username: str, client: Optional[str] = None) -> str:
+    """
+    Build the limiter key for a username, optionally scoped to a client
+    (IP address, terminal name, ...).
+    """
+    return username if client is None else f"{username}|{client}"
+
+
+class _KeyedLimiter:
+    """
+    Common per-key storage: an OrderedDict in order of last_seen (the last
+    value of each key's state), so idle keys can be evicted from the front
+    in O(1) each. Only writes move a key to the back; a read such as
+    count() leaves last_seen alone, so it must not reorder the key either.
+    """
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.time):
+        self.ttl = ttl
+        self.clock = clock
+        self._state: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def _touch(self, key: str, now: float, write: bool = False) -> Optional[List[float]]:
+        # Return the key's state (or None); a write sets last_seen to now,
+        # so the key moves to the back of the eviction order
+        state = self._state.get(key)
+        if state is not None and write:
+            self._state.move_to_end(key)
+        self._evict(now)
+        return state
+
+    def _evict(self, now: float, limit: int = 2) -> None:
+        # Drop a couple of idle keys per call; amortized O(1)
+        for _ in range(limit):
+            if not self._state:
+                return
+            key, state = next(iter(self._state.items()))
+            if now - state[-1] < self.ttl:
+                return
+            del self._state[key]
+
+    def evict_idle(self) -> int:
+        """
+        Remove every key idle for longer than ttl. Returns how many were removed.
+        """
+        before = len(self._state)
+        self._evict(self.clock(), limit=before)
+        return before - len(self._state)
+
+    def reset(self, key: str) -> None:
+        self._state.pop(key, None)
+
+    def get_state(self, key: str) -> Optional[List[float]]:
+        return self._state.get(key)
+
+    def set_state(self, key: str, state: Optional[List[float]]) -> None:
+        # Stored at the back: only for a state that was just used, or one
+        # that is dropped again straight after (LockoutTracker's SQLite rows)
+        if state is None:
+            self._state.pop(key, None)
+        else:
+            self._state[key] = list(state)
+            self._state.move_to_end(key)
+
+    # ---------- persistence ----------
+    def save(self, filename: str) -> None:
+        """
+        Write all live keys to filename (atomically, via a temp file).
+        """
+        self.evict_idle()
+        temp = filename + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(self._state, f)
+        os.replace(temp, filename)
+
+    def load(self, filename: str) -> None:
+        """
+        Replace the current state with the keys saved in filename.
+        A missing file just means nothing has been limited yet.
+        """
+        if not os.path.exists(filename):
+            return
+        with open(filename, "r", encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                raise ValueError(f"Corrupted limiter state in {filename}.")
+        # Restore in last-seen order so eviction still starts with the oldest
+        self._state = OrderedDict(sorted(data.items(), key=lambda item: item[1][-1]))
+        self.evict_idle()
+
+
+class TokenBucketLimiter(_KeyedLimiter):
+    """
+    Each key has a bucket of `capacity` tokens refilled at `rate` tokens/sec.
+    State per key: [tokens, last_update].
+    """
+    def __init__(self, rate: float, capacity: float, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.time):
+        # A bucket idle long enough to refill completely carries no information
+        super().__init__(ttl if ttl is not None else capacity / rate, clock)
+        self.rate = rate
+        self.capacity = capacity
+
+    def allow(self, key: str, cost: float = 1.0) -> bool:
+        now = self.clock()
+        state = self._touch(key, now, write=True)
+        if state is None:
+            state = self._state[key] = [self.capacity, now]
+        tokens = min(self.capacity, state[0] + (now - state[1]) * self.rate)
+        state[1] = now
+        if tokens >= cost:
+            state[0] = tokens - cost
+            return True
+        state[0] = tokens
+        return False
+
+
+class SlidingWindowLimiter(_KeyedLimiter):
+    """
+    At most `limit` events per `window` seconds per key.
+    State per key: [window_start, previous_count, current_count, last_seen].
+    The previous window's count is weighted by how much of it still overlaps
+    the sliding window, which approximates an exact log in constant space.
+    """
+    def __init__(self, limit: int, window: float, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.time):
+        super().__init__(ttl if ttl is not None else 2 * window, clock)
+        self.limit = limit
+        self.window = window
+
+    def _roll(self, state: List[float], now: float) -> None:
+        # Advance the fixed windows so state[0] is the start of the current one
+        elapsed_windows = int((now - state[0]) // self.window)
+        if elapsed_windows == 1:
+            state[1], state[2] = state[2], 0
+        elif elapsed_windows > 1:
+            state[1], state[2] = 0, 0
+        if elapsed_windows:
+            state[0] += elapsed_windows * self.window
+
+    def count(self, key: str) -> float:
+        """
+        Estimated number of events for key within the last `window` seconds.
+        """
+        now = self.clock()
+        state = self._touch(key, now)
+        if state is None:
+            return 0.0
+        self._roll(state, now)
+        overlap = 1.0 - (now - state[0]) / self.window
+        return state[1] * overlap + state[2]
+
+    def hit(self, key: str) -> None:
+        """
+        Record one event for key, whether or not it is over the limit.
+        """
+        now = self.clock()
+        state = self._touch(key, now, write=True)
+        if state is None:
+            state = self._state[key] = [now, 0, 0, now]
+        self._roll(state, now)
+        state[2] += 1
+        state[3] = now
+
+    def allow(self, key: str) -> bool:
+        """
+        Record an event and return True if key is still within its limit.
+        """
+        if self.count(key) >= self.limit:
+            return False
+        self.hit(key)
+        return True
+
+
+class LockoutTracker:
+    """
+    Failed-login tracking: a key is locked once it has `max_failures`
+    failures within `window` seconds. A successful login resets it.
+    With a filename, every key's state lives in that SQLite file and is
+    re-read on each check, so other processes see the same lockouts.
+    """
+    def __init__(self, max_failures: int = 3, window: float = 15 * 60,
+                 filename: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        self.max_failures = max_failures
+        self.filename = filename
+        self._failures = SlidingWindowLimiter(max_failures, window, clock=clock)
+        self._db = None
+        if filename:
+            # Autocommit mode: write transactions are started explicitly below
+            self._db = sqlite3.connect(filename, timeout=30, isolation_level=None)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS lockouts ("
+                " key TEXT PRIMARY KEY,"
+                " window_start REAL NOT NULL,"
+                " previous REAL NOT NULL,"
+                " current REAL NOT NULL,"
+                " last_seen REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS by_last_seen ON lockouts (last_seen)")
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        if self._db is not None:
+            return self._db.execute("SELECT COUNT(*) FROM lockouts").fetchone()[0]
+        return len(self._failures)
+
+    # ---------- shared state (one row per key) ----------
+    def _load(self, key: str) -> None:
+        # Replace the in-memory state of key with the row in the file
+        row = self._db.execute(
+            "SELECT window_start, previous, current, last_seen FROM lockouts WHERE key = ?", (key,)
+        ).fetchone()
+        self._failures.set_state(key, row)
+
+    def _left(self, key: str) -> int:
+        return max(0, self.max_failures - int(round(self._failures.count(key))))
+
+    def _update(self, key: str, change: Callable[[str], None]) -> int:
+        # Read-modify-write of one key inside a write transaction, so two
+        # processes recording failures at once cannot lose one.
+        # Returns the attempts left afterwards.
+        if self._db is None:
+            change(key)
+            return self._left(key)
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._load(key)
+            change(key)
+            left = self._left(key)
+            state = self._failures.get_state(key)
+            if state is None:
+                self._db.execute("DELETE FROM lockouts WHERE key = ?", (key,))
+            else:
+                self._db.execute("INSERT OR REPLACE INTO lockouts VALUES (?, ?, ?, ?, ?)",
+                                 (key, *state))
+            # Forget keys idle for longer than the limiter's ttl (indexed range)
+            self._db.execute("DELETE FROM lockouts WHERE last_seen < ?",
+                             (self._failures.clock() - self._failures.ttl,))
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        finally:
+            self._failures.set_state(key, None)  # the file is the only copy
+        return left
+
+    # ---------- lockout rule ----------
+    def attempts_left(self, key: str) -> int:
+        if self._db is None:
+            return self._left(key)
+        self._load(key)
+        try:
+            return self._left(key)
+        finally:
+            self._failures.set_state(key, None)
+
+    def is_locked(self, key: str) -> bool:
+        return self.attempts_left(key) == 0
+
+    def record_failure(self, key: str) -> int:
+        """
+        Count a failed attempt and return how many attempts are left.
+        """
+        return self._update(key, self._failures.hit)
+
+    def reset(self, key: str) -> None:
+        self._update(key, self._failures.reset)
+
+
+# ------------------------------------------
+# Benchmark: millions of keys
+# ------------------------------------------
+def benchmark(keys: int = 2_000_000) -> None:
+    """
+    Time allow() over `keys` distinct keys, then show TTL eviction at work.
+    """
+    import tracemalloc
+
+    fake_now = [0.0]
+    clock = lambda: fake_now[0]
+
+    for name, make in [
+        ("token bucket", lambda: TokenBucketLimiter(rate=1.0, capacity=5, ttl=60, clock=clock)),
+        ("sliding window", lambda: SlidingWindowLimiter(limit=5, window=60, clock=clock)),
+    ]:
+        # Memory per key, measured on a smaller sample (tracemalloc is slow)
+        sample = make()
+        tracemalloc.start()
+        for i in range(100_000):
+            sample.allow(f"user{i}|10.0.{i % 256}.1")
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        fake_now[0] = 0.0
+        limiter = make()
+        start = time.perf_counter()
+        for i in range(keys):
+            limiter.allow(f"user{i}|10.0.{i % 256}.1")
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {keys / elapsed:,.0f} allow()/s over {len(limiter):,} keys, "
+              f"~{memory / len(sample):.0f} bytes/key")
+
+        # Jump past the TTL: every key is idle and gets dropped
+        fake_now[0] = 10_000.0
+        start = time.perf_counter()
+        removed = limiter.evict_idle()
+        print(f"  evicted {removed:,} idle keys in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -0,0 +1,182 @@
+# ------------------------------------------
+# 📈 Streaming Statistics (one pass, any size)
+# ------------------------------------------
+# RunningStats keeps count, sum, min, max, mean and variance while the
+# numbers stream past, so they never have to be in memory all at once.
+# - Mean/variance use Welford's method (no "sum of squares" cancellation)
+# - Numbers are taken in blocks of BLOCK values: each block is summarized
+#   with the C builtins (sum/min/max) and merged in, which is much faster
+#   in CPython than a Python-level update per number
+# - merge() combines two RunningStats exactly, e.g. results from
+#   different files or worker processes
+# - read_numbers() streams numbers from a text file (whitespace or comma
+#   separated) or a binary file of float64 values
+
+import math
+import operator
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+BLOCK = 65_536  # numbers summarized at a time
+CHUNK_BYTES = 1024 * 1024  # bytes read at a time by read_numbers()
+
+
+class RunningStats:
+    """
+    Count, sum, min, max, mean and variance of a stream of numbers.
+    """
+    def __init__(self, numbers: Optional[Iterable[float]] = None):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.mean = 0.0
+        self._m2 = 0.0  # sum of squared differences from the mean
+        if numbers is not None:
+            self.update(numbers)
+
+    def __repr__(self) -> str:
+        return (f"RunningStats(count={self.count}, mean={self.mean}, "
+                f"min={self.minimum}, max={self.maximum}, variance={self.variance})")
+
+    # ---------- adding numbers ----------
+    def add(self, x: float) -> None:
+        # Welford's update for a single number
+        self.count += 1
+        self.total += x
+        if x < self.minimum:
+            self.minimum = x
+        if x > self.maximum:
+            self.maximum = x
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+
+    def update(self, numbers: Iterable[float]) -> "RunningStats":
+        """
+        Add every number from numbers (a list, generator, file reader...).
+        """
+        iterator = iter(numbers)
+        while True:
+            block = list(islice(iterator, BLOCK))
+            if not block:
+                return self
+            self._add_block(block)
+
+    def _add_block(self, block: List[float]) -> None:
+        n = len(block)
+        total = sum(block)
+        mean = total / n
+        part = RunningStats()
+        part.count, part.total, part.mean = n, float(total), mean
+        part.minimum, part.maximum = min(block), max(block)
+        deviations = [x - mean for x in block]
+        part._m2 = sum(map(operator.mul, deviations, deviations))
+        self.merge(part)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Combine other into self (Chan et al. parallel variance formula).
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.total, self.mean, self._m2 = other.count, other.total, other.mean, other._m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    # ---------- results ----------
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 for fewer than 2 numbers)."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def sample_variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+# ------------------------------------------
+# Reading numbers from files
+# ------------------------------------------
+def read_numbers(file_name: str, binary: Optional[bool] = None) -> Iterator[float]:
+    """
+    Numbers from file_name, CHUNK_BYTES at a time. Binary files hold raw
+    float64 values; binary=None means "yes if the name ends in .bin".
+    """
+    if binary is None:
+        binary = file_name.lower().endswith(".bin")
+    if binary:
+        with open(file_name, "rb") as f:
+            while True:
+                data = f.read(CHUNK_BYTES)
+                if not data:
+                    return
+                if len(data) % 8:
+                    raise ValueError("Binary file size is not a multiple of 8 bytes (float64)")
+                values = array("d")
+                values.frombytes(data)
+                yield from values
+    else:
+        with open(file_name, "r", encoding="utf-8") as f:
+            while True:
+                lines = f.readlines(CHUNK_BYTES)
+                if not lines:
+                    return
+                yield from map(float, "".join(lines).replace(",", " ").split())
+
+
+def stats_for_file(file_name: str, binary: Optional[bool] = None) -> RunningStats:
+    return RunningStats(read_numbers(file_name, binary))
+
+
+# ------------------------------------------
+# Benchmark: analyze_numbers' work, before and after
+# ------------------------------------------
+def benchmark(count: int = 2_000_000) -> None:
+    import random
+    import statistics
+    import time
+
+    numbers = [random.gauss(100, 15) for _ in range(count)]
+
+    start = time.perf_counter()
+    total, largest, smallest = sum(numbers), max(numbers), min(numbers)
+    average = sum(numbers) / len(numbers)
+    ascending, descending = sorted(numbers), sorted(numbers, reverse=True)
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stats = RunningStats(numbers)
+    ascending = sorted(numbers)
+    descending = ascending[::-1]
+    after = time.perf_counter() - start
+
+    start = time.perf_counter()
+    variance = statistics.pvariance(numbers)
+    pvariance = time.perf_counter() - start
+
+    print(f"{count:,} numbers")
+    print(f"{'sum x2, max, min, sort x2':<34} {before:.2f} s")
+    print(f"{'RunningStats + one sort':<34} {after:.2f} s (includes variance)")
+    print(f"{'statistics.pvariance alone':<34} {pvariance:.2f} s")
+    assert math.isclose(stats.total, total) and stats.maximum == largest and stats.minimum == smallest
+    assert math.isclose(stats.mean, average) and math.isclose(stats.variance, variance)
+
+
+if __name__ == "__main__":
+    benchmark()
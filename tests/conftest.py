@@ -0,0 +1,10 @@
+# Make the scripts importable the way they import each other: the repo
+# root and the Day folders whose modules are used side by side.
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+for folder in ("", "Day10", "Day15", "Day_17"):
+    path = os.path.normpath(os.path.join(ROOT, folder))
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,37 @@
+import math
+import random
+from array import array
+
+import analyze_file
+from streaming_stats import RunningStats
+
+
+def check_summary(summary, numbers):
+    whole = RunningStats(numbers)
+    assert summary.stats.count == len(numbers)
+    assert math.isclose(summary.stats.mean, whole.mean)
+    assert math.isclose(summary.stats.variance, whole.variance)
+    assert summary.largest.values() == sorted(numbers, reverse=True)[:analyze_file.TOP]
+    assert summary.smallest.values() == sorted(numbers)[:analyze_file.TOP]
+    assert summary.sketch.count == len(numbers)
+
+
+def test_text_ranges_never_split_a_number(tmp_path):
+    numbers = [round(random.uniform(-1000, 1000), 3) for _ in range(5_000)]
+    path = tmp_path / "numbers.txt"
+    path.write_text("\n".join(", ".join(map(str, numbers[i:i + 7]))
+                              for i in range(0, len(numbers), 7)) + "\n")
+    tasks = analyze_file.split_ranges(str(path), 1000)
+    assert len(tasks) > 10
+    # A split number would be counted twice (or fail to parse)
+    assert sum(analyze_file.summarize_range(task).stats.count for task in tasks) == len(numbers)
+    check_summary(analyze_file.analyze(str(path), workers=1, chunk_size=1000), numbers)
+
+
+def test_binary_file_with_workers(tmp_path):
+    numbers = [random.gauss(0, 1) for _ in range(20_000)]
+    path = tmp_path / "numbers.bin"
+    path.write_bytes(array("d", numbers).tobytes())
+    tasks = analyze_file.split_ranges(str(path), 1001)
+    assert all((end - start) % 8 == 0 for _, start, end, _ in tasks)
+    check_summary(analyze_file.analyze(str(path), workers=2, chunk_size=16_000), numbers)
@@ -0,0 +1,39 @@
+import os
+import threading
+
+from append_writer import BufferedAppendWriter, get_writer
+from log_reader import LogReader
+
+
+def test_lines_from_many_threads_stay_whole(tmp_path):
+    name = str(tmp_path / "log.txt")
+    with BufferedAppendWriter(name, max_buffer=1024) as writer:
+        threads = [threading.Thread(target=lambda n=n: [writer.write(f"t{n} line {i}\n")
+                                                         for i in range(500)])
+                   for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    with open(name) as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2000
+    assert all(line.startswith("t") and " line " in line for line in lines)
+
+
+def test_get_writer_is_shared_per_file(tmp_path):
+    name = str(tmp_path / "log.txt")
+    assert get_writer(name) is get_writer(os.path.join(str(tmp_path), ".", "log.txt"))
+
+
+def test_reader_sees_buffered_lines(tmp_path):
+    name = str(tmp_path / "messages.txt")
+    writer = get_writer(name, flush_interval=None)
+    for i in range(5):
+        writer.write(f"alice: message {i}\n")
+    reader = LogReader(name)
+    assert reader.count() == 5  # the .idx sidecar only records flushed data
+    writer.write("bob: one more\n")
+    assert reader.count() == 6
+    assert reader.tail(2) == ["alice: message 4", "bob: one more"]
+
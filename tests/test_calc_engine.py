@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+from calc_engine import ExpressionError, compile_expression, evaluate
+
+
+def test_expressions_match_the_calculator():
+    assert evaluate("power(2, 3) + sqrt(16)") == 12
+    assert evaluate("sin(30) * 2") == pytest.approx(1.0)
+    assert evaluate("x * 2 + y", x=3, y=1) == 7
+    assert evaluate("percentage(1, 4)") == 25
+
+
+def test_constants_are_folded():
+    expression = compile_expression("power(2, 10) + x * pi")
+    assert expression.folded == f"1024 + x * {math.pi!r}"
+    assert expression.variables == ("x",)
+    assert compile_expression("power(2, 10) + x * pi") is expression  # cached
+
+
+@pytest.mark.parametrize("text, bindings", [
+    ("1/0", {}),
+    ("x / y", {"x": 1, "y": 0}),
+    ("percentage(1, 0)", {}),
+    ("percentage(x, y)", {"x": 1, "y": 0}),
+    ("10 ** 10000", {}),
+    ("power(10, 10000)", {}),
+    ("e ** 1000", {}),
+    ("x ** 1000", {"x": 1e10}),
+    ("(-8) ** 0.5", {}),
+    ("sqrt((-8) ** 0.5)", {}),
+    ("sqrt(power(x, 0.5))", {"x": -8}),
+    ("tan(90)", {}),
+    ("sqrt(-1)", {}),
+])
+def test_arithmetic_errors_are_value_errors(text, bindings):
+    with pytest.raises(ValueError, match="^Error!"):
+        evaluate(text, **bindings)
+
+
+def test_batch_evaluation_reports_errors():
+    expression = compile_expression("1 / x + x ** 0.5")
+    assert expression.evaluate_columns(x=[1, 4]) == [2.0, 2.25]
+    with pytest.raises(ValueError):
+        expression.evaluate_columns(x=[1, 0])
+    with pytest.raises(ValueError):
+        expression.evaluate_many([{"x": 4}, {"x": -4}])
+
+
+def test_columns_of_different_lengths_are_rejected():
+    expression = compile_expression("x * y")
+    assert expression.evaluate_columns(x=[1, 2], y=[3, 4]) == [3, 8]
+    with pytest.raises(ExpressionError, match="same length"):
+        expression.evaluate_columns(x=[1, 2], y=[3])
+    with pytest.raises(ExpressionError, match="y"):
+        expression.evaluate_columns(x=[1, 2])
+
+
+@pytest.mark.parametrize("text", ["__import__('os')", "x.y", "open('f')", "'a' + 'b'", "sin(1, 2)", "1 +"])
+def test_unsafe_or_invalid_expressions_are_rejected(text):
+    with pytest.raises(ExpressionError):
+        compile_expression(text)
@@ -0,0 +1,54 @@
+import math
+
+import pytest
+
+import calc_vector
+from calc_vector import divide, power, sine, square_root, tangent
+
+INF, NAN = float("inf"), float("nan")
+ANGLES = [0.0, 30.0, 90.0, -90.0, 270.0, 45.5, INF, -INF, NAN]
+VALUES = [4.0, -4.0, 0.0, 2.5, INF, -INF, NAN, 1e300]
+
+# (function name, inputs) pairs covering every operation and its error cases
+CASES = [
+    ("divide", (VALUES, [2.0, 0.0, 0.0, -1.0, INF, 2.0, 1.0, 1e-300])),
+    ("power", (VALUES, [0.5, 0.5, -1.0, 2.0, 2.0, 3.0, 2.0, 2.0])),
+    ("square_root", (VALUES,)),
+    ("percentage", (VALUES, [8.0, 0.0, 1.0, 5.0, 1.0, 1.0, 1.0, 1e-300])),
+    ("sine", (ANGLES,)),
+    ("cosine", (ANGLES,)),
+    ("tangent", (ANGLES,)),
+]
+
+
+def same(a, b) -> bool:
+    return (math.isnan(a) and math.isnan(b)) or a == pytest.approx(b, rel=1e-12, abs=1e-12)
+
+
+def test_scalars_give_plain_numbers():
+    assert divide(1, 4) == (0.25, False)
+    value, error = divide(1, 0)
+    assert math.isnan(value) and error is True
+    assert type(square_root(9.0).values) is float and type(square_root(9.0).errors) is bool
+
+
+def test_errors_are_masked_not_raised():
+    values, errors = sine([30, INF, NAN])
+    assert values[0] == pytest.approx(0.5)
+    assert list(errors) == [False, True, True]
+    assert list(tangent([45, 90, -INF]).errors) == [False, True, True]
+    assert list(power([-8, 0, 2], [0.5, -1, 3]).errors) == [True, True, False]
+
+
+@pytest.mark.parametrize("name, args", CASES)
+def test_python_fallback_matches_numpy(name, args):
+    np = pytest.importorskip("numpy")
+    py_values, py_errors = calc_vector._python(getattr(calc_vector, f"_py_{name}"), *args)
+    np_values, np_errors = getattr(calc_vector, name)(*(np.array(a) for a in args))
+    assert list(py_errors) == np_errors.tolist()
+    assert all(same(a, b) for a, b in zip(py_values, np_values.tolist()))
+    for a, *rest in zip(*args):  # scalars: same types and values both ways
+        py_scalar = calc_vector._python(getattr(calc_vector, f"_py_{name}"), a, *rest)
+        np_scalar = getattr(calc_vector, name)(a, *rest)
+        assert type(np_scalar.values) is float and type(np_scalar.errors) is bool
+        assert py_scalar.errors == np_scalar.errors and same(py_scalar.values, np_scalar.values)
@@ -0,0 +1,64 @@
+from array import array
+
+import pytest
+
+import convert_stream
+from convert_stream import convert_file, main
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(convert_stream, "np", None)
+    return request.param
+
+
+def convert_text(tmp_path, text, conversion="celsius_to_fahrenheit", **options):
+    source, target = tmp_path / "in.csv", tmp_path / "out.csv"
+    source.write_text(text)
+    stats = convert_file(str(source), str(target), conversion, **options)
+    return target.read_text(), stats.values
+
+
+def test_single_column(tmp_path, backend):
+    assert convert_text(tmp_path, "0\n100\n-40\n") == ("32.0\n212.0\n-40.0\n", 3)
+
+
+def test_blank_lines_are_kept(tmp_path, backend):
+    assert convert_text(tmp_path, "10\n\n30\n") == ("50.0\n\n86.0\n", 2)
+
+
+def test_two_values_on_a_line_are_not_reshaped(tmp_path, backend):
+    with pytest.raises(ValueError, match="Line 1"):
+        convert_text(tmp_path, "10 20\n\n30\n")
+
+
+def test_column_and_header(tmp_path, backend):
+    text = "time,temp\n1,0\n2,100\n"
+    assert convert_text(tmp_path, text, "celsius:kelvin", column=1, header=True) == \
+        ("time,temp\n1,273.15\n2,373.15\n", 2)
+
+
+def test_small_chunks_give_the_same_result(tmp_path, backend):
+    text = "".join(f"{i}\n" if i % 7 else "\n" for i in range(1, 500))
+    whole, count = convert_text(tmp_path, text)
+    assert convert_text(tmp_path, text, chunk_size=16) == (whole, count)
+
+
+def test_binary_round_trip(tmp_path, backend):
+    source, target = tmp_path / "in.bin", tmp_path / "out.bin"
+    source.write_bytes(array("d", [0.0, 100.0, -40.0]).tobytes())
+    assert convert_file(str(source), str(target), "celsius_to_fahrenheit", chunk_size=1).values == 3
+    assert list(array("d", target.read_bytes())) == [32.0, 212.0, -40.0]
+
+
+def test_chunk_size_must_be_positive(tmp_path):
+    source = tmp_path / "in.bin"
+    source.write_bytes(array("d", [1.0]).tobytes())
+    with pytest.raises(ValueError):
+        convert_file(str(source), str(tmp_path / "out.bin"), "celsius_to_kelvin", chunk_size=0)
+    with pytest.raises(SystemExit):
+        main([str(source), str(tmp_path / "out.bin"), "celsius_to_kelvin", "--chunk-mb", "0"])
+    assert not (tmp_path / "out.bin").exists()
@@ -0,0 +1,39 @@
+import os
+
+from credential_store import CredentialStore, migrate_plaintext
+
+
+def make_store(tmp_path):
+    return CredentialStore(str(tmp_path / "users.db"), iterations=1_000)
+
+
+def test_passwords_are_hashed(tmp_path):
+    store = make_store(tmp_path)
+    store.register("alice", "pw")
+    salt, iterations, digest = store.get_record("alice")
+    assert digest != b"pw" and len(salt) == 16 and iterations == 1_000
+    assert store.verify("alice", "pw")
+    assert not store.verify("alice", "wrong")
+    assert not store.verify("nobody", "pw")
+    store.close()
+
+
+def test_migrate_plaintext_deletes_the_plaintext_file(tmp_path):
+    store = make_store(tmp_path)
+    plaintext = tmp_path / "users.txt"
+    plaintext.write_text("alice,pw\nbob,secret\n")
+    assert migrate_plaintext(store, str(plaintext)) == 2
+    assert not plaintext.exists()
+    assert [p for p in os.listdir(tmp_path) if p.startswith("users.txt")] == []
+    assert store.verify("alice", "pw") and store.verify("bob", "secret")
+    store.close()
+
+
+def test_malformed_lines_are_skipped(tmp_path, capsys):
+    store = make_store(tmp_path)
+    plaintext = tmp_path / "users.txt"
+    plaintext.write_text("alice,pw\nno-comma-here\n\nbob,secret\nalice,again\n")
+    assert store.import_plaintext(str(plaintext)) == 2
+    assert "line 2" in capsys.readouterr().out
+    assert store.verify("bob", "secret")
+    store.close()
@@ -0,0 +1,57 @@
+import pytest
+
+from day_18 import Developer, Employee, Manager
+from employee_directory import EmployeeDirectory
+
+
+@pytest.fixture
+def directory(tmp_path):
+    with EmployeeDirectory(str(tmp_path / "employees.db"), cache_size=2) as directory:
+        directory.add(Manager("Alice", "M101", 9000, "IT"))
+        directory.add(Developer("Bob", "D202", 7000, "Python"))
+        directory.add_many([Employee("Cara", "E303", 4000), Manager("Dan", "M102", 8000, "IT")])
+        yield directory
+
+
+def test_edits_are_not_visible_until_saved(directory):
+    alice = directory.get("M101")
+    alice.salary = 1
+    assert directory.get("M101").salary == 9000
+    assert directory.get("M101") is not directory.get("M101")
+    directory.save(alice)
+    assert directory.get("M101").salary == 1
+
+
+def test_get_and_queries_agree(directory):
+    for emp_id in ["M101", "D202", "E303", "M102"]:
+        directory.get(emp_id)  # fill and cycle the small LRU
+    dan = directory.get("M102")
+    dan.department = "HR"
+    assert [m.emp_id for m in directory.by_department("IT")] == ["M101", "M102"]
+    directory.save(dan)
+    assert [m.emp_id for m in directory.by_department("IT")] == ["M101"]
+    assert directory.get("M102").department == "HR"
+    assert [d.name for d in directory.by_language("Python")] == ["Bob"]
+
+
+def test_add_remove_and_errors(directory):
+    assert len(directory) == 4 and "E303" in directory
+    with pytest.raises(ValueError):
+        directory.add(Employee("Copy", "E303", 1))
+    directory.remove("E303")
+    assert "E303" not in directory and directory.get("E303") is None
+    with pytest.raises(KeyError):
+        directory.remove("E303")
+    with pytest.raises(KeyError):
+        directory.save(Employee("Ghost", "X999", 1))
+    assert [e.emp_id for e in directory] == ["D202", "M101", "M102"]
+
+
+def test_reopen_and_payroll(tmp_path):
+    path = str(tmp_path / "employees.db")
+    with EmployeeDirectory(path) as directory:
+        directory.add(Developer("Bob", "D202", 7000, "Python"))
+    with EmployeeDirectory(path) as directory:
+        bob = directory.get("D202")
+        assert isinstance(bob, Developer) and bob.programming_language == "Python"
+        assert len(directory.to_payroll()) == 1
@@ -0,0 +1,53 @@
+import datetime
+
+import pytest
+
+from expense_analytics import ExpenseAnalytics, FenwickTree
+from expense_ledger import ExpenseLedger
+
+
+def test_fenwick_tree_grows_in_both_directions():
+    tree = FenwickTree(1_000, size=4)
+    expected = {}
+    for day, amount in [(1_000, 1), (1_003, 2), (1_010, 3), (990, 4), (900, 5), (1_200, 6), (1_003, 1)]:
+        tree.add(day, amount)
+        expected[day] = expected.get(day, 0) + amount
+        for probe in range(890, 1_210):
+            assert tree.value(probe) == expected.get(probe, 0)
+    assert tree.range_sum(900, 1_200) == sum(expected.values())
+    assert tree.range_sum(991, 1_009) == 4
+    assert tree.range_sum(5, 2) == 0
+    assert tree.prefix(10_000) == sum(expected.values())  # past the end
+
+
+def test_monthly_across_the_year_boundary():
+    analytics = ExpenseAnalytics()
+    for date, amount in [(datetime.date(2023, 12, 31), 7), (datetime.date(2024, 1, 1), 3),
+                         (datetime.date(2024, 2, 29), 2), (datetime.date(2024, 12, 31), 5),
+                         (datetime.date(2025, 1, 1), 11)]:
+        analytics.add_day("Food", date.toordinal(), amount)
+    months = dict(analytics.monthly(2024))
+    assert months[1] == 3 and months[2] == 2 and months[12] == 5
+    assert sum(months.values()) == 10
+    assert dict(analytics.monthly(2023))[12] == 7
+    assert dict(analytics.monthly(2025))[1] == 11
+
+
+def test_from_ledger(tmp_path):
+    ledger = ExpenseLedger(str(tmp_path / "expenses.txt"))
+    noon = datetime.datetime(2024, 3, 10, 12).timestamp()
+    with open(ledger.file_name, "w") as f:
+        f.write("Food,100\n")  # no timestamp: in no day
+    ledger.add("Food", 10, noon)
+    ledger.add("Food", 5, noon + 86_400)
+    ledger.add("Rent", 300, noon)
+    analytics = ExpenseAnalytics.from_ledger(ledger)
+    day = datetime.date(2024, 3, 10)
+    assert sorted(analytics.categories()) == ["Food", "Rent"]
+    assert analytics.total(day, day) == 310
+    assert analytics.total(day, day + datetime.timedelta(days=1), "Food") == 15
+    assert analytics.by_category(day, day) == {"Food": 10, "Rent": 300}
+    assert analytics.daily(day, day + datetime.timedelta(days=2), "Food") == [
+        (day, 10), (day + datetime.timedelta(days=1), 5), (day + datetime.timedelta(days=2), 0)]
+    assert analytics.total(day, day, "Taxi") == 0
+    assert ExpenseAnalytics.from_file(ledger.file_name).total(day, day) == pytest.approx(310)
@@ -0,0 +1,84 @@
+import multiprocessing
+import os
+
+import pytest
+
+import expense_columnar
+from expense_columnar import ColumnarExpenseLog, columnar_to_text, text_to_columnar
+
+TEXT = "Food,12.5,1700000000\nRent,300\n\nFood,0.25,1700000100\nTaxi,-3.1,1700000200\n"
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(expense_columnar, "np", None)
+    return request.param
+
+
+def test_text_round_trip(tmp_path, backend):
+    text = tmp_path / "expenses.txt"
+    text.write_text(TEXT)
+    base = str(tmp_path / "expenses")
+    assert text_to_columnar(str(text), base, batch=2) == 4
+    log = ColumnarExpenseLog(base)
+    assert len(log) == 4
+    assert log.totals() == {"Food": 12.75, "Rent": 300, "Taxi": -3.1}
+    back = tmp_path / "back.txt"
+    assert columnar_to_text(base, str(back)) == 4
+    assert back.read_text() == ("Food,12.50,1700000000\nRent,300.00\n"
+                                "Food,0.25,1700000100\nTaxi,-3.10,1700000200\n")
+    with pytest.raises(ValueError):
+        text_to_columnar(str(text), base)  # never appends to an existing log
+
+
+def test_empty_log(tmp_path, backend):
+    log = ColumnarExpenseLog(str(tmp_path / "empty"))
+    assert len(log) == 0 and log.totals() == {}
+    log.extend([])
+    assert len(log) == 0 and log.totals() == {}
+    out = tmp_path / "out.txt"
+    assert columnar_to_text(log.base, str(out)) == 0 and out.read_text() == ""
+
+
+def test_half_written_row_is_ignored_then_cut_off(tmp_path, backend):
+    log = ColumnarExpenseLog(str(tmp_path / "expenses"))
+    log.extend([("Food", 1, 1), ("Rent", 2, 2)])
+    with open(log.column_files["cat"], "ab") as f:
+        f.write(b"\x01\x00")  # a crash after the first column of a third row
+    assert len(log) == 2
+    assert log.totals() == {"Food": 1, "Rent": 2}
+    log.append("Rent", 5, 3)
+    assert len(log) == 3
+    assert {name: os.path.getsize(path) for name, path in log.column_files.items()} == \
+        {"cat": 6, "amt": 24, "ts": 24}
+    assert log.totals() == {"Food": 1, "Rent": 7}
+
+
+def test_writers_share_one_dictionary(tmp_path, backend):
+    base = str(tmp_path / "expenses")
+    first, second = ColumnarExpenseLog(base), ColumnarExpenseLog(base)
+    first.append("Food", 1)
+    second.append("Rent", 2)  # must not reuse code 0 for "Rent"
+    first.append("Taxi", 3)
+    assert ColumnarExpenseLog(base).categories == ["Food", "Rent", "Taxi"]
+    assert first.totals() == second.totals() == {"Food": 1, "Rent": 2, "Taxi": 3}
+
+
+def _append_many(base, category, count):
+    log = ColumnarExpenseLog(base)
+    for _ in range(count):
+        log.append(category, 1)
+
+
+def test_concurrent_writers(tmp_path):
+    base = str(tmp_path / "expenses")
+    workers = [multiprocessing.Process(target=_append_many, args=(base, f"c{i}", 100))
+               for i in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert ColumnarExpenseLog(base).totals() == {f"c{i}": 100 for i in range(4)}
@@ -0,0 +1,146 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+import expense_ledger
+from expense_ledger import ExpenseLedger
+
+T = 1_700_000_000  # a fixed timestamp
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return ExpenseLedger(str(tmp_path / "expenses.txt"))
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    # Lines the ledger actually parses
+    lines = []
+    original = expense_ledger.parse_line
+
+    def counting(line):
+        lines.append(line)
+        return original(line)
+    monkeypatch.setattr(expense_ledger, "parse_line", counting)
+    return lines
+
+
+def test_only_the_new_tail_is_parsed(ledger, parsed):
+    with pytest.raises(FileNotFoundError):
+        ledger.totals()
+    ledger.add("Food", 10, T)
+    ledger.add("Rent", 100, T)
+    assert ledger.totals() == {"Food": 10, "Rent": 100}
+    assert len(parsed) == 2
+    ledger.add("Food", 5.5, T)
+    assert ExpenseLedger(ledger.file_name).totals() == {"Food": 15.5, "Rent": 100}
+    assert parsed[2:] == ["Food,5.5,%d" % T]
+    ledger.totals()
+    assert len(parsed) == 3
+
+
+def test_old_lines_count_towards_totals_only(ledger):
+    with open(ledger.file_name, "w") as f:
+        f.write("Food,3\n")
+    ledger.add("Food", 2, T)
+    assert ledger.totals() == {"Food": 5}
+    assert ledger.daily_totals() == {"Food": {expense_ledger.day_of(T): 2}}
+
+
+def test_half_written_line_waits(ledger):
+    ledger.add("Food", 10, T)
+    with open(ledger.file_name, "a") as f:
+        f.write("Food,2")
+    assert ledger.totals() == {"Food": 10}
+    with open(ledger.file_name, "a") as f:
+        f.write("0,%d\n" % T)
+    assert ledger.totals() == {"Food": 30}
+
+
+@pytest.mark.parametrize("rewrite", ["Food,1,%d\n" % T,                      # shorter
+                                     "Taxi,99,%d\n" % T,                     # same size
+                                     "Taxi,99,%d\nBus,1,%d\n" % (T, T)])     # longer
+def test_rewritten_log_is_parsed_again(ledger, rewrite):
+    ledger.add("Food", 10, T)
+    ledger.totals()
+    temp = ledger.file_name + ".new"
+    with open(temp, "w") as f:
+        f.write(rewrite)
+    os.replace(temp, ledger.file_name)
+    expected = {}
+    for line in rewrite.splitlines():
+        category, amount, _ = expense_ledger.parse_line(line)
+        expected[category] = expected.get(category, 0) + amount
+    assert ledger.totals() == expected
+
+
+def test_same_size_edit_in_place_is_noticed(ledger):
+    ledger.add("Food", 10, T)
+    ledger.totals()
+    with open(ledger.file_name, "r+") as f:
+        f.write("Taxi")
+    assert ledger.totals() == {"Taxi": 10}
+
+
+@pytest.mark.parametrize("damage", ["", "{", "[]", '{"offset": 5}',
+                                    '{"offset": "x", "totals": 1, "daily": {}, "inode": 0, "marker": ""}'])
+def test_damaged_checkpoint_is_rebuilt(ledger, damage):
+    ledger.add("Food", 10, T)
+    ledger.add("Rent", 100, T)
+    ledger.totals()
+    with open(ledger.checkpoint_file, "w") as f:
+        f.write(damage)
+    assert ledger.totals() == {"Food": 10, "Rent": 100}
+    with open(ledger.checkpoint_file) as f:
+        assert json.load(f)["offset"] == os.path.getsize(ledger.file_name)
+
+
+def _add_many(file_name, category, count):
+    ledger = ExpenseLedger(file_name)
+    for _ in range(count):
+        ledger.add(category, 1, T)
+        if _ % 25 == 0:
+            ledger.totals()  # checkpoint updates race with the appends too
+
+
+def test_concurrent_adds_lose_nothing(ledger):
+    workers = [multiprocessing.Process(target=_add_many, args=(ledger.file_name, f"c{i}", 200))
+               for i in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert ledger.totals() == {f"c{i}": 200 for i in range(4)}
+
+
+def test_bad_input(ledger):
+    for category in ["", "a,b", "a\nb"]:
+        with pytest.raises(ValueError):
+            ledger.add(category, 1)
+    with pytest.raises(ValueError):
+        ledger.add("Food", "lots")
+
+
+def test_totals_do_not_touch_the_daily_buckets(ledger):
+    ledger.add("Food", 10, T)
+    ledger.totals()
+    assert not os.path.exists(ledger.daily_file)
+    day = expense_ledger.day_of(T)
+    ledger.add("Food", 1, T + 86_400)
+    assert ledger.daily_totals() == {"Food": {day: 10, day + 1: 1}}
+    assert ledger.totals() == {"Food": 11}
+
+
+def test_nothing_is_rewritten_without_new_lines(ledger, monkeypatch):
+    ledger.add("Food", 10, T)
+    ledger.totals()
+    ledger.daily_totals()
+    writes = []
+    monkeypatch.setattr(expense_ledger.ExpenseLedger, "_write_sidecar",
+                        lambda self, sidecar, *args: writes.append(sidecar))
+    assert ledger.totals() == {"Food": 10}
+    ledger.daily_totals()
+    assert writes == []
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+import expense_summarize
+from expense_ledger import parse_line
+
+
+def serial_totals(texts):
+    totals = {}
+    for text in texts:
+        for line in text.splitlines():
+            if line.strip():
+                category, amount, _ = parse_line(line)
+                totals[category] = totals.get(category, 0) + amount
+    return totals
+
+
+def assert_same(result, expected):
+    assert result.keys() == expected.keys()
+    for category, total in expected.items():
+        assert result[category] == pytest.approx(total)
+
+
+def test_lines_of_one_width_put_boundaries_on_line_starts(tmp_path):
+    line = "Food,10.5,1700000000\n"  # 21 bytes
+    path = tmp_path / "even.txt"
+    path.write_text(line * 100)
+    tasks = expense_summarize.split_ranges(str(path), 3 * len(line))
+    assert all(start % len(line) == 0 for _, start, _ in tasks)
+    assert tasks[0][1] == 0 and tasks[-1][2] == len(line) * 100
+    assert sum(sum(expense_summarize.summarize_range(task).values()) for task in tasks) == \
+        pytest.approx(1050)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_many_files_and_small_chunks_match_one_pass(tmp_path, workers):
+    categories = ["Food", "Rent", "Taxi", "Fun"]
+    texts = ["".join(f"{random.choice(categories)},{random.randint(1, 9999) / 100},1700000000\n"
+                     for _ in range(400)),
+             "",                                      # an empty file
+             "Food,3\nRent,4\n\nFood,5",              # old lines, a blank, no final newline
+             "Taxi,7,1700000000\n" * 3]
+    files = []
+    for i, text in enumerate(texts):
+        path = tmp_path / f"branch{i}.txt"
+        path.write_text(text)
+        files.append(str(path))
+    for chunk_size in (1, 7, 18, 100, 10_000):
+        result = expense_summarize.summarize(files, workers=workers, chunk_size=chunk_size)
+        assert_same(result, serial_totals(texts))
+
+
+def test_main_reports_missing_files(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        expense_summarize.main([str(tmp_path / "missing.txt")])
+    assert "not found" in capsys.readouterr().out
@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+from log_reader import LogReader
+
+LINES = [f"line {i} " + "x" * (i % 7) for i in range(50)]
+
+
+def write(path, text):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+@pytest.fixture(params=[3, 16, 64 * 1024])  # blocks smaller than a line, and bigger
+def reader(tmp_path, request):
+    path = str(tmp_path / "log.txt")
+    write(path, "\n".join(LINES) + "\n")
+    return LogReader(path, block_size=request.param)
+
+
+def test_tail_and_backward(reader):
+    assert reader.tail(3) == LINES[-3:]
+    assert reader.tail(0) == []
+    assert reader.tail(500) == LINES
+    assert list(reader.iter_backward()) == LINES[::-1]
+
+
+def test_page_backward_to_the_start(reader):
+    pages = []
+    offset = None
+    while offset != 0:
+        page, offset = reader.page_before(offset, 7)
+        pages.append(page)
+    assert [line for page in reversed(pages) for line in page] == LINES
+    assert reader.page_before(0, 7) == ([], 0)
+
+
+def test_page_forward_to_the_end(reader):
+    lines, offset = [], 0
+    while True:
+        page, offset = reader.page_after(offset, 6)
+        if not page:
+            break
+        lines.extend(page)
+    assert lines == LINES and offset == reader.size()
+
+
+def test_missing_trailing_newline(tmp_path):
+    path = str(tmp_path / "log.txt")
+    write(path, "one\ntwo\nthree")
+    reader = LogReader(path, block_size=2)
+    assert reader.tail(2) == ["two", "three"]
+    assert reader.page_after(4, 5) == (["two", "three"], 13)
+    assert reader.count() == 3 == len(list(reader.iter_backward()))
+    with open(path, "a") as f:
+        f.write(" and four\n")
+    assert reader.count() == 3
+    assert reader.tail(1) == ["three and four"]
+
+
+def test_empty_and_blank_lines(tmp_path):
+    path = str(tmp_path / "log.txt")
+    write(path, "")
+    reader = LogReader(path)
+    assert reader.tail(5) == [] and reader.count() == 0 and reader.page_before(None, 3) == ([], 0)
+    write(path, "\n\nx\n")
+    assert reader.tail(5) == ["", "", "x"] and reader.count() == 3
+
+
+def test_count_only_scans_new_bytes(reader, monkeypatch):
+    assert reader.count() == 50
+    with open(reader.file_name, "a") as f:
+        f.write("more\n")
+    real_open = open
+    reads = []
+
+    def spy(name, mode="r", *args, **kwargs):
+        f = real_open(name, mode, *args, **kwargs)
+        if name == reader.file_name and "b" in mode:
+            original_seek = f.seek
+            f.seek = lambda offset, *a: reads.append(offset) or original_seek(offset, *a)
+        return f
+    monkeypatch.setattr("builtins.open", spy)
+    assert reader.count() == 51
+    assert min(reads) > 0  # never went back to the start
+
+
+@pytest.mark.parametrize("how", ["replace", "in place"])
+def test_rewritten_file_of_the_same_size_is_recounted(reader, how):
+    assert reader.count() == 50
+    size = reader.size()
+    text = ("y" * 9 + "\n") * (size // 10) + "z" * (size % 10)
+    assert len(text) == size
+    if how == "replace":
+        temp = reader.file_name + ".new"
+        write(temp, text)
+        os.replace(temp, reader.file_name)
+    else:
+        with open(reader.file_name, "r+", newline="") as f:
+            f.write(text)
+    assert reader.count() == size // 10 + (1 if size % 10 else 0)
+
+
+def test_shorter_file_and_damaged_index_are_recounted(reader):
+    assert reader.count() == 50
+    write(reader.file_name, "a\nb\n")
+    assert reader.count() == 2
+    write(reader.index_file, "{not json")
+    assert reader.count() == 2
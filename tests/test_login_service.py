@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from credential_store import CredentialStore
+from login_service import LoginService, run_load_test
+
+
+@pytest.fixture
+def service(tmp_path):
+    store = CredentialStore(str(tmp_path / "users.db"), iterations=1_000)
+    store.register("alice", "secret")
+    service = LoginService(store, workers=1)
+    yield service
+    service.close()
+    store.close()
+
+
+async def _attempts(service, password, count):
+    return await asyncio.gather(*(service.login("alice", password) for _ in range(count)),
+                                return_exceptions=True)
+
+
+def test_concurrent_valid_logins_are_not_locked_out(service):
+    results = asyncio.run(_attempts(service, "secret", 10))
+    assert results == [True] * 10
+    assert service.attempts_left("alice") == 3
+
+
+def test_concurrent_guesses_stop_at_the_limit(service):
+    results = asyncio.run(_attempts(service, "wrong", 10))
+    assert results[:3] == [False] * 3
+    assert all(isinstance(r, PermissionError) for r in results[3:])
+    assert service.attempts_left("alice") == 0
+
+
+def test_success_resets_the_counter(service):
+    assert asyncio.run(service.login("alice", "wrong")) is False
+    assert service.attempts_left("alice") == 2
+    assert asyncio.run(service.login("alice", "secret")) is True
+    assert service.attempts_left("alice") == 3
+
+
+def test_load_test_with_fewer_users_than_concurrency(tmp_path, capsys):
+    run_load_test(users=2, requests=20, concurrency=8, workers=1, iterations=1_000,
+                  db_file=str(tmp_path / "bench.db"))
+    assert "20 logins" in capsys.readouterr().out
+    with pytest.raises(ValueError):
+        run_load_test(users=0, db_file=str(tmp_path / "bench.db"))
@@ -0,0 +1,53 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+from append_writer import get_writer
+from message_board import MessageBoard
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def test_messages_from_follows_other_appenders(tmp_path):
+    name = str(tmp_path / "messages.txt")
+    board = MessageBoard(name)
+    other = MessageBoard(name)
+
+    async def post_all():
+        await board.post("bob", "hi from bob")
+        get_writer(name).write("carol: appended like Day7 save_message\n")
+        await other.post("carol", "second board")
+        await board.post("bob", "bob again")
+
+    asyncio.run(post_all())
+    with open(name, "a") as f:  # another process appending directly
+        f.write("dave: direct write\n")
+
+    assert board.messages_from("bob") == ["hi from bob", "bob again"]
+    assert board.messages_from("carol") == ["appended like Day7 save_message", "second board"]
+    assert other.messages_from("bob", limit=1) == ["bob again"]
+    assert board.messages_from("dave") == ["direct write"]
+    assert sorted(MessageBoard(name).senders()) == ["bob", "carol", "dave"]
+
+
+def test_subscribers_get_every_post(tmp_path):
+    board = MessageBoard(str(tmp_path / "messages.txt"))
+
+    async def run():
+        subscription = board.subscribe()
+        await board.post("alice", "one")
+        await board.post("alice", "two")
+        return [(await subscription.get())[1] for _ in range(2)]
+
+    assert asyncio.run(run()) == ["one", "two"]
+
+
+def test_posts_survive_exit_without_close(tmp_path):
+    script = ("import asyncio, sys\n"
+              f"sys.path.insert(0, {ROOT!r})\n"
+              "from message_board import MessageBoard\n"
+              "asyncio.run(MessageBoard('messages.txt').post('alice', 'hello'))\n"
+              "sys.exit(0)\n")
+    subprocess.run([sys.executable, "-c", script], cwd=tmp_path, check=True)
+    assert (tmp_path / "messages.txt").read_text() == "alice: hello\n"
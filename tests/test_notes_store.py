@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+from notes_store import NotesStore
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def test_ids_stay_stable_across_edits_deletes_and_reloads(tmp_path):
+    name = str(tmp_path / "notes.txt")
+    store = NotesStore(name)
+    first = store.add("learn python file handling")
+    second = store.add("buy milk")
+    store.edit(first, "learn python exception handling")
+    store.delete(second)
+    store.close()
+
+    reloaded = NotesStore(name)
+    assert list(reloaded.notes()) == [(first, "learn python exception handling")]
+    assert reloaded.add("new note") == 3  # ids are never reused
+    assert reloaded.search('python "exception handling"') == [(first, "learn python exception handling")]
+    assert reloaded.search('"handling exception"') == []
+    reloaded.compact()
+    assert NotesStore(name).get(first) == "learn python exception handling"
+
+
+def test_notes_survive_exit_without_close(tmp_path):
+    script = ("import sys\n"
+              f"sys.path[:0] = [{ROOT!r}, {os.path.join(ROOT, 'Day_17')!r}]\n"
+              "from notes_store import NotesStore\n"
+              "NotesStore('notes.txt').add('remember the milk')\n"
+              "sys.exit(0)\n")
+    subprocess.run([sys.executable, "-c", script], cwd=tmp_path, check=True)
+    assert (tmp_path / "notes.txt").read_text() == "1\tremember the milk\n"
+
+
+def test_second_store_sees_buffered_notes_of_the_first(tmp_path):
+    name = str(tmp_path / "notes.txt")
+    first = NotesStore(name)
+    hello = first.add("hello")
+    second = NotesStore(name)  # same program, same shared writer
+    world = second.add("world")
+    assert hello != world
+    second.flush()
+    assert list(NotesStore(name).notes()) == [(hello, "hello"), (world, "world")]
@@ -0,0 +1,60 @@
+import pytest
+
+import payroll
+from day_18 import Developer, Employee, Manager
+from payroll import PayrollTable
+
+
+@pytest.fixture(params=["numpy", "python"])
+def table(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(payroll, "np", None)
+    table = PayrollTable()
+    table.extend([Manager("Alice", "M101", 9000, "IT"), Manager("Eve", "M102", 8000, "HR"),
+                  Developer("Bob", "D202", 7000, "Python"), Developer("Dan", "D203", 6000, "Go"),
+                  Employee("Cara", "E303", 4000)])
+    return table
+
+
+def test_totals_match_the_objects(table):
+    people = list(table)
+    assert table.total_yearly() == sum(p.yearly_salary() for p in people) == 408_000
+    assert table.total_yearly(role="developer") == 156_000
+    assert table.total_yearly(role="manager", department="IT") == 108_000
+    assert table.total_yearly(department="Sales") == 0
+    assert table.yearly_by_department() == {"IT": 108_000, "HR": 96_000}
+    assert table.yearly_by_language() == {"Python": 84_000, "Go": 72_000}
+    assert table.yearly_by_role() == {"employee": 48_000, "manager": 204_000, "developer": 156_000}
+
+
+def test_raise_updates_rows_and_versions(table):
+    before = table.version
+    assert table.give_raise(10, role="developer", programming_language="Python") == 1
+    bob = table.get("D202")
+    assert bob.salary == pytest.approx(7700)
+    assert table.row_version(table.row_of("D202")) == 1
+    assert table.row_version(table.row_of("D203")) == 0
+    assert table.version == before + 1
+    assert table.give_raise(10, department="Nowhere") == 0 and table.version == before + 1
+
+
+def test_views_write_through(table):
+    eve = table.get("M102")
+    assert isinstance(eve, Manager) and eve.info_lines()[-1] == "Department: HR"
+    eve.department = "Sales"
+    eve.salary = 8500
+    again = table.get("M102")
+    assert (again.department, again.salary, again.row_version) == ("Sales", 8500, 2)
+    assert table.record(table.row_of("M102")) == ("Eve", "M102", 8500, "manager", "Sales", None)
+    assert table.yearly_by_department()["Sales"] == 102_000
+
+
+def test_errors(table):
+    with pytest.raises(ValueError):
+        table.add("Copy", "M101", 1)
+    with pytest.raises(ValueError):
+        table.add("Intern", "I1", 1, role="intern")
+    with pytest.raises(KeyError):
+        table.get("X999")
@@ -0,0 +1,79 @@
+import bisect
+import pickle
+import random
+
+import pytest
+
+from quantile_sketch import KLLSketch, TopK
+
+FRACTIONS = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+MAX_RANK_ERROR = 0.02  # k=200 is usually well under 1%
+
+
+def rank_errors(sketch, ordered):
+    answers = sketch.quantiles(FRACTIONS)
+    return [abs(bisect.bisect_right(ordered, a) / len(ordered) - q)
+            for q, a in zip(FRACTIONS, answers)]
+
+
+@pytest.fixture(scope="module")
+def numbers():
+    rng = random.Random(1)
+    return [rng.gauss(0, 1) for _ in range(300_000)]
+
+
+def test_exact_while_everything_fits():
+    sketch = KLLSketch().update([5.0, 1.0, 3.0, 2.0, 4.0])
+    assert sketch.median() == 3.0
+    assert sketch.quantiles([0, 1]) == [1.0, 5.0]
+    assert sketch.rank(2.0) == 0.4
+
+
+def test_rank_error_is_bounded(numbers):
+    sketch = KLLSketch(seed=7).update(numbers)
+    assert sketch.count == len(numbers)
+    assert sketch._size < 10_000 + 65_536  # bounded, not the whole stream
+    assert max(rank_errors(sketch, sorted(numbers))) < MAX_RANK_ERROR
+
+
+def test_one_value_at_a_time(numbers):
+    sketch = KLLSketch(seed=7)
+    for x in numbers[:20_000]:
+        sketch.add(x)
+    assert max(rank_errors(sketch, sorted(numbers[:20_000]))) < MAX_RANK_ERROR
+
+
+def test_merge_is_as_accurate_as_one_sketch(numbers):
+    merged = KLLSketch(seed=1)
+    for i in range(0, len(numbers), 50_000):
+        merged.merge(KLLSketch(seed=i).update(numbers[i:i + 50_000]))
+    assert merged.count == len(numbers)
+    assert (merged.minimum, merged.maximum) == (min(numbers), max(numbers))
+    assert max(rank_errors(merged, sorted(numbers))) < MAX_RANK_ERROR
+
+
+def test_survives_pickling(numbers):
+    sketch = KLLSketch(seed=3).update(numbers[:100_000])
+    copy = pickle.loads(pickle.dumps(sketch))
+    assert copy.quantiles(FRACTIONS) == sketch.quantiles(FRACTIONS)
+    copy.update(numbers[100_000:])  # still usable after the round trip
+    assert max(rank_errors(copy, sorted(numbers))) < MAX_RANK_ERROR
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        KLLSketch(k=4)
+    with pytest.raises(ValueError):
+        KLLSketch().quantile(0.5)
+    with pytest.raises(ValueError):
+        KLLSketch().update([1.0]).quantile(1.5)
+
+
+def test_top_k_is_exact_and_mergeable(numbers):
+    largest = TopK(10).update(numbers)
+    smallest = TopK(10, largest=False).update(numbers)
+    ordered = sorted(numbers)
+    assert largest.values() == ordered[-10:][::-1]
+    assert smallest.values() == ordered[:10]
+    halves = TopK(10).update(numbers[:1000]).merge(TopK(10).update(numbers[1000:]))
+    assert halves.values() == largest.values()
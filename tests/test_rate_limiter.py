@@ -0,0 +1,101 @@
+from credential_store import CredentialStore
+from login_service import LoginService
+from rate_limiter import LockoutTracker, SlidingWindowLimiter, TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lockout_after_max_failures():
+    tracker = LockoutTracker(max_failures=3)
+    assert [tracker.record_failure("alice") for _ in range(3)] == [2, 1, 0]
+    assert tracker.is_locked("alice")
+    assert not tracker.is_locked("bob")
+    tracker.reset("alice")
+    assert tracker.attempts_left("alice") == 3
+
+
+def test_lockout_expires_with_the_window():
+    clock = FakeClock()
+    tracker = LockoutTracker(max_failures=2, window=60, clock=clock)
+    tracker.record_failure("alice")
+    tracker.record_failure("alice")
+    assert tracker.is_locked("alice")
+    clock.now += 121  # two full windows later
+    assert tracker.attempts_left("alice") == 2
+
+
+def test_file_state_is_shared_between_trackers(tmp_path):
+    name = str(tmp_path / "lockouts.db")
+    first = LockoutTracker(max_failures=3, filename=name)
+    second = LockoutTracker(max_failures=3, filename=name)
+    first.record_failure("alice")
+    assert second.record_failure("alice") == 1  # sees the first failure
+    assert first.record_failure("alice") == 0
+    assert second.is_locked("alice") and len(second) == 1
+    second.reset("alice")
+    assert first.attempts_left("alice") == 3 and len(first) == 0
+    first.close()
+    second.close()
+    reopened = LockoutTracker(max_failures=3, filename=name)
+    assert reopened.attempts_left("alice") == 3
+    reopened.close()
+
+
+def test_idle_keys_are_dropped_from_the_file(tmp_path):
+    clock = FakeClock()
+    tracker = LockoutTracker(max_failures=3, window=60, filename=str(tmp_path / "l.db"), clock=clock)
+    tracker.record_failure("old")
+    clock.now += 500
+    tracker.record_failure("new")
+    assert len(tracker) == 1
+    tracker.close()
+
+
+def test_empty_shared_tracker_is_used_by_the_service(tmp_path):
+    store = CredentialStore(str(tmp_path / "users.db"), iterations=1_000)
+    shared = LockoutTracker(max_failures=3)
+    service = LoginService(store, workers=1, lockouts=shared)
+    assert service.lockouts is shared
+    service.close()
+    store.close()
+
+
+def test_token_bucket_and_sliding_window():
+    clock = FakeClock()
+    bucket = TokenBucketLimiter(rate=1.0, capacity=2, clock=clock)
+    assert [bucket.allow("k") for _ in range(3)] == [True, True, False]
+    clock.now += 1
+    assert bucket.allow("k")
+
+    window = SlidingWindowLimiter(limit=2, window=10, clock=clock)
+    assert [window.allow("k") for _ in range(3)] == [True, True, False]
+    clock.now += 25
+    assert window.allow("k")
+
+
+def test_reads_do_not_keep_idle_keys_alive():
+    clock = FakeClock()
+    window = SlidingWindowLimiter(limit=5, window=10, ttl=20, clock=clock)
+    window.hit("a")
+    clock.now += 5
+    window.hit("b")
+    clock.now += 1
+    window.count("a")  # a read: "a" is still idle since its hit
+    clock.now += 18
+    assert window.evict_idle() == 1
+    assert window.get_state("a") is None and window.get_state("b") is not None
+
+
+def test_shared_tracker_keeps_no_keys_in_memory(tmp_path):
+    tracker = LockoutTracker(filename=str(tmp_path / "lockouts.db"))
+    for i in range(50):
+        assert tracker.record_failure(f"user{i}") == 2
+    assert tracker.attempts_left("user0") == 2
+    assert len(tracker._failures) == 0 and len(tracker) == 50
+    tracker.close()
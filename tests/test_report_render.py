@@ -0,0 +1,70 @@
+import io
+import json
+
+import pytest
+
+import report_render
+from day_18 import Developer, Employee, Manager
+from payroll import PayrollTable
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    # Count how often a row is actually built (a cache miss)
+    calls = []
+    original = report_render._render
+
+    def counting(employee, fmt):
+        calls.append(employee.emp_id)
+        return original(employee, fmt)
+    monkeypatch.setattr(report_render, "_render", counting)
+    return calls
+
+
+def people():
+    return [Manager("Alice", "M101", 9000, "IT"), Developer("Bob", "D202", 7000, "Python"),
+            Employee("Cara", "E303", 4000)]
+
+
+def report(employees, fmt="text"):
+    out = io.StringIO()
+    report_render.render(employees, out, fmt)
+    return out.getvalue()
+
+
+def test_objects_are_rerendered_after_a_change(renders):
+    staff = people()
+    first = report(staff)
+    assert report(staff) == first and len(renders) == 3
+    staff[0].salary = 9500
+    assert "$9500" in report(staff)
+    assert renders == ["M101", "D202", "E303", "M101"]
+
+
+def test_payroll_table_reports_hit_the_cache(renders):
+    table = PayrollTable()
+    table.extend(people())
+    first = report(table)
+    assert report(table) == first and len(renders) == 3  # new views, same rows
+
+    table.get("D202").programming_language = "Go"
+    assert "Go" in report(table) and renders[3:] == ["D202"]
+    table.give_raise(50, role="manager")
+    assert "$13500.0" in report(table) and renders[4:] == ["M101"]
+
+
+def test_formats_agree(renders):
+    staff = people()
+    for person in staff:
+        person.salary = float(person.salary)  # the table stores floats
+    table = PayrollTable()
+    table.extend(staff)
+    for fmt in report_render.FORMATS:
+        assert report(staff, fmt) == report(table, fmt)
+    records = [json.loads(line) for line in report(staff, "jsonl").splitlines()]
+    assert records[1] == {"role": "developer", "emp_id": "D202", "name": "Bob",
+                          "salary": 7000, "programming_language": "Python"}
+    assert report([Employee('Smith, "J"', "E1", 1)], "csv").splitlines()[1] == \
+        'employee,E1,"Smith, ""J""",1,,'
+    with pytest.raises(ValueError):
+        report(staff, "xml")
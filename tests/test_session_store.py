@@ -0,0 +1,81 @@
+import pytest
+
+from session_store import SessionStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def sessions(clock):
+    return SessionStore(secret=b"k" * 32, ttl=60, max_sessions=3, clock=clock)
+
+
+def test_issue_and_validate(sessions):
+    token = sessions.issue("álice")
+    assert sessions.validate(token) == "álice"
+    assert SessionStore(secret=b"other" * 8).validate(token) is None  # different key
+
+
+def test_tokens_expire(sessions, clock):
+    token = sessions.issue("alice")
+    clock.now += 59
+    assert sessions.validate(token) == "alice"
+    clock.now += 1
+    assert sessions.validate(token) is None
+    assert len(sessions) == 0
+
+
+def test_revoke(sessions):
+    token = sessions.issue("alice")
+    other = sessions.issue("bob")
+    sessions.revoke(token)
+    sessions.revoke("not a token")
+    assert sessions.validate(token) is None
+    assert sessions.validate(other) == "bob"
+
+
+def test_least_recently_used_session_is_evicted(sessions):
+    tokens = [sessions.issue(name) for name in ("a", "b", "c")]
+    assert sessions.validate(tokens[0]) == "a"  # "b" is now the oldest
+    sessions.issue("d")
+    assert len(sessions) == 3
+    assert [sessions.validate(t) for t in tokens] == ["a", None, "c"]
+
+
+def test_expired_sessions_are_dropped_on_issue(sessions, clock):
+    sessions.issue("a")
+    sessions.issue("b")
+    clock.now += 61
+    sessions.issue("c")
+    assert len(sessions) == 1
+
+
+@pytest.mark.parametrize("bad", [
+    "", "a.b.c", "a.1.x.y.z", "a.soon.x.y", "é.1.x.y", "a.1.x.é", "a.1.é.y", "\x00.1.x.y",
+])
+def test_malformed_tokens_are_rejected(sessions, bad):
+    assert sessions.validate(bad) is None
+
+
+def test_tampered_tokens_are_rejected(sessions):
+    token = sessions.issue("alice")
+    user, expiry, session_id, signature = token.split(".")
+    forged = [
+        f"{user}.{int(expiry) + 3600}.{session_id}.{signature}",  # longer expiry
+        f"Ym9i.{expiry}.{session_id}.{signature}",                 # another user
+        f"{user}.{expiry}.{session_id}.{signature[:-1]}{'B' if signature[-1] == 'A' else 'A'}",
+        f"{user}.+{expiry}.{session_id}.{signature}",
+    ]
+    for token in forged:
+        assert sessions.validate(token) is None
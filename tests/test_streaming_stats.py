@@ -0,0 +1,56 @@
+import math
+import random
+import statistics
+
+import day5_list_analysis
+import streaming_stats
+from streaming_stats import RunningStats, read_numbers
+
+
+def test_matches_statistics_across_blocks(monkeypatch):
+    monkeypatch.setattr(streaming_stats, "BLOCK", 100)
+    numbers = [random.gauss(50, 10) for _ in range(1_050)]
+    stats = RunningStats(numbers)
+    assert stats.count == len(numbers)
+    assert math.isclose(stats.total, sum(numbers))
+    assert math.isclose(stats.mean, statistics.fmean(numbers))
+    assert math.isclose(stats.variance, statistics.pvariance(numbers))
+    assert math.isclose(stats.sample_variance, statistics.variance(numbers))
+    assert (stats.minimum, stats.maximum) == (min(numbers), max(numbers))
+
+
+def test_merge_equals_single_pass():
+    numbers = [random.uniform(-1e6, 1e6) for _ in range(5_000)]
+    merged = RunningStats(numbers[:1234]).merge(RunningStats(numbers[1234:]))
+    merged.merge(RunningStats())
+    whole = RunningStats(numbers)
+    assert merged.count == whole.count
+    assert math.isclose(merged.mean, whole.mean)
+    assert math.isclose(merged.variance, whole.variance)
+    assert (merged.minimum, merged.maximum) == (whole.minimum, whole.maximum)
+
+
+def test_add_one_at_a_time():
+    stats = RunningStats()
+    for x in [2, 4, 4, 4, 5, 5, 7, 9]:
+        stats.add(x)
+    assert stats.mean == 5 and stats.variance == 4 and stats.stdev == 2
+
+
+def test_read_numbers_text_and_binary(tmp_path):
+    from array import array
+    text = tmp_path / "numbers.txt"
+    text.write_text("1, 2 3\n4.5\n")
+    assert list(read_numbers(str(text))) == [1, 2, 3, 4.5]
+    binary = tmp_path / "numbers.bin"
+    binary.write_bytes(array("d", [1.5, -2.0]).tobytes())
+    assert list(read_numbers(str(binary))) == [1.5, -2.0]
+
+
+def test_analyze_numbers_accepts_a_generator(capsys):
+    day5_list_analysis.analyze_numbers(x for x in [3.0, 1.0, 2.0])
+    out = capsys.readouterr().out
+    assert "Numbers: [3.0, 1.0, 2.0]" in out
+    assert "Median: 2.0" in out
+    assert "Ascending: [1.0, 2.0, 3.0]" in out
+    assert "Descending: [3.0, 2.0, 1.0]" in out
@@ -0,0 +1,37 @@
+from collections import Counter
+
+from text_utils import count_word, count_words, dedupe, top_k, word_frequencies, words
+
+
+def day11_count(sentence, word):
+    count = 0
+    for w in sentence.split():
+        if w.lower() == word.lower():
+            count += 1
+    return count
+
+
+def test_count_word_matches_the_day11_loop():
+    for sentence in ["I love python because python is easy",
+                     "Python, python! PYTHON python's  python\tpython\n",
+                     "Straße STRASSE strasse", ""]:
+        for word in ["python", "Python,", "strasse", "Straße"]:
+            assert count_word(sentence, word) == day11_count(sentence, word)
+
+
+def test_words_drop_punctuation_but_keep_apostrophes():
+    assert words("Don't STOP, don't stop!") == ["don't", "stop", "don't", "stop"]
+    assert count_words("a b, a.") == Counter({"a": 2, "b": 1})
+
+
+def test_dedupe_keeps_first_seen_order():
+    assert dedupe([3, 1, 3, 2, 1]) == [3, 1, 2]
+    assert dedupe(["a", "B", "b", "A"], key=str.lower) == ["a", "B"]
+
+
+def test_word_frequencies_never_split_a_word(tmp_path):
+    path = tmp_path / "text.txt"
+    text = "alpha beta\ngamma alpha " * 500
+    path.write_text(text)
+    assert word_frequencies(str(path), block_chars=7) == count_words(text)
+    assert top_k(word_frequencies(str(path)), 1) == [("alpha", 1000)]
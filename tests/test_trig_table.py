@@ -0,0 +1,28 @@
+import math
+import random
+
+import pytest
+
+import trig_table
+
+
+def test_special_angles_are_exact():
+    assert trig_table.sine(30) == 0.5
+    assert trig_table.sine(-150) == -0.5
+    assert trig_table.sine(180) == 0.0
+    assert trig_table.cosine(90) == 0.0
+    assert trig_table.cosine(720) == 1.0
+    assert trig_table.tangent(45) == 1.0
+
+
+def test_interpolation_stays_within_the_bound():
+    angles = [random.uniform(-1000, 1000) for _ in range(10_000)]
+    worst = max(abs(trig_table.sine(d) - math.sin(math.radians(d))) for d in angles)
+    assert worst <= trig_table.ERROR_BOUND * 1.01
+    assert trig_table.cosine_many(angles[:10]) == [trig_table.cosine(d) for d in angles[:10]]
+
+
+def test_tangent_undefined_where_cosine_is_zero():
+    for angle in (90, 270, -90, 90.0):
+        with pytest.raises(ValueError):
+            trig_table.tangent(angle)
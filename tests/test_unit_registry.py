@@ -0,0 +1,45 @@
+import pytest
+
+import day10_converter
+from unit_registry import TEMPERATURE, UnitRegistry, convert, convert_many
+
+
+def test_matches_the_day10_converter():
+    for value in [-40.0, 0.0, 36.6, 100.0]:
+        assert convert(value, "celsius", "fahrenheit") == pytest.approx(day10_converter.celsius_to_fahrenheit(value))
+        assert convert(value, "fahrenheit", "celsius") == pytest.approx(day10_converter.fahrenheit_to_celsius(value))
+        assert convert(value, "celsius", "kelvin") == pytest.approx(day10_converter.celsius_to_kelvin(value))
+        assert convert(value, "kelvin", "fahrenheit") == pytest.approx(day10_converter.kelvin_to_fahrenheit(value))
+
+
+def test_exact_reference_points():
+    assert convert(100, "C", "F") == 212
+    assert convert(32, "°F", "c") == 0
+    assert convert(0, "celsius", "kelvin") == 273.15
+    assert convert(491.67, "R", "C") == pytest.approx(0, abs=1e-12)
+    assert convert_many([0, 100], "C", "F") == [32, 212]
+
+
+def test_transforms_are_cached_until_a_new_unit():
+    registry = UnitRegistry("metre", aliases=["m"])
+    registry.register("foot", "0.3048", aliases=["ft"])
+    first = registry.transform("ft", "m")
+    assert registry.transform("ft", "m") is first
+    registry.register("inch", "0.0254")
+    assert registry.transform("ft", "m") is not first
+    assert registry.convert(1, "foot", "inch") == pytest.approx(12)
+
+
+def test_bad_units():
+    with pytest.raises(ValueError):
+        convert(1, "celsius", "parsec")
+    with pytest.raises(ValueError):
+        TEMPERATURE.register("Kelvin", 1)
+    with pytest.raises(ValueError):
+        UnitRegistry("metre").register("nothing", 0)
+
+
+def test_many_keeps_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    values = TEMPERATURE.transform("C", "F").many(np.array([0.0, 100.0]))
+    assert isinstance(values, np.ndarray) and values.tolist() == [32.0, 212.0]
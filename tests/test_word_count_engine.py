@@ -0,0 +1,39 @@
+import random
+
+import word_count_engine
+from text_utils import count_words
+
+
+def write_corpus(tmp_path, count=3):
+    vocabulary = ["Python", "python,", "error!", "Timeout", "don't", "a", "b-c"]
+    files, text = [], ""
+    for i in range(count):
+        part = "\n".join(" ".join(random.choices(vocabulary, k=9)) for _ in range(300)) + "\n"
+        path = tmp_path / f"part{i}.txt"
+        path.write_text(part)
+        files.append(str(path))
+        text += part
+    return files, text
+
+
+def test_ranges_cover_the_file_and_end_on_whitespace(tmp_path):
+    (path,), text = write_corpus(tmp_path, 1)
+    ranges = word_count_engine.split_ranges(path, 500)
+    assert len(ranges) > 5
+    assert ranges[0][1] == 0 and ranges[-1][2] == len(text.encode())
+    for (_, _, end), (_, start, _) in zip(ranges, ranges[1:]):
+        assert end == start and text[end - 1].isspace()
+
+
+def test_map_reduce_equals_one_pass(tmp_path, monkeypatch):
+    monkeypatch.setattr(word_count_engine, "BLOCK_BYTES", 64)  # many blocks per range
+    files, text = write_corpus(tmp_path)
+    result = word_count_engine.count_corpus(files, workers=1, chunk_size=1000)
+    assert result.counts == count_words(text)
+    assert result.bytes_read == len(text.encode())
+
+
+def test_target_words_with_workers(tmp_path):
+    files, text = write_corpus(tmp_path)
+    result = word_count_engine.count_corpus(files, ["PYTHON", "missing"], workers=2, chunk_size=2000)
+    assert result.counts == {"python": count_words(text)["python"], "missing": 0}